@@ -1,7 +1,9 @@
 'use client';
 
-import { useState, useEffect, useRef } from 'react';
-import { searchAWSCommands } from '@/lib/aws-search';
+import { useState, useEffect, useRef, useCallback } from 'react';
+import { findCommand } from '@/lib/aws-lookup';
+import { loadCommandParameters } from '@/lib/aws-shards';
+import { createSearchClient, type SearchClient } from '@/lib/search-client';
 
 export default function SearchBar() {
     const [query, setQuery] = useState('');
@@ -14,42 +16,83 @@ export default function SearchBar() {
     const [hoveredParamIndex, setHoveredParamIndex] = useState(-1);
     const inputRef = useRef<HTMLInputElement>(null);
     const suggestionsRef = useRef<HTMLDivElement>(null);
+    const searchClientRef = useRef<SearchClient | null>(null);
+    // "service command" whose parameters the panel shows
+    const shownCommandRef = useRef<string | null>(null);
+
+    // Search runs in a worker (in-thread without worker support, or with
+    // NEXT_PUBLIC_SEARCH_WORKER=off)
+    useEffect(() => {
+        const client = createSearchClient(process.env.NEXT_PUBLIC_SEARCH_WORKER !== 'off');
+        searchClientRef.current = client;
+        // Development: search settings and stats from the browser console
+        const devWindow = window as unknown as { searchClient?: SearchClient };
+        if (process.env.NODE_ENV === 'development') {
+            devWindow.searchClient = client;
+        }
+        return () => {
+            client.dispose();
+            searchClientRef.current = null;
+            if (devWindow.searchClient === client) {
+                delete devWindow.searchClient;
+            }
+        };
+    }, []);
+
+    const hideParameters = useCallback(() => {
+        shownCommandRef.current = null;
+        setShowParameters(false);
+        setCurrentParameters([]);
+    }, []);
 
     useEffect(() => {
         if (query.trim() === '') {
             setSuggestions([]);
-            setShowParameters(false);
-            setCurrentParameters([]);
+            hideParameters();
             return;
         }
 
-        const results = searchAWSCommands(query);
-        setSuggestions(results);
-        setSelectedIndex(-1);
+        let cancelled = false;
+
+        // undefined: a newer keystroke superseded this query
+        searchClientRef.current?.search(query).then(results => {
+            if (!cancelled && results) {
+                setSuggestions(results);
+                setSelectedIndex(-1);
+            }
+        });
 
         // Check if we have a complete command with parameters
         const parts = query.toLowerCase().trim().split(/\s+/);
         const cleanParts = parts[0] === 'aws' ? parts.slice(1) : parts;
 
-        if (cleanParts.length >= 2) {
-            // Import awsServices to check for exact matches
-            const { awsServices } = require('@/lib/aws-commands');
-            const service = awsServices.find((s: any) => s.name.toLowerCase() === cleanParts[0]);
-
-            if (service) {
-                const command = service.commands.find((c: any) => c.name.toLowerCase() === cleanParts[1]);
-
-                if (command && command.parameters) {
-                    setShowParameters(true);
-                    setCurrentParameters(command.parameters);
-                    return;
-                }
-            }
+        // Exact command: fetch its service's shard (once) for the parameters.
+        // The panel keeps showing while parameters are typed after the command,
+        // and a different command's panel stays up until the new one arrives.
+        const match = cleanParts.length >= 2 ? findCommand(cleanParts[0], cleanParts[1]) : undefined;
+        const matchedCommand = match ? `${match.service.name} ${match.command}` : null;
+        if (!match) {
+            hideParameters();
+        } else if (matchedCommand !== shownCommandRef.current) {
+            loadCommandParameters(match.service.name, match.command)
+                .then(parameters => {
+                    if (cancelled) return;
+                    if (parameters) {
+                        shownCommandRef.current = matchedCommand;
+                        setShowParameters(true);
+                        setCurrentParameters(parameters);
+                    } else {
+                        hideParameters();
+                    }
+                })
+                .catch(error => console.error(error));
         }
 
-        setShowParameters(false);
-        setCurrentParameters([]);
-    }, [query]);
+        // The query changed before the results or the shard arrived
+        return () => {
+            cancelled = true;
+        };
+    }, [query, hideParameters]);
 
     const handleKeyDown = (e: React.KeyboardEvent) => {
         if (e.key === 'ArrowDown') {
@@ -65,19 +108,15 @@ export default function SearchBar() {
             handleSuggestionClick(suggestions[selectedIndex]);
         } else if (e.key === 'Escape') {
             setSuggestions([]);
-            setShowParameters(false);
+            hideParameters();
         }
     };
 
     const handleSuggestionClick = (suggestion: any) => {
+        // The new query loads the command's parameters
         setQuery(suggestion.fullCommand || suggestion.displayText);
         setSuggestions([]);
 
-        if (suggestion.parameters && suggestion.parameters.length > 0) {
-            setShowParameters(true);
-            setCurrentParameters(suggestion.parameters);
-        }
-
         inputRef.current?.focus();
     };
 
@@ -0,0 +1,48 @@
+// Service and command lookup
+// lib/aws-manifest.json (generated by scripts/aws_data.py) lists every service
+// with its command names and the content hash of its shard. This module indexes
+// it once, by lower-cased name, so exact service and command checks in search
+// and the parameter panel are Map lookups whatever the catalog size.
+import manifestData from './aws-manifest.json';
+
+export interface ManifestService {
+  name: string;
+  description?: string;
+  hash: string;
+  commands: string[];
+}
+
+export interface Manifest {
+  // Changes whenever any service's shard does
+  version?: string;
+  services: ManifestService[];
+}
+
+export interface CommandMatch {
+  service: ManifestService;
+  command: string;
+}
+
+export const manifest: Manifest = manifestData as Manifest;
+
+export const dataVersion: string = manifest.version ?? '';
+
+// lower-cased service name -> service, and -> (lower-cased command name -> command name)
+const services = new Map<string, ManifestService>();
+const commands = new Map<string, Map<string, string>>();
+
+for (const service of manifest.services) {
+  const key = service.name.toLowerCase();
+  services.set(key, service);
+  commands.set(key, new Map(service.commands.map(command => [command.toLowerCase(), command])));
+}
+
+export function findService(name: string): ManifestService | undefined {
+  return services.get(name.toLowerCase());
+}
+
+export function findCommand(service: string, command: string): CommandMatch | undefined {
+  const key = service.toLowerCase();
+  const name = commands.get(key)?.get(command.toLowerCase());
+  return name === undefined ? undefined : { service: services.get(key)!, command: name };
+}
@@ -0,0 +1,66 @@
+// Global parameter expansion
+// aws-commands.json stores each global option (--debug, --region, --cli-input-json, ...)
+// once in globalParameters; a command's parameters list holds either a parameter or
+// the index of a global one. Commands resolve that list the first time their
+// parameters are read, so loading and indexing the data never touches them.
+import type { CommandParameter, Command, Service } from './aws-commands';
+import { decodeStringTable, isPacked, type PackedData } from './string-table';
+
+export type StoredParameter = CommandParameter | number;
+
+export interface StoredCommand {
+  name: string;
+  description?: string;
+  parameters?: StoredParameter[];
+}
+
+export interface StoredService {
+  name: string;
+  description?: string;
+  commands: StoredCommand[];
+}
+
+export interface StoredData {
+  globalParameters: CommandParameter[];
+  services: StoredService[];
+}
+
+// Any form aws-commands.json can take
+export type AwsData = Service[] | StoredData | PackedData;
+
+export function resolveParameters(parameters: StoredParameter[], globals: CommandParameter[]): CommandParameter[] {
+  return parameters.map(param => typeof param === 'number' ? globals[param] : param);
+}
+
+function lazyCommand(command: StoredCommand, globals: CommandParameter[]): Command {
+  let resolved: CommandParameter[] | undefined;
+  return {
+    name: command.name,
+    description: command.description,
+    get parameters() {
+      if (!resolved) {
+        resolved = resolveParameters(command.parameters || [], globals);
+      }
+      return resolved;
+    }
+  };
+}
+
+// Stored data -> services with lazily resolved parameters (plain arrays pass through)
+export function expandServices(data: AwsData): { services: Service[]; globalParameters: CommandParameter[] } {
+  if (Array.isArray(data)) {
+    return { services: data, globalParameters: [] };
+  }
+  if (isPacked(data)) {
+    return decodeStringTable(data);
+  }
+
+  const globals = data.globalParameters;
+  const services = data.services.map(service => ({
+    name: service.name,
+    description: service.description,
+    commands: service.commands.map(command => lazyCommand(command, globals))
+  }));
+
+  return { services, globalParameters: globals };
+}
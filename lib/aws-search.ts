@@ -1,6 +1,16 @@
 // AWS CLI command search with Fuse.js fuzzy matching
-import Fuse from 'fuse.js';
-import { awsServices, Service, Command } from './aws-commands';
+// Searches the service/command names in the manifest; parameters are loaded per
+// service with loadCommandParameters() when a command is opened. The Fuse index
+// is built ahead of time by scripts/build-search-index.js.
+import Fuse, { type FuseIndexRecords } from 'fuse.js';
+import type { Service, Command } from './aws-commands';
+import { manifest, dataVersion, findService, findCommand, type ManifestService } from './aws-lookup';
+import { loadCommandParameters } from './aws-shards';
+import searchKeys from './search-keys.json';
+import searchIndex from './aws-search-index.json';
+import { TrigramIndex, type TrigramOptions } from './trigram-search';
+import { topK } from './top-k';
+import { LruCache, type CacheStats } from './lru-cache';
 
 export interface SearchResult {
     displayText: string;
@@ -15,14 +25,13 @@ export interface SearchResult {
 function buildSearchableCommands(): SearchResult[] {
     const searchableCommands: SearchResult[] = [];
 
-    awsServices.forEach(service => {
+    manifest.services.forEach(service => {
         service.commands.forEach(command => {
             searchableCommands.push({
-                displayText: `aws ${service.name} ${command.name}`,
-                fullCommand: `aws ${service.name} ${command.name}`,
+                displayText: `aws ${service.name} ${command}`,
+                fullCommand: `aws ${service.name} ${command}`,
                 service: service.name,
-                command: command.name,
-                parameters: command.parameters
+                command
             });
         });
     });
@@ -30,23 +39,195 @@ function buildSearchableCommands(): SearchResult[] {
     return searchableCommands;
 }
 
+// Each service's commands are contiguous in the list: name -> their positions
+function buildServicePositions(): Map<string, number[]> {
+    const positions = new Map<string, number[]>();
+    let start = 0;
+
+    manifest.services.forEach(service => {
+        positions.set(service.name, service.commands.map((_, i) => start + i));
+        start += service.commands.length;
+    });
+
+    return positions;
+}
+
+// More lenient for fuzzy matching (both backends)
+const SEARCH_THRESHOLD = 0.4;
+
+// Most results shown for a query
+const RESULT_LIMIT = 100;
+
 // Configure Fuse.js for fuzzy search
 const searchableCommands = buildSearchableCommands();
+const servicePositions = buildServicePositions();
 
-const fuse = new Fuse(searchableCommands, {
-    keys: [
-        { name: 'command', weight: 0.6 },        // Prioritize command name matches most
-        { name: 'service', weight: 0.3 },        // Then service name matches
-        { name: 'displayText', weight: 0.1 }     // Finally full text matches
-    ],
-    threshold: 0.4,              // More lenient for fuzzy matching
+// The prebuilt index only fits if it was built from this manifest version;
+// otherwise (e.g. data changed without a rebuild) Fuse indexes the commands itself
+const prebuiltIndex = searchIndex as unknown as { version?: string; keys: string[]; records: FuseIndexRecords };
+const index = prebuiltIndex.version === dataVersion && prebuiltIndex.records.length === searchableCommands.length
+    ? Fuse.parseIndex<SearchResult>(prebuiltIndex)
+    : undefined;
+
+const fuseOptions = {
+    // command (0.6) first, then service (0.3), then the full text (0.1);
+    // shared with the index builder
+    keys: searchKeys,
+    threshold: SEARCH_THRESHOLD,
     distance: 100,               // Allow matches further in the string
     minMatchCharLength: 2,
     includeScore: true,
     ignoreLocation: true,        // Don't require matches at beginning
     findAllMatches: false,
-    useExtendedSearch: false
-});
+    useExtendedSearch: false,
+    // Results come back in collection order; fuzzySearch() picks the best
+    // RESULT_LIMIT with a bounded heap instead of sorting every match
+    shouldSort: false
+};
+
+const fuse = new Fuse(searchableCommands, fuseOptions, index);
+const fuseIndexJson = fuse.getIndex().toJSON();
+
+// Fuse over a subset of the commands, reusing their index records
+function fuseOver(candidates: number[], options: typeof fuseOptions): Fuse<SearchResult> {
+    const records = fuseIndexJson.records as ReadonlyArray<{ i: number }>;
+    const subsetIndex = Fuse.parseIndex<SearchResult>({
+        keys: fuseIndexJson.keys,
+        records: candidates.map((id, i) => ({ ...records[id], i })) as unknown as FuseIndexRecords
+    });
+    return new Fuse(candidates.map(id => searchableCommands[id]), options, subsetIndex);
+}
+
+// Per-service indexes for "<service> <command query>", so those queries only scan
+// the service's commands. Built on first use from the service's records of the
+// prebuilt index (no re-tokenizing). Scores don't depend on the rest of the
+// collection, so results match a full search filtered to the service.
+const serviceFuses = new Map<string, Fuse<SearchResult>>();
+
+function serviceFuse(service: ManifestService): Fuse<SearchResult> {
+    let scoped = serviceFuses.get(service.name);
+    if (!scoped) {
+        scoped = fuseOver(servicePositions.get(service.name) ?? [], fuseOptions);
+        serviceFuses.set(service.name, scoped);
+    }
+    return scoped;
+}
+
+// Search backend: Fuse.js (Bitap over every command) or the trigram index
+// (lib/trigram-search.ts). Defaults to NEXT_PUBLIC_SEARCH_ENGINE, else fuse.
+export type SearchEngine = 'fuse' | 'trigram';
+
+let engine: SearchEngine = process.env.NEXT_PUBLIC_SEARCH_ENGINE === 'trigram' ? 'trigram' : 'fuse';
+let trigramIndex: TrigramIndex<SearchResult> | undefined;
+const serviceTrigramIndexes = new Map<string, TrigramIndex<SearchResult>>();
+
+const trigramOptions: TrigramOptions = {
+    keys: searchKeys,
+    threshold: SEARCH_THRESHOLD,
+    indexKey: 'displayText'
+};
+
+export function getSearchEngine(): SearchEngine {
+    return engine;
+}
+
+export function setSearchEngine(next: SearchEngine): void {
+    if (next !== engine) {
+        // Cached results came from the other backend
+        resultCache.clear();
+    }
+    engine = next;
+}
+
+// Built on first use, so the Fuse path doesn't pay for it
+function getTrigramIndex(): TrigramIndex<SearchResult> {
+    if (!trigramIndex) {
+        trigramIndex = new TrigramIndex(searchableCommands, trigramOptions);
+    }
+    return trigramIndex;
+}
+
+function serviceTrigramIndex(service: ManifestService): TrigramIndex<SearchResult> {
+    let scoped = serviceTrigramIndexes.get(service.name);
+    if (!scoped) {
+        const positions = servicePositions.get(service.name) ?? [];
+        scoped = new TrigramIndex(positions.map(id => searchableCommands[id]), trigramOptions);
+        serviceTrigramIndexes.set(service.name, scoped);
+    }
+    return scoped;
+}
+
+// Fuse's result order: score, then position in the collection
+function byScore(a: { score?: number; refIndex: number }, b: { score?: number; refIndex: number }): number {
+    return (a.score ?? 0) - (b.score ?? 0) || a.refIndex - b.refIndex;
+}
+
+// The best `limit` matches, best first; with a service, only its commands are searched
+function fuzzySearch(query: string, limit: number, service?: ManifestService): { item: SearchResult; score?: number }[] {
+    if (engine === 'trigram') {
+        return (service ? serviceTrigramIndex(service) : getTrigramIndex()).search(query, limit);
+    }
+    const matches = (service ? serviceFuse(service) : fuse).search(query);
+    return topK(matches, limit, byScore);
+}
+
+export interface EngineComparison {
+    query: string;
+    fuse: { ms: number; results: number };
+    trigram: { ms: number; results: number };
+    // Share of Fuse's top `limit` commands that the trigram backend also returns in its top `limit`
+    overlap: number;
+}
+
+// Latency and result agreement of both backends. The search bar searches in a
+// worker: go through its SearchClient to measure that copy.
+export function compareSearchEngines(queries: string[], limit = 10): EngineComparison[] {
+    getTrigramIndex();
+    return queries.map(query => {
+        const timed = (using: SearchEngine) => {
+            const started = performance.now();
+            // Full searches on both sides, all matches kept
+            const results = using === 'trigram'
+                ? getTrigramIndex().search(query.toLowerCase())
+                : fuse.search(query.toLowerCase());
+            const top = topK<{ item: SearchResult; score?: number; refIndex: number }>(results, limit, byScore);
+            return { ms: performance.now() - started, count: results.length, top: top.map(r => r.item.fullCommand) };
+        };
+        const fuseRun = timed('fuse');
+        const trigramRun = timed('trigram');
+
+        const fuseTop = fuseRun.top;
+        const trigramTop = new Set(trigramRun.top);
+        const shared = fuseTop.filter(command => trigramTop.has(command)).length;
+
+        return {
+            query,
+            fuse: { ms: fuseRun.ms, results: fuseRun.count },
+            trigram: { ms: trigramRun.ms, results: trigramRun.count },
+            overlap: fuseTop.length ? shared / fuseTop.length : 1
+        };
+    });
+}
+
+// Recent results by normalized query (backspacing and retyping, common queries).
+// The manifest is bundled, so new data comes with a new module and an empty
+// cache. Size: NEXT_PUBLIC_SEARCH_CACHE_SIZE or setSearchCacheSize() (0
+// disables it). Callers get the cached array itself and must not modify it.
+const DEFAULT_CACHE_SIZE = 200;
+
+const configuredCacheSize = parseInt(process.env.NEXT_PUBLIC_SEARCH_CACHE_SIZE ?? '', 10);
+
+const resultCache = new LruCache<string, SearchResult[]>(
+    Number.isNaN(configuredCacheSize) ? DEFAULT_CACHE_SIZE : configuredCacheSize
+);
+
+export function setSearchCacheSize(size: number): void {
+    resultCache.resize(size);
+}
+
+export function getSearchCacheStats(): CacheStats {
+    return resultCache.stats();
+}
 
 export function searchAWSCommands(query: string): SearchResult[] {
     if (!query || query.trim().length === 0) {
@@ -60,9 +241,20 @@ export function searchAWSCommands(query: string): SearchResult[] {
         trimmedQuery = trimmedQuery.substring(4).trim();
     }
 
+    const cached = resultCache.get(trimmedQuery);
+    if (cached) {
+        return cached;
+    }
+
+    const results = runSearch(trimmedQuery);
+    resultCache.set(trimmedQuery, results);
+    return results;
+}
+
+function runSearch(trimmedQuery: string): SearchResult[] {
     // Special case: if user types just "aws", show list of services
-    if (trimmedQuery === '' || query.trim().toLowerCase() === 'aws') {
-        return awsServices.slice(0, 100).map(service => ({
+    if (trimmedQuery === '' || trimmedQuery === 'aws') {
+        return manifest.services.slice(0, RESULT_LIMIT).map(service => ({
             displayText: `aws ${service.name}`,
             fullCommand: `aws ${service.name}`,
             service: service.name,
@@ -72,47 +264,42 @@ export function searchAWSCommands(query: string): SearchResult[] {
     }
 
     // Check if query matches a service name exactly
-    const exactServiceMatch = awsServices.find(s => s.name === trimmedQuery);
+    const exactServiceMatch = findService(trimmedQuery);
 
     // If exact service match, show only that service's commands
     if (exactServiceMatch) {
-        return exactServiceMatch.commands.slice(0, 100).map(cmd => ({
-            displayText: `aws ${exactServiceMatch.name} ${cmd.name}`,
-            fullCommand: `aws ${exactServiceMatch.name} ${cmd.name}`,
+        return exactServiceMatch.commands.slice(0, RESULT_LIMIT).map(cmd => ({
+            displayText: `aws ${exactServiceMatch.name} ${cmd}`,
+            fullCommand: `aws ${exactServiceMatch.name} ${cmd}`,
             service: exactServiceMatch.name,
-            command: cmd.name,
-            parameters: cmd.parameters
+            command: cmd
         }));
     }
 
     // Check if query starts with a service name (e.g., "ec2 describe" or "ec2 security")
     const queryParts = trimmedQuery.split(' ');
     const firstPart = queryParts[0];
-    const matchingService = awsServices.find(s => s.name === firstPart);
+    const matchingService = findService(firstPart);
 
     // If query starts with service name, search within that service only
     if (matchingService && queryParts.length > 1) {
         const commandQuery = queryParts.slice(1).join(' ');
-        const serviceResults = fuse.search(commandQuery).filter(r => r.item.service === matchingService.name);
-        return serviceResults
-            .slice(0, 100)
-            .map(result => ({
-                ...result.item,
-                score: result.score
-            }));
+        return fuzzySearch(commandQuery, RESULT_LIMIT, matchingService).map(result => ({
+            ...result.item,
+            score: result.score
+        }));
     }
 
-    // Use Fuse.js for fuzzy search across all services
-    const results = fuse.search(trimmedQuery);
+    // Fuzzy search across all services
+    const results = fuzzySearch(trimmedQuery, RESULT_LIMIT);
 
-    // Convert Fuse results to our format and limit to 100
+    // Convert results to our format
     return results
-        .slice(0, 100)
         .map(result => ({
             ...result.item,
             score: result.score
         }));
 }
 
-// Export services for direct access if needed
-export { awsServices, type Service, type Command };
+// Services and commands are in the manifest; full data is loaded per service
+export { manifest, findService, findCommand, loadCommandParameters, type Service, type Command };
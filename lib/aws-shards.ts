@@ -0,0 +1,58 @@
+// Lazily loaded service data
+// The full commands and parameters of each service live in
+// public/data/services/<service>.<hash>.json (see lib/aws-lookup.ts for the
+// manifest listing them) and are only fetched when one of the service's
+// commands is opened. Shards take the form of aws-commands.json, plain or
+// string-table, and expandServices() decodes either.
+import type { Command, CommandParameter, Service } from './aws-commands';
+import { expandServices, type AwsData } from './aws-parameters';
+import { findService, type ManifestService } from './aws-lookup';
+
+export const SHARD_PATH = '/data/services';
+
+interface LoadedService {
+  service: Service;
+  commands: Map<string, Command>;
+}
+
+const shards = new Map<string, Promise<LoadedService>>();
+
+export function shardUrl(service: ManifestService): string {
+  return `${SHARD_PATH}/${service.name}.${service.hash}.json`;
+}
+
+function loadShard(entry: ManifestService): Promise<LoadedService> {
+  let shard = shards.get(entry.name);
+  if (!shard) {
+    shard = fetch(shardUrl(entry))
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`Failed to load ${shardUrl(entry)}: ${response.status}`);
+        }
+        return response.json();
+      })
+      .then((data: AwsData) => {
+        const service = expandServices(data).services[0];
+        return { service, commands: new Map(service.commands.map(command => [command.name, command])) };
+      });
+    // A failed fetch is retried the next time the service is opened
+    shard.catch(() => shards.delete(entry.name));
+    shards.set(entry.name, shard);
+  }
+  return shard;
+}
+
+// Fetch (once) and expand a service's shard
+export async function loadService(name: string): Promise<Service | undefined> {
+  const entry = findService(name);
+  return entry ? (await loadShard(entry)).service : undefined;
+}
+
+// Parameters of one command (undefined if the service or command doesn't exist)
+export async function loadCommandParameters(service: string, command: string): Promise<CommandParameter[] | undefined> {
+  const entry = findService(service);
+  if (!entry) {
+    return undefined;
+  }
+  return (await loadShard(entry)).commands.get(command)?.parameters;
+}
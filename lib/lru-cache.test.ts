@@ -0,0 +1,53 @@
+// LruCache tests (npm test)
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { LruCache } from './lru-cache.ts';
+
+test('evicts the least recently used entry', () => {
+  const cache = new LruCache<string, number>(2);
+  cache.set('a', 1);
+  cache.set('b', 2);
+  assert.equal(cache.get('a'), 1);
+  cache.set('c', 3);
+  assert.equal(cache.get('b'), undefined);
+  assert.equal(cache.get('a'), 1);
+  assert.equal(cache.get('c'), 3);
+  assert.equal(cache.stats().evictions, 1);
+});
+
+test('setting an existing key refreshes it', () => {
+  const cache = new LruCache<string, number>(2);
+  cache.set('a', 1);
+  cache.set('b', 2);
+  cache.set('a', 10);
+  cache.set('c', 3);
+  assert.equal(cache.get('a'), 10);
+  assert.equal(cache.get('b'), undefined);
+});
+
+test('resize evicts down to the new capacity', () => {
+  const cache = new LruCache<string, number>(3);
+  cache.set('a', 1);
+  cache.set('b', 2);
+  cache.set('c', 3);
+  cache.resize(1);
+  assert.equal(cache.stats().size, 1);
+  assert.equal(cache.get('c'), 3);
+});
+
+test('capacity 0 stores nothing', () => {
+  const cache = new LruCache<string, number>(0);
+  cache.set('a', 1);
+  assert.equal(cache.get('a'), undefined);
+  assert.equal(cache.stats().size, 0);
+});
+
+test('stats count hits and misses', () => {
+  const cache = new LruCache<string, number>(2);
+  cache.set('a', 1);
+  cache.get('a');
+  cache.get('b');
+  cache.clear();
+  cache.get('a');
+  assert.deepEqual(cache.stats(), { size: 0, capacity: 2, hits: 1, misses: 2, evictions: 0, hitRate: 1 / 3 });
+});
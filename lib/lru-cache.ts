@@ -0,0 +1,71 @@
+// Bounded LRU cache
+// A Map keeps insertion order, so re-inserting on every hit keeps the least
+// recently used entry first, where eviction takes it from.
+
+export interface CacheStats {
+  size: number;
+  capacity: number;
+  hits: number;
+  misses: number;
+  evictions: number;
+  hitRate: number;
+}
+
+export class LruCache<K, V> {
+  private readonly entries = new Map<K, V>();
+  private capacity: number;
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+
+  constructor(capacity: number) {
+    this.capacity = Math.max(0, capacity);
+  }
+
+  get(key: K): V | undefined {
+    const value = this.entries.get(key);
+    if (value === undefined) {
+      this.misses++;
+      return undefined;
+    }
+    this.hits++;
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  set(key: K, value: V): void {
+    if (this.capacity === 0) return;
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    this.evict();
+  }
+
+  resize(capacity: number): void {
+    this.capacity = Math.max(0, capacity);
+    this.evict();
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  stats(): CacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      size: this.entries.size,
+      capacity: this.capacity,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hitRate: lookups ? this.hits / lookups : 0
+    };
+  }
+
+  private evict(): void {
+    while (this.entries.size > this.capacity) {
+      this.entries.delete(this.entries.keys().next().value as K);
+      this.evictions++;
+    }
+  }
+}
@@ -0,0 +1,215 @@
+// Worker-backed search client
+// Runs searchAWSCommands() in lib/search.worker.ts so the index and every scan
+// stay off the main thread. At most one query is in flight; a newer keystroke
+// replaces the one waiting to be sent, and an answer that arrives after a newer
+// query was issued resolves to undefined instead of results. Without worker
+// support (or if the worker fails) the same queue runs the search in-thread.
+//
+// The backend and the result cache belong to whichever copy of aws-search
+// answers the searches, so their settings and stats go through the client too:
+// calling setSearchEngine() & co. directly would only change the main thread's
+// copy.
+import type { EngineComparison, SearchEngine, SearchResult } from './aws-search';
+import type { CacheStats } from './lru-cache';
+import type { SearchRequest, SearchResponse } from './search-requests';
+
+export type SearchMode = 'worker' | 'inline';
+
+export interface SearchClient {
+  // Results for query, or undefined if a newer query superseded it
+  search(query: string): Promise<SearchResult[] | undefined>;
+  setSearchEngine(engine: SearchEngine): Promise<void>;
+  setSearchCacheSize(size: number): Promise<void>;
+  getSearchCacheStats(): Promise<CacheStats>;
+  compareSearchEngines(queries: string[], limit?: number): Promise<EngineComparison[]>;
+  readonly mode: SearchMode;
+  dispose(): void;
+}
+
+interface QueuedQuery {
+  id: number;
+  query: string;
+  resolve: (results: SearchResult[] | undefined) => void;
+}
+
+// A settings or stats call waiting for its response
+interface PendingCall {
+  request: SearchRequest;
+  resolve: (response: SearchResponse) => void;
+  reject: (error: Error) => void;
+}
+
+function startWorker(): Worker | null {
+  if (typeof Worker === 'undefined') {
+    return null;
+  }
+  try {
+    return new Worker(new URL('./search.worker.ts', import.meta.url));
+  } catch {
+    return null;
+  }
+}
+
+// useWorker: false always searches in-thread
+export function createSearchClient(useWorker = true): SearchClient {
+  let worker = useWorker ? startWorker() : null;
+  let sequence = 0;
+  let inFlight: QueuedQuery | null = null;
+  let pending: QueuedQuery | null = null;
+  let callSequence = 0;
+  const calls = new Map<number, PendingCall>();
+  // Latest setting of each kind sent to the worker, replayed in-thread on fallback
+  const settings = new Map<SearchRequest['type'], SearchRequest>();
+  // One module promise, so in-thread requests run in the order they were made
+  let inlineModule: Promise<typeof import('./search-requests')> | null = null;
+
+  const runInline = (request: SearchRequest): Promise<SearchResponse> => {
+    if (!inlineModule) {
+      inlineModule = import('./search-requests');
+    }
+    return inlineModule.then(({ handleRequest }) => handleRequest(request));
+  };
+
+  const finish = (id: number, results: SearchResult[]) => {
+    if (!inFlight || inFlight.id !== id) return;
+    const { resolve } = inFlight;
+    inFlight = null;
+    resolve(id === sequence ? results : undefined);
+    pump();
+  };
+
+  const searchInline = (request: QueuedQuery) => {
+    runInline({ id: request.id, type: 'search', query: request.query })
+      .then(response => finish(request.id, response.type === 'search' ? response.results : []))
+      .catch(error => {
+        console.error(error);
+        finish(request.id, []);
+      });
+  };
+
+  const pump = () => {
+    if (inFlight || !pending) return;
+    inFlight = pending;
+    pending = null;
+    if (worker) {
+      const request: SearchRequest = { id: inFlight.id, type: 'search', query: inFlight.query };
+      worker.postMessage(request);
+    } else {
+      searchInline(inFlight);
+    }
+  };
+
+  const settle = (id: number, response: SearchResponse) => {
+    const call = calls.get(id);
+    if (!call) return;
+    calls.delete(id);
+    call.resolve(response);
+  };
+
+  const callInline = (id: number, request: SearchRequest) => {
+    runInline(request)
+      .then(response => settle(id, response))
+      .catch(error => {
+        const call = calls.get(id);
+        calls.delete(id);
+        call?.reject(error);
+      });
+  };
+
+  const call = (request: SearchRequest): Promise<SearchResponse> => {
+    return new Promise((resolve, reject) => {
+      calls.set(request.id, { request, resolve, reject });
+      if (request.type === 'setSearchEngine' || request.type === 'setSearchCacheSize') {
+        settings.set(request.type, request);
+      }
+      if (worker) {
+        worker.postMessage(request);
+      } else {
+        callInline(request.id, request);
+      }
+    });
+  };
+
+  const fallBack = () => {
+    worker?.terminate();
+    worker = null;
+    // The in-thread copy starts from the defaults: apply the worker's settings,
+    // then answer the calls it left unanswered
+    for (const setting of settings.values()) {
+      if (!calls.has(setting.id)) {
+        runInline(setting).catch(console.error);
+      }
+    }
+    for (const [id, { request }] of calls) {
+      callInline(id, request);
+    }
+    // Re-run the query the worker was answering, unless a newer one is waiting
+    if (inFlight) {
+      if (pending) {
+        inFlight.resolve(undefined);
+      } else {
+        pending = inFlight;
+      }
+      inFlight = null;
+    }
+    pump();
+  };
+
+  if (worker) {
+    worker.onmessage = (event: MessageEvent<SearchResponse>) => {
+      const response = event.data;
+      if (response.type === 'search') {
+        finish(response.id, response.results);
+      } else {
+        settle(response.id, response);
+      }
+    };
+    worker.onerror = event => {
+      event.preventDefault();
+      console.error('Search worker failed, searching in-thread:', event.message);
+      fallBack();
+    };
+    worker.onmessageerror = fallBack;
+  }
+
+  return {
+    search(query: string) {
+      return new Promise(resolve => {
+        pending?.resolve(undefined);
+        pending = { id: ++sequence, query, resolve };
+        pump();
+      });
+    },
+    async setSearchEngine(engine: SearchEngine) {
+      await call({ id: ++callSequence, type: 'setSearchEngine', engine });
+    },
+    async setSearchCacheSize(size: number) {
+      await call({ id: ++callSequence, type: 'setSearchCacheSize', size });
+    },
+    async getSearchCacheStats() {
+      const response = await call({ id: ++callSequence, type: 'getSearchCacheStats' });
+      if (response.type !== 'getSearchCacheStats') throw new Error(`Unexpected ${response.type} response`);
+      return response.stats;
+    },
+    async compareSearchEngines(queries: string[], limit?: number) {
+      const response = await call({ id: ++callSequence, type: 'compareSearchEngines', queries, limit });
+      if (response.type !== 'compareSearchEngines') throw new Error(`Unexpected ${response.type} response`);
+      return response.comparisons;
+    },
+    get mode(): SearchMode {
+      return worker ? 'worker' : 'inline';
+    },
+    dispose() {
+      worker?.terminate();
+      worker = null;
+      inFlight?.resolve(undefined);
+      pending?.resolve(undefined);
+      inFlight = null;
+      pending = null;
+      for (const { reject } of calls.values()) {
+        reject(new Error('Search client disposed'));
+      }
+      calls.clear();
+    }
+  };
+}
@@ -0,0 +1,48 @@
+// Search requests
+// Messages between lib/search-client.ts and lib/search.worker.ts. Searches and
+// the calls that read or change the search module's state (backend, result
+// cache) are requests with an id; each response carries the same id and type.
+// handleRequest() answers one against lib/aws-search.ts, in the worker or,
+// without one, in-thread, so both paths keep their state the same way.
+import {
+  compareSearchEngines,
+  getSearchCacheStats,
+  searchAWSCommands,
+  setSearchCacheSize,
+  setSearchEngine,
+  type EngineComparison,
+  type SearchEngine,
+  type SearchResult
+} from './aws-search';
+import type { CacheStats } from './lru-cache';
+
+export type SearchRequest =
+  | { id: number; type: 'search'; query: string }
+  | { id: number; type: 'setSearchEngine'; engine: SearchEngine }
+  | { id: number; type: 'setSearchCacheSize'; size: number }
+  | { id: number; type: 'getSearchCacheStats' }
+  | { id: number; type: 'compareSearchEngines'; queries: string[]; limit?: number };
+
+export type SearchResponse =
+  | { id: number; type: 'search'; results: SearchResult[] }
+  | { id: number; type: 'setSearchEngine' | 'setSearchCacheSize' }
+  | { id: number; type: 'getSearchCacheStats'; stats: CacheStats }
+  | { id: number; type: 'compareSearchEngines'; comparisons: EngineComparison[] };
+
+export function handleRequest(request: SearchRequest): SearchResponse {
+  const { id } = request;
+  switch (request.type) {
+    case 'search':
+      return { id, type: 'search', results: searchAWSCommands(request.query) };
+    case 'setSearchEngine':
+      setSearchEngine(request.engine);
+      return { id, type: 'setSearchEngine' };
+    case 'setSearchCacheSize':
+      setSearchCacheSize(request.size);
+      return { id, type: 'setSearchCacheSize' };
+    case 'getSearchCacheStats':
+      return { id, type: 'getSearchCacheStats', stats: getSearchCacheStats() };
+    case 'compareSearchEngines':
+      return { id, type: 'compareSearchEngines', comparisons: compareSearchEngines(request.queries, request.limit) };
+  }
+}
@@ -0,0 +1,13 @@
+// Search worker
+// Holds the search index (lib/aws-search.ts) off the main thread and answers
+// requests from lib/search-client.ts (lib/search-requests.ts). Each response
+// carries its request's id so the client can drop answers to superseded
+// keystrokes.
+import { handleRequest, type SearchRequest } from './search-requests';
+
+// Typed through Worker: tsconfig only includes the DOM lib
+const scope = self as unknown as Worker;
+
+scope.onmessage = (event: MessageEvent<SearchRequest>) => {
+  scope.postMessage(handleRequest(event.data));
+};
@@ -0,0 +1,61 @@
+// String-table data format
+// Optional compact form of aws-commands.json (python3 scripts/aws_data.py --format packed):
+// every distinct string is stored once in `strings`, and services, commands and
+// parameters are arrays of indexes into it. Decoding gives the same Service /
+// Command / CommandParameter objects as the plain form, with strings shared from
+// the table and each command's parameters built only when first read.
+import type { CommandParameter, Command, Service } from './aws-commands';
+
+export const STRING_TABLE_FORMAT = 'string-table';
+
+// [name, description?]
+export type PackedParameter = [number, number?];
+// [name, description (-1: none), parameters?]; a number parameter indexes globalParameters
+export type PackedCommand = [number, number, (PackedParameter | number)[]?];
+// [name, description (-1: none), commands]
+export type PackedService = [number, number, PackedCommand[]];
+
+export interface PackedData {
+  format: typeof STRING_TABLE_FORMAT;
+  strings: string[];
+  globalParameters: PackedParameter[];
+  services: PackedService[];
+}
+
+export function isPacked(data: unknown): data is PackedData {
+  return !Array.isArray(data) && (data as PackedData).format === STRING_TABLE_FORMAT;
+}
+
+function decodeParameter(param: PackedParameter, strings: string[]): CommandParameter {
+  return param[1] !== undefined
+    ? { name: strings[param[0]], description: strings[param[1]] }
+    : { name: strings[param[0]] };
+}
+
+function decodeCommand(command: PackedCommand, strings: string[], globals: CommandParameter[]): Command {
+  const [name, description, parameters = []] = command;
+  let resolved: CommandParameter[] | undefined;
+  return {
+    name: strings[name],
+    description: description >= 0 ? strings[description] : undefined,
+    get parameters() {
+      if (!resolved) {
+        resolved = parameters.map(param => typeof param === 'number' ? globals[param] : decodeParameter(param, strings));
+      }
+      return resolved;
+    }
+  };
+}
+
+export function decodeStringTable(data: PackedData): { services: Service[]; globalParameters: CommandParameter[] } {
+  const { strings } = data;
+  const globals = data.globalParameters.map(param => decodeParameter(param, strings));
+
+  const services = data.services.map(([name, description, commands]) => ({
+    name: strings[name],
+    description: description >= 0 ? strings[description] : undefined,
+    commands: commands.map(command => decodeCommand(command, strings, globals))
+  }));
+
+  return { services, globalParameters: globals };
+}
@@ -0,0 +1,46 @@
+// topK tests (npm test)
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { TopK, topK } from './top-k.ts';
+
+const ascending = (a: number, b: number) => a - b;
+
+test('keeps the k smallest, best first', () => {
+  assert.deepEqual(topK([5, 1, 9, 3, 7, 2, 8], 3, ascending), [1, 2, 3]);
+});
+
+test('matches a full sort for every k', () => {
+  const items = Array.from({ length: 200 }, (_, i) => (i * 7919) % 211);
+  const sorted = [...items].sort(ascending);
+  for (const k of [1, 2, 10, 100, 199, 200, 500]) {
+    assert.deepEqual(topK(items, k, ascending), sorted.slice(0, k), `k = ${k}`);
+  }
+});
+
+test('unbounded k is a plain sort', () => {
+  assert.deepEqual(topK([3, 1, 2], Infinity, ascending), [1, 2, 3]);
+});
+
+test('k of 0 or less keeps nothing', () => {
+  assert.deepEqual(topK([3, 1, 2], 0, ascending), []);
+  assert.deepEqual(topK([3, 1, 2], -1, ascending), []);
+});
+
+test('ties keep the order of the comparator', () => {
+  // Score, then position: the same order Fuse sorts results in
+  const results = [
+    { score: 0.5, refIndex: 0 }, { score: 0.1, refIndex: 1 }, { score: 0.5, refIndex: 2 },
+    { score: 0.1, refIndex: 3 }, { score: 0.3, refIndex: 4 }
+  ];
+  const byScore = (a: { score: number; refIndex: number }, b: { score: number; refIndex: number }) =>
+    a.score - b.score || a.refIndex - b.refIndex;
+  assert.deepEqual(topK(results, 3, byScore).map(r => r.refIndex), [1, 3, 4]);
+});
+
+test('TopK can be fed incrementally', () => {
+  const best = new TopK<number>(2, ascending);
+  [4, 2, 6].forEach(item => best.push(item));
+  assert.deepEqual(best.sorted(), [2, 4]);
+  best.push(1);
+  assert.deepEqual(best.sorted(), [1, 2]);
+});
@@ -0,0 +1,55 @@
+// Bounded top-k selection
+// Keeps the k best items seen so far (smallest under compare) in a binary
+// max-heap with the worst kept item at the root, so choosing k of n items costs
+// O(n log k) time and O(k) memory instead of sorting all n. Until k items have
+// been pushed they are only collected, so an unbounded k is a plain sort.
+
+export class TopK<T> {
+  private readonly items: T[] = [];
+  private readonly k: number;
+  private readonly compare: (a: T, b: T) => number;
+
+  constructor(k: number, compare: (a: T, b: T) => number) {
+    this.k = Math.max(0, k);
+    this.compare = compare;
+  }
+
+  push(item: T): void {
+    const items = this.items;
+    if (items.length < this.k) {
+      items.push(item);
+      if (items.length === this.k) {
+        for (let i = (items.length >> 1) - 1; i >= 0; i--) this.siftDown(i);
+      }
+    } else if (this.k > 0 && this.compare(item, items[0]) < 0) {
+      items[0] = item;
+      this.siftDown(0);
+    }
+  }
+
+  // Kept items, best first
+  sorted(): T[] {
+    return [...this.items].sort(this.compare);
+  }
+
+  private siftDown(i: number): void {
+    const items = this.items;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let worst = i;
+      if (left < items.length && this.compare(items[left], items[worst]) > 0) worst = left;
+      if (right < items.length && this.compare(items[right], items[worst]) > 0) worst = right;
+      if (worst === i) return;
+      [items[i], items[worst]] = [items[worst], items[i]];
+      i = worst;
+    }
+  }
+}
+
+// The k best items, best first
+export function topK<T>(items: Iterable<T>, k: number, compare: (a: T, b: T) => number): T[] {
+  const best = new TopK(k, compare);
+  for (const item of items) best.push(item);
+  return best.sorted();
+}
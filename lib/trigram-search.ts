@@ -0,0 +1,207 @@
+// Trigram search backend
+// Alternative to Fuse.js's full Bitap scan: an inverted index from every
+// trigram of each record's indexed text to the records containing it narrows a
+// query to the records sharing enough trigrams with it, and only those are
+// scored, by approximate substring edit distance per key.
+//
+// Scores use Fuse's scale so the two backends can be compared: 0 is a perfect
+// match, a key matches when its edit distance is at most threshold * query
+// length, and matched keys combine as the product of score^(weight * field
+// norm). The distances are Levenshtein distances rather than Fuse's Bitap
+// scores, so the results and their order can differ from Fuse's.
+//
+// Each edit can destroy up to n of the query's n-grams, so the index only
+// narrows a query when it keeps at least one n-gram after maxEdits edits. When
+// trigrams can't guarantee that, bigrams (indexed on first use) are tried, and
+// failing those every record is scored: no match is missed, but short queries,
+// and at threshold 0.4 every query, get no trigram filtering. Like Fuse with
+// minMatchCharLength 2, one-character queries match nothing.
+import { TopK } from './top-k';
+
+export interface TrigramKey {
+  name: string;
+  weight: number;
+}
+
+export interface TrigramOptions {
+  keys: TrigramKey[];
+  // Largest accepted edit distance as a fraction of the query length (Fuse: threshold)
+  threshold?: number;
+  // Key whose text is indexed; it should contain every other key's text
+  // (default: the first key)
+  indexKey?: string;
+}
+
+export interface TrigramResult<T> {
+  item: T;
+  refIndex: number;
+  score: number;
+}
+
+const GRAM = 3;
+
+// Fuse's minMatchCharLength: shorter queries match nothing
+const MIN_QUERY_LENGTH = 2;
+
+// Fuse scores an exact match as EPSILON so it still ranks by the other keys
+const EXACT_SCORE = Number.EPSILON;
+
+// Fuse's result order: score, then position in the collection
+function byScore<T>(a: TrigramResult<T>, b: TrigramResult<T>): number {
+  return a.score - b.score || a.refIndex - b.refIndex;
+}
+
+function ngrams(text: string, size = GRAM): string[] {
+  const grams = new Set<string>();
+  for (let i = 0; i + size <= text.length; i++) {
+    grams.add(text.substring(i, i + size));
+  }
+  return [...grams];
+}
+
+function addPostings(postings: Map<string, number[]>, texts: string[], size: number): void {
+  texts.forEach((text, id) => {
+    for (const gram of ngrams(text, size)) {
+      const posting = postings.get(gram);
+      if (posting) {
+        posting.push(id);
+      } else {
+        postings.set(gram, [id]);
+      }
+    }
+  });
+}
+
+// Fuse's field-length norm: 1 / sqrt(number of space-separated tokens)
+function fieldNorm(text: string): number {
+  const tokens = text.split(' ').filter(Boolean).length || 1;
+  return Math.round(1000 / Math.sqrt(tokens)) / 1000;
+}
+
+export class TrigramIndex<T> {
+  private readonly records: T[];
+  private readonly keys: { name: string; weight: number }[];
+  private readonly threshold: number;
+  // fields[k][i]: lower-cased text of key k in record i
+  private readonly fields: string[][];
+  private readonly norms: number[][];
+  // Text of the indexed key, per record
+  private readonly indexed: string[];
+  private readonly postings = new Map<string, number[]>();
+  private bigramPostings: Map<string, number[]> | undefined;
+  private readonly allIds: number[];
+  private readonly counts: Uint16Array;
+  private column = new Int32Array(33);
+  private previous = new Int32Array(33);
+
+  constructor(records: T[], options: TrigramOptions) {
+    this.records = records;
+    this.threshold = options.threshold ?? 0.4;
+    const totalWeight = options.keys.reduce((sum, key) => sum + key.weight, 0) || 1;
+    this.keys = options.keys.map(key => ({ name: key.name, weight: key.weight / totalWeight }));
+    this.fields = this.keys.map(key =>
+      records.map(record => String((record as Record<string, unknown>)[key.name] ?? '').toLowerCase()));
+    this.norms = this.fields.map(texts => texts.map(fieldNorm));
+    this.counts = new Uint16Array(records.length);
+    this.allIds = records.map((_, id) => id);
+
+    this.indexed = this.fields[Math.max(0, this.keys.findIndex(key => key.name === (options.indexKey ?? this.keys[0].name)))];
+    addPostings(this.postings, this.indexed, GRAM);
+  }
+
+  get size(): number {
+    return this.postings.size;
+  }
+
+  private postingsOf(size: number): Map<string, number[]> {
+    if (size === GRAM) return this.postings;
+    if (!this.bigramPostings) {
+      this.bigramPostings = new Map();
+      addPostings(this.bigramPostings, this.indexed, 2);
+    }
+    return this.bigramPostings;
+  }
+
+  // Records that share at least minShared n-grams with the query, in record order
+  private candidates(grams: string[], minShared: number, postings: Map<string, number[]>): number[] {
+    const counts = this.counts;
+    const touched: number[] = [];
+    for (const gram of grams) {
+      const posting = postings.get(gram);
+      if (!posting) continue;
+      for (const id of posting) {
+        if (counts[id]++ === 0) touched.push(id);
+      }
+    }
+    const selected = touched.filter(id => counts[id] >= minShared);
+    for (const id of touched) counts[id] = 0;
+    return selected.sort((a, b) => a - b);
+  }
+
+  // Fewest edits turning pattern into some substring of text (Sellers' algorithm)
+  private substringDistance(pattern: string, text: string): number {
+    const m = pattern.length;
+    if (this.column.length <= m) {
+      this.column = new Int32Array(m + 1);
+      this.previous = new Int32Array(m + 1);
+    }
+    let previous = this.previous;
+    let column = this.column;
+    for (let i = 0; i <= m; i++) previous[i] = i;
+    let best = m;
+
+    for (let j = 0; j < text.length; j++) {
+      const c = text.charCodeAt(j);
+      column[0] = 0;
+      for (let i = 1; i <= m; i++) {
+        const substitute = previous[i - 1] + (pattern.charCodeAt(i - 1) === c ? 0 : 1);
+        column[i] = Math.min(substitute, previous[i] + 1, column[i - 1] + 1);
+      }
+      if (column[m] < best) best = column[m];
+      const swap = previous;
+      previous = column;
+      column = swap;
+    }
+    return best;
+  }
+
+  // The best `limit` matches (default: all), best first
+  search(query: string, limit = Infinity): TrigramResult<T>[] {
+    const pattern = query.toLowerCase();
+    if (pattern.length < MIN_QUERY_LENGTH) return [];
+    const maxEdits = Math.floor(this.threshold * pattern.length);
+
+    // A match within maxEdits keeps at least |grams| - n * maxEdits of the
+    // query's distinct n-grams. Below one, a match may share none: try bigrams,
+    // then score every record.
+    let ids = this.allIds;
+    for (const size of [GRAM, 2]) {
+      const grams = ngrams(pattern, size);
+      const minShared = grams.length - size * maxEdits;
+      if (minShared >= 1) {
+        ids = this.candidates(grams, minShared, this.postingsOf(size));
+        break;
+      }
+    }
+
+    const best = new TopK<TrigramResult<T>>(limit, byScore);
+    for (const id of ids) {
+      let score = 1;
+      let matched = false;
+      for (let k = 0; k < this.keys.length; k++) {
+        const text = this.fields[k][id];
+        // With no edits allowed, only an exact substring matches
+        const distance = maxEdits === 0 ? (text.includes(pattern) ? 0 : 1) : this.substringDistance(pattern, text);
+        if (distance > maxEdits) continue;
+        matched = true;
+        const keyScore = distance === 0 ? EXACT_SCORE : distance / pattern.length;
+        score *= Math.pow(keyScore, this.keys[k].weight * this.norms[k][id]);
+      }
+      if (matched) {
+        best.push({ item: this.records[id], refIndex: id, score });
+      }
+    }
+
+    return best.sorted();
+  }
+}
@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 """Add all missing EC2 commands"""
 
-import re
-import json
 from botocore.session import Session
 from botocore import xform_name
+from aws_data import DATA_FILE, load_services, save_services
 
 # Get all EC2 commands from AWS
 session = Session()
@@ -17,11 +16,7 @@ print(f"🔧 Adding Missing EC2 Commands\n")
 print(f"AWS EC2 has {len(aws_commands)} commands\n")
 
 # Load current data
-with open('lib/aws-commands.ts', 'r') as f:
-    content = f.read()
-
-match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-data = eval(match.group(1))
+data = load_services()
 
 # Find EC2 service
 ec2_idx = next(i for i, s in enumerate(data) if s['name'] == 'ec2')
@@ -47,39 +42,9 @@ ec2['commands'].sort(key=lambda x: x['name'])
 print(f"✅ Added {len(missing)} commands to EC2")
 print(f"📊 EC2 now has {len(ec2['commands'])} commands\n")
 
-# Generate TypeScript file
-ts_content = f"""// AWS CLI command structure
-export interface CommandParameter {{
-  name: string;
-  description?: string;
-}}
-
-export interface Command {{
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}}
-
-export interface Service {{
-  name: string;
-  description?: string;
-  commands: Command[];
-}}
-
-// AWS CLI data structure
-export const awsServices: Service[] = {json.dumps(data, indent=2)};
-"""
-
-# Backup
-import shutil
-shutil.copy('lib/aws-commands.ts', '.dev-data/aws-commands.backup-before-ec2-expansion.ts')
-print("💾 Backup saved")
-
-# Save
-with open('lib/aws-commands.ts', 'w') as f:
-    f.write(ts_content)
-
-print("💾 Saved to lib/aws-commands.ts")
+# Save (with backup)
+save_services(data, backup='.dev-data/aws-commands.backup-before-ec2-expansion.json')
+print(f"💾 Saved to {DATA_FILE}")
 
 # Final stats
 total_commands = sum(len(s['commands']) for s in data)
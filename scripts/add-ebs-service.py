@@ -1,98 +1,11 @@
 #!/usr/bin/env python3
 """Add EBS service with all commands and parameters"""
 
-import subprocess
-import re
-import os
-import json
-from typing import List, Dict
 from botocore.session import Session
 from botocore import xform_name
-
-def run_aws_help(service: str, command: str) -> str:
-    """Get AWS CLI help output"""
-    try:
-        env = {'AWS_PAGER': ''}
-        result = subprocess.run(
-            ['aws', service, command, 'help'],
-            capture_output=True,
-            text=True,
-            timeout=15,
-            env={**os.environ, **env}
-        )
-        help_text = result.stdout
-        help_text = re.sub(r'(.)\x08\1', r'\1', help_text)
-        return help_text
-    except Exception as e:
-        return ""
-
-def parse_parameters(help_text: str) -> List[Dict[str, str]]:
-    """Parse parameters from help output"""
-    parameters = []
-    lines = help_text.split('\n')
-    in_options = False
-    current_param = None
-    
-    for i, line in enumerate(lines):
-        if line.strip() == 'OPTIONS':
-            in_options = True
-            continue
-        
-        if in_options and line.strip() and line.strip().isupper() and len(line.strip()) > 3:
-            if current_param:
-                parameters.append(current_param)
-            if not line.startswith(' ' * 5):
-                break
-        
-        if in_options:
-            # Pattern 1: --param | --no-param
-            bool_match = re.match(r'^\s{6,}(--[a-z0-9-]+)\s+\|\s+(--no-[a-z0-9-]+)', line)
-            if bool_match:
-                if current_param:
-                    parameters.append(current_param)
-                full_name = f"{bool_match.group(1)} | {bool_match.group(2)}"
-                current_param = {'name': full_name, 'description': ''}
-            else:
-                # Pattern 2: --param1 | --param2 (type)
-                alt_bool_match = re.match(r'^\s{6,}(--[a-z0-9-]+)\s+\|\s+(--[a-z0-9-]+)\s+\(([^)]+)\)', line)
-                if alt_bool_match:
-                    if current_param:
-                        parameters.append(current_param)
-                    full_name = f"{alt_bool_match.group(1)} | {alt_bool_match.group(2)}"
-                    current_param = {'name': full_name, 'description': ''}
-                else:
-                    # Pattern 3: --param (type)
-                    param_match = re.match(r'^\s{6,}(--[a-z0-9-]+)\s+\(([^)]+)\)', line)
-                    if param_match:
-                        if current_param:
-                            parameters.append(current_param)
-                        param_name = param_match.group(1)
-                        param_type = param_match.group(2)
-                        if param_type in ['string', 'integer', 'long', 'float', 'double', 'timestamp']:
-                            full_name = f"{param_name} <value>"
-                        elif param_type == 'boolean':
-                            full_name = f"{param_name} | --no-{param_name.lstrip('--')}"
-                        else:
-                            full_name = f"{param_name} <value>"
-                        current_param = {'name': full_name, 'description': ''}
-            if current_param and line.strip() and not line.startswith(' ' * 12):
-                if line.strip() and not line.strip().startswith('o '):
-                    if current_param['description']:
-                        current_param['description'] += ' ' + line.strip()
-                    else:
-                        current_param['description'] = line.strip()
-    
-    if current_param:
-        parameters.append(current_param)
-    
-    for param in parameters:
-        desc = param['description']
-        desc = re.sub(r'\s+', ' ', desc).strip()
-        if len(desc) > 250:
-            desc = desc[:247] + '...'
-        param['description'] = desc
-    
-    return parameters
+from aws_help import run_aws_help
+from help_parser import parse_parameters
+from aws_data import DATA_FILE, load_services, save_services
 
 print("🔧 Adding EBS Service\n")
 
@@ -140,11 +53,7 @@ print(f"   Commands: {len(ebs_service['commands'])}")
 print(f"   Parameters: {total_params}\n")
 
 # Load current data
-with open('lib/aws-commands.ts', 'r') as f:
-    content = f.read()
-
-match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-data = eval(match.group(1))
+data = load_services()
 
 # Add EBS service (insert alphabetically)
 data.append(ebs_service)
@@ -152,38 +61,9 @@ data.sort(key=lambda x: x['name'])
 
 print("✅ Added EBS to services list\n")
 
-# Backup
-import shutil
-shutil.copy('lib/aws-commands.ts', '.dev-data/aws-commands.backup-before-ebs.ts')
-print("💾 Backup saved\n")
-
-# Generate TypeScript file
-ts_content = f"""// AWS CLI command structure
-export interface CommandParameter {{
-  name: string;
-  description?: string;
-}}
-
-export interface Command {{
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}}
-
-export interface Service {{
-  name: string;
-  description?: string;
-  commands: Command[];
-}}
-
-// AWS CLI data structure
-export const awsServices: Service[] = {json.dumps(data, indent=2)};
-"""
-
-with open('lib/aws-commands.ts', 'w') as f:
-    f.write(ts_content)
-
-print("💾 Saved to lib/aws-commands.ts")
+# Save (with backup)
+save_services(data, backup='.dev-data/aws-commands.backup-before-ebs.json')
+print(f"💾 Saved to {DATA_FILE}")
 
 # Final stats
 total_commands = sum(len(s['commands']) for s in data)
@@ -1,23 +1,17 @@
 #!/usr/bin/env python3
 """
 Add missing commands to services
+
+Usage:
+    python3 scripts/add-missing-commands.py          # Everything in the verification report
+    python3 scripts/add-missing-commands.py --diff   # Only commands newly missing since the previous report
 """
 
 import json
-import re
+import sys
 from botocore.session import Session
 from botocore import xform_name
-
-def load_current_data():
-    """Load current aws-commands.ts"""
-    with open('lib/aws-commands.ts', 'r') as f:
-        content = f.read()
-    
-    match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-    if not match:
-        return []
-    
-    return eval(match.group(1))
+from aws_data import DATA_FILE, load_services, save_services
 
 def get_all_commands(service_name):
     """Get all commands for a service from AWS"""
@@ -32,23 +26,34 @@ def get_all_commands(service_name):
         print(f"Error getting commands for {service_name}: {e}")
         return []
 
-def add_missing_commands():
+def load_missing(from_diff: bool = False):
+    """Missing commands per service, from the verification report or its diff"""
+    if from_diff:
+        with open('reports/command-verification-diff.json', 'r') as f:
+            changes = json.load(f).get('missing', {})
+        return {service: change['added'] for service, change in changes.items() if change.get('added')}
+
+    with open('reports/command-verification.json', 'r') as f:
+        return json.load(f)['missing']
+
+def add_missing_commands(from_diff: bool = False):
     """Add missing commands to services"""
     print("🔧 Adding Missing Commands\n")
     
     # Load current data
-    data = load_current_data()
+    data = load_services()
     print(f"📂 Loaded {len(data)} services\n")
     
-    # Load verification report
-    with open('reports/command-verification.json', 'r') as f:
-        report = json.load(f)
+    # Load verification report (or just what changed since the previous one)
+    missing_by_service = load_missing(from_diff)
+    if from_diff:
+        print(f"🔀 Using verification diff: {len(missing_by_service)} services with newly missing commands\n")
     
     total_added = 0
     
     for service_data in data:
         service_name = service_data['name']
-        missing = report['missing'].get(service_name, [])
+        missing = missing_by_service.get(service_name, [])
         
         if not missing:
             continue
@@ -73,34 +78,9 @@ def add_missing_commands():
     
     print(f"\n✅ Added {total_added} commands\n")
     
-    # Generate TypeScript file
-    ts_content = f"""// AWS CLI command structure
-export interface CommandParameter {{
-  name: string;
-  description?: string;
-}}
-
-export interface Command {{
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}}
-
-export interface Service {{
-  name: string;
-  description?: string;
-  commands: Command[];
-}}
-
-// AWS CLI data structure
-export const awsServices: Service[] = {json.dumps(data, indent=2)};
-"""
-    
     # Save
-    with open('lib/aws-commands.ts', 'w') as f:
-        f.write(ts_content)
-    
-    print(f"💾 Saved to: lib/aws-commands.ts")
+    save_services(data)
+    print(f"💾 Saved to: {DATA_FILE}")
     
     # Final stats
     total_commands = sum(len(s['commands']) for s in data)
@@ -109,4 +89,4 @@ export const awsServices: Service[] = {json.dumps(data, indent=2)};
     print(f"   Commands: {total_commands}")
 
 if __name__ == '__main__':
-    add_missing_commands()
+    add_missing_commands(from_diff='--diff' in sys.argv)
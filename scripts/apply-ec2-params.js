@@ -1,5 +1,6 @@
 const fs = require('fs');
 const path = require('path');
+const { DATA_FILE, loadServices, saveServices } = require('./aws-data');
 
 console.log('🔄 Applying EC2 Parameter Data\n');
 
@@ -10,10 +11,8 @@ console.log(`📂 Loaded EC2 data: ${ec2Data.commands.length} commands`);
 const totalParams = ec2Data.commands.reduce((sum, cmd) => sum + (cmd.parameters?.length || 0), 0);
 console.log(`   Parameters: ${totalParams}\n`);
 
-// Load current aws-commands.ts
-const tsContent = fs.readFileSync('lib/aws-commands.ts', 'utf8');
-const match = tsContent.match(/export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);/);
-const data = eval(match[1]);
+// Load current data
+const data = loadServices();
 
 // Find EC2 service and replace
 const ec2Index = data.findIndex(s => s.name === 'ec2');
@@ -21,36 +20,11 @@ data[ec2Index] = ec2Data;
 
 console.log('✅ Replaced EC2 data\n');
 
-// Backup
-const backupPath = '.dev-data/aws-commands.backup-before-ec2-params.ts';
-fs.copyFileSync('lib/aws-commands.ts', backupPath);
+// Save (with backup)
+const backupPath = '.dev-data/aws-commands.backup-before-ec2-params.json';
+saveServices(data, DATA_FILE, { backup: backupPath });
 console.log(`💾 Backup saved to: ${backupPath}`);
-
-// Generate new TypeScript file
-const newContent = `// AWS CLI command structure
-export interface CommandParameter {
-  name: string;
-  description?: string;
-}
-
-export interface Command {
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}
-
-export interface Service {
-  name: string;
-  description?: string;
-  commands: Command[];
-}
-
-// AWS CLI data structure
-export const awsServices: Service[] = ${JSON.stringify(data, null, 2)};
-`;
-
-fs.writeFileSync('lib/aws-commands.ts', newContent);
-console.log(`💾 Applied to: lib/aws-commands.ts\n`);
+console.log(`💾 Applied to: ${DATA_FILE}\n`);
 
 // Final stats
 const totalCommands = data.reduce((sum, s) => sum + s.commands.length, 0);
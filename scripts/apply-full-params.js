@@ -2,6 +2,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { ROOT, DATA_FILE, saveServices } = require('./aws-data');
 
 console.log('🔄 Applying Full Parameter Data\n');
 
@@ -14,38 +15,11 @@ const totalParams = fullData.reduce((sum, s) =>
   sum + s.commands.reduce((cmdSum, c) => cmdSum + c.parameters.length, 0), 0);
 console.log(`   Parameters: ${totalParams}\n`);
 
-// Generate TypeScript file
-const tsContent = `// AWS CLI command structure
-export interface CommandParameter {
-  name: string;
-  description?: string;
-}
-
-export interface Command {
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}
-
-export interface Service {
-  name: string;
-  description?: string;
-  commands: Command[];
-}
-
-// AWS CLI data structure
-export const awsServices: Service[] = ${JSON.stringify(fullData, null, 2)};
-`;
-
-// Backup current file
-const currentPath = path.join(__dirname, '..', 'lib', 'aws-commands.ts');
-const backupPath = path.join(__dirname, '..', '.dev-data', `aws-commands.backup-before-full-params.ts`);
-fs.copyFileSync(currentPath, backupPath);
+// Apply new data (with backup)
+const backupPath = path.join(ROOT, '.dev-data', `aws-commands.backup-before-full-params.json`);
+saveServices(fullData, DATA_FILE, { backup: backupPath });
 console.log(`💾 Backup saved to: ${backupPath}`);
-
-// Apply new data
-fs.writeFileSync(currentPath, tsContent);
-console.log(`💾 Applied to: ${currentPath}\n`);
+console.log(`💾 Applied to: ${DATA_FILE}\n`);
 
 // Final statistics
 console.log(`📊 Final Statistics:`);
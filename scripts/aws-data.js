@@ -0,0 +1,348 @@
+// AWS CLI data store (Node side of scripts/aws_data.py)
+// lib/aws-commands.json is the source of truth; lib/aws-commands.ts is generated
+// from it and only re-exports the JSON with its TypeScript types. Global
+// parameters are stored once in globalParameters and referenced by index from
+// each command; saveServices() interns them and loadServices() expands them.
+// The optional string-table form (every distinct string stored once, records as
+// index arrays) is described in aws_data.py, as are the per-service shards and
+// manifest written for lazy loading.
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+const DATA_FILE = path.join(ROOT, 'lib', 'aws-commands.json');
+const TS_FILE = path.join(ROOT, 'lib', 'aws-commands.ts');
+const MANIFEST_FILE = path.join(ROOT, 'lib', 'aws-manifest.json');
+const SHARD_DIR = path.join(ROOT, 'public', 'data', 'services');
+
+const PACKED_FORMAT = 'string-table';
+
+const LEGACY_ARRAY_PATTERN = /export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);/;
+
+// Options the CLI adds to every command (plus the generated input/skeleton and
+// pagination options); these are interned into globalParameters
+const GLOBAL_PARAMETER_NAMES = new Set([
+  '--debug', '--endpoint-url', '--no-verify-ssl', '--no-paginate', '--output', '--query',
+  '--profile', '--region', '--version', '--color', '--no-sign-request', '--ca-bundle',
+  '--cli-read-timeout', '--cli-connect-timeout', '--cli-binary-format', '--no-cli-pager',
+  '--cli-auto-prompt', '--no-cli-auto-prompt', '--cli-input-json', '--cli-input-yaml',
+  '--generate-cli-skeleton', '--starting-token', '--page-size', '--max-items'
+]);
+
+// Strings pass through untouched; bare object keys get quoted, line comments and
+// trailing commas are dropped
+const JS_LITERAL_TOKEN = /("(?:\\.|[^"\\])*")|([A-Za-z_$][\w$]*)(?=\s*:)|\/\/[^\n]*|,(?=(?:\s|\/\/[^\n]*)*[\]}])/g;
+
+function jsLiteralToJson(literal) {
+  return literal.replace(JS_LITERAL_TOKEN, (match, string, key) => {
+    if (string !== undefined) return string;
+    if (key !== undefined) return `"${key}"`;
+    return '';
+  });
+}
+
+// Read the awsServices array out of a TS module that inlines the data (no eval)
+function loadLegacyTs(file = TS_FILE) {
+  const match = fs.readFileSync(file, 'utf8').match(LEGACY_ARRAY_PATTERN);
+  if (!match) {
+    throw new Error(`No inline awsServices array in ${file}`);
+  }
+  try {
+    return JSON.parse(match[1]);
+  } catch (e) {
+    // Hand-written files use JS object syntax (unquoted keys, trailing commas)
+    return JSON.parse(jsLiteralToJson(match[1]));
+  }
+}
+
+function isGlobalParameter(param) {
+  return GLOBAL_PARAMETER_NAMES.has(param.name.split(' ')[0]);
+}
+
+// Services list -> stored form, with each distinct global parameter kept once
+function internGlobals(data) {
+  const table = [];
+  const index = new Map();
+  const services = data.map(service => ({
+    ...service,
+    commands: service.commands.map(command => {
+      if (!command.parameters) return command;
+      const refs = command.parameters.map(param => {
+        if (!isGlobalParameter(param)) return param;
+        // Keys sorted like aws_data.py, so key order doesn't split entries
+        const key = JSON.stringify(param, Object.keys(param).sort());
+        if (!index.has(key)) {
+          index.set(key, table.length);
+          table.push(param);
+        }
+        return index.get(key);
+      });
+      return { ...command, parameters: refs };
+    })
+  }));
+  return { globalParameters: table, services };
+}
+
+// Stored form -> services list (plain arrays from older files pass through)
+function expandGlobals(stored) {
+  if (Array.isArray(stored)) return stored;
+  const table = stored.globalParameters;
+  for (const service of stored.services) {
+    for (const command of service.commands) {
+      if (command.parameters) {
+        command.parameters = command.parameters.map(p => typeof p === 'number' ? { ...table[p] } : p);
+      }
+    }
+  }
+  return stored.services;
+}
+
+function packedFields(record, fields) {
+  const extra = Object.keys(record).filter(key => !fields.includes(key));
+  if (extra.length > 0) {
+    throw new Error(`String-table format cannot store ${extra.sort().join(', ')} on ${record.name}`);
+  }
+}
+
+// Stored form -> string-table form (most frequent strings get the smallest indexes)
+function packStrings(stored) {
+  const counts = new Map();
+  const count = values => {
+    for (const value of values) {
+      if (value !== undefined && value !== null) counts.set(value, (counts.get(value) || 0) + 1);
+    }
+  };
+  stored.globalParameters.forEach(param => count(Object.values(param)));
+  for (const service of stored.services) {
+    count([service.name, service.description]);
+    for (const command of service.commands) {
+      count([command.name, command.description]);
+      (command.parameters || []).forEach(param => {
+        if (typeof param !== 'number') count(Object.values(param));
+      });
+    }
+  }
+
+  const strings = [...counts.entries()].sort((a, b) => b[1] - a[1]).map(([string]) => string);
+  const index = new Map(strings.map((string, i) => [string, i]));
+  const describe = record => record.description != null ? index.get(record.description) : -1;
+
+  const packParam = param => {
+    packedFields(param, ['name', 'description']);
+    const packed = [index.get(param.name)];
+    if (param.description != null) packed.push(index.get(param.description));
+    return packed;
+  };
+
+  const packCommand = command => {
+    packedFields(command, ['name', 'description', 'parameters']);
+    const packed = [index.get(command.name), describe(command)];
+    if (command.parameters) {
+      packed.push(command.parameters.map(p => typeof p === 'number' ? p : packParam(p)));
+    }
+    return packed;
+  };
+
+  return {
+    format: PACKED_FORMAT,
+    strings,
+    globalParameters: stored.globalParameters.map(packParam),
+    services: stored.services.map(service => {
+      packedFields(service, ['name', 'description', 'commands']);
+      return [index.get(service.name), describe(service), service.commands.map(packCommand)];
+    })
+  };
+}
+
+// String-table form -> stored form (globals stay interned)
+function unpackStrings(packed) {
+  const { strings } = packed;
+  const record = (name, description) =>
+    description >= 0 ? { name: strings[name], description: strings[description] } : { name: strings[name] };
+  const unpackParam = param => record(param[0], param.length > 1 ? param[1] : -1);
+
+  return {
+    globalParameters: packed.globalParameters.map(unpackParam),
+    services: packed.services.map(([name, description, commands]) => ({
+      ...record(name, description),
+      commands: commands.map(command => {
+        const unpacked = record(command[0], command[1]);
+        if (command.length > 2) {
+          unpacked.parameters = command[2].map(p => typeof p === 'number' ? p : unpackParam(p));
+        }
+        return unpacked;
+      })
+    }))
+  };
+}
+
+// Whether the JSON store at file uses the string-table form
+function isPacked(file) {
+  if (!fs.existsSync(file)) return false;
+  const fd = fs.openSync(file, 'r');
+  const head = Buffer.alloc(64);
+  const bytes = fs.readSync(fd, head, 0, 64, 0);
+  fs.closeSync(fd);
+  return head.toString('utf8', 0, bytes).includes(`"format":"${PACKED_FORMAT}"`);
+}
+
+// Load the services list from the JSON store (or, before migration, the TS module)
+function loadServices(file = DATA_FILE) {
+  if (fs.existsSync(file)) {
+    let stored = JSON.parse(fs.readFileSync(file, 'utf8'));
+    if (!Array.isArray(stored) && stored.format === PACKED_FORMAT) {
+      stored = unpackStrings(stored);
+    }
+    return expandGlobals(stored);
+  }
+  const legacyFile = file.replace(/\.json$/, '.ts');
+  if (fs.existsSync(legacyFile)) {
+    return loadLegacyTs(legacyFile);
+  }
+  throw new Error(`No data at ${file} (or ${legacyFile})`);
+}
+
+// TS module that types and re-exports a JSON data file
+function generateTypeScript(file = DATA_FILE) {
+  const jsonName = path.basename(file);
+  return `// AWS CLI command structure
+// Generated from ${jsonName} by scripts/aws_data.py - edit the JSON, not this file
+import data from './${jsonName}';
+import { expandServices, type AwsData } from './aws-parameters';
+
+export interface CommandParameter {
+  name: string;
+  description?: string;
+}
+
+export interface Command {
+  name: string;
+  description?: string;
+  parameters: CommandParameter[];
+}
+
+export interface Service {
+  name: string;
+  description?: string;
+  commands: Command[];
+}
+
+// AWS CLI data structure (global parameters are resolved lazily per command)
+const expanded = expandServices(data as unknown as AwsData);
+
+export const awsServices: Service[] = expanded.services;
+export const globalParameters: CommandParameter[] = expanded.globalParameters;
+`;
+}
+
+function writeAtomic(file, content) {
+  fs.writeFileSync(`${file}.tmp`, content);
+  fs.renameSync(`${file}.tmp`, file);
+}
+
+// One service in stored (or string-table) form, as written to its shard
+function shardContent(service, packed = false) {
+  const stored = internGlobals([service]);
+  return JSON.stringify(packed ? packStrings(stored) : stored);
+}
+
+// Write one content-hashed file per service plus the manifest (and delete shards
+// no longer in it); returns the manifest. packed writes the shards in
+// string-table form (saveServices() follows the store).
+function writeShards(data, manifestFile = MANIFEST_FILE, shardDir = SHARD_DIR, packed = false) {
+  fs.mkdirSync(shardDir, { recursive: true });
+  const current = new Set();
+  const services = data.map(service => {
+    const content = shardContent(service, packed);
+    const hash = crypto.createHash('sha256').update(content, 'utf8').digest('hex').slice(0, 12);
+    const fileName = `${service.name}.${hash}.json`;
+    current.add(fileName);
+    // Same name means same content, so existing shards are left alone
+    const shardFile = path.join(shardDir, fileName);
+    if (!fs.existsSync(shardFile)) writeAtomic(shardFile, content);
+
+    const entry = { name: service.name };
+    if (service.description !== undefined) entry.description = service.description;
+    entry.hash = hash;
+    entry.commands = service.commands.map(command => command.name);
+    return entry;
+  });
+
+  // Any added, removed or changed service changes the version
+  const versionSource = JSON.stringify(services.map(entry => [entry.name, entry.hash]));
+  const manifest = {
+    version: crypto.createHash('sha256').update(versionSource, 'utf8').digest('hex').slice(0, 12),
+    services
+  };
+
+  for (const fileName of fs.readdirSync(shardDir)) {
+    if (fileName.endsWith('.json') && !current.has(fileName)) {
+      fs.unlinkSync(path.join(shardDir, fileName));
+    }
+  }
+
+  fs.mkdirSync(path.dirname(manifestFile), { recursive: true });
+  writeAtomic(manifestFile, JSON.stringify(manifest) + '\n');
+  return manifest;
+}
+
+// Write the services list (globals interned) to the JSON store and regenerate its TS module.
+// options.backup copies the current JSON there first; options.packed writes the
+// string-table form (default: whatever form the file has now); options.shards also
+// writes the per-service shards and manifest (default: only for the main store).
+function saveServices(data, file = DATA_FILE, options = {}) {
+  const { backup = null, typescript = true } = options;
+  const packed = options.packed ?? isPacked(file);
+  const shards = options.shards ?? (typescript && path.resolve(file) === DATA_FILE);
+  if (backup) {
+    const tsFile = file.replace(/\.json$/, '.ts');
+    fs.mkdirSync(path.dirname(backup), { recursive: true });
+    if (fs.existsSync(file)) {
+      fs.copyFileSync(file, backup);
+    } else if (typescript && fs.existsSync(tsFile)) {
+      // First save after the legacy TS fallback: that file is about to be replaced
+      fs.copyFileSync(tsFile, backup.replace(/\.json$/, '.ts'));
+    }
+  }
+
+  fs.mkdirSync(path.dirname(file), { recursive: true });
+  const stored = internGlobals(data);
+  // Compact, byte for byte what aws_data.py writes
+  writeAtomic(file, JSON.stringify(packed ? packStrings(stored) : stored) + '\n');
+
+  if (typescript) {
+    writeAtomic(file.replace(/\.json$/, '.ts'), generateTypeScript(file));
+  }
+
+  if (shards) {
+    writeShards(data, MANIFEST_FILE, SHARD_DIR, packed);
+  }
+}
+
+function dataStats(data) {
+  const commands = data.reduce((sum, s) => sum + s.commands.length, 0);
+  const parameters = data.reduce((sum, s) =>
+    sum + s.commands.reduce((cmdSum, c) => cmdSum + (c.parameters?.length || 0), 0), 0);
+  return `${data.length} services, ${commands} commands, ${parameters} parameters`;
+}
+
+module.exports = {
+  ROOT,
+  DATA_FILE,
+  TS_FILE,
+  MANIFEST_FILE,
+  SHARD_DIR,
+  loadLegacyTs,
+  internGlobals,
+  expandGlobals,
+  packStrings,
+  unpackStrings,
+  isPacked,
+  loadServices,
+  generateTypeScript,
+  writeShards,
+  saveServices,
+  dataStats
+};
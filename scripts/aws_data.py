@@ -0,0 +1,431 @@
+"""
+AWS CLI data store
+lib/aws-commands.json is the source of truth for the services/commands/parameters
+data. Scripts load and save it through this module; lib/aws-commands.ts is
+generated from it and only re-exports the JSON with its TypeScript types.
+
+Global options (--debug, --region, --cli-input-json, ...) repeat in nearly every
+command, so the file stores each distinct one once:
+
+    {"globalParameters": [{"name": "--debug", ...}, ...],
+     "services": [{"name": ..., "commands": [{"name": ..., "parameters": [{...}, 0, 3]}]}]}
+
+An integer in a parameters list is an index into globalParameters. save_services()
+interns and load_services() expands, so scripts only ever see plain lists.
+
+The file can also be kept in string-table form, where every distinct string is
+stored once and records become arrays of indexes into it:
+
+    {"format": "string-table", "strings": ["--debug", ...],
+     "globalParameters": [[0, 1], ...],
+     "services": [[name, description, [[name, description, [[name, description], 0]]]]]}
+
+A description of -1 means none; a parameter [name] has no description. Saving
+keeps whichever form the file already uses. Switch with:
+
+    python3 scripts/aws_data.py --format packed   # or: --format plain
+
+Saving the main store also splits it per service for lazy loading in the
+browser: public/data/services/<service>.<hash>.json holds one service in the
+stored form above, and lib/aws-manifest.json lists every service with its
+command names and shard hash, plus a version that changes with any shard:
+
+    {"version": "b71c...", "services": [{"name": "ec2", "description": ..., "hash": "3f9a...",
+                                          "commands": ["describe-instances", ...]}]}
+
+Search only needs the manifest; a shard is fetched when one of its commands is
+opened. Shards are named by content hash, so they can be cached forever.
+Regenerate them without touching the store with:
+
+    python3 scripts/aws_data.py --shards
+
+A tree that still only has the old lib/aws-commands.ts (with the data inlined)
+is read once as a fallback, without eval. Convert it for good with:
+
+    python3 scripts/aws_data.py --migrate
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from collections import Counter
+from typing import Dict, List, Optional
+
+from tracing import span, traced
+
+DATA_FILE = os.path.join('lib', 'aws-commands.json')
+TS_FILE = os.path.join('lib', 'aws-commands.ts')
+MANIFEST_FILE = os.path.join('lib', 'aws-manifest.json')
+SHARD_DIR = os.path.join('public', 'data', 'services')
+
+PACKED_FORMAT = 'string-table'
+
+LEGACY_ARRAY_PATTERN = re.compile(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);')
+
+# Strings pass through untouched; bare object keys get quoted, line comments and
+# trailing commas are dropped
+JS_LITERAL_TOKEN = re.compile(r'("(?:\\.|[^"\\])*")|([A-Za-z_$][\w$]*)(?=\s*:)|//[^\n]*|,(?=(?:\s|//[^\n]*)*[\]}])')
+
+# Options the CLI adds to every command (plus the generated input/skeleton and
+# pagination options); these are interned into globalParameters
+GLOBAL_PARAMETER_NAMES = frozenset([
+    '--debug', '--endpoint-url', '--no-verify-ssl', '--no-paginate', '--output', '--query',
+    '--profile', '--region', '--version', '--color', '--no-sign-request', '--ca-bundle',
+    '--cli-read-timeout', '--cli-connect-timeout', '--cli-binary-format', '--no-cli-pager',
+    '--cli-auto-prompt', '--no-cli-auto-prompt', '--cli-input-json', '--cli-input-yaml',
+    '--generate-cli-skeleton', '--starting-token', '--page-size', '--max-items',
+])
+
+TS_TEMPLATE = """// AWS CLI command structure
+// Generated from {json_name} by scripts/aws_data.py - edit the JSON, not this file
+import data from './{json_name}';
+import {{ expandServices, type AwsData }} from './aws-parameters';
+
+export interface CommandParameter {{
+  name: string;
+  description?: string;
+}}
+
+export interface Command {{
+  name: string;
+  description?: string;
+  parameters: CommandParameter[];
+}}
+
+export interface Service {{
+  name: string;
+  description?: string;
+  commands: Command[];
+}}
+
+// AWS CLI data structure (global parameters are resolved lazily per command)
+const expanded = expandServices(data as unknown as AwsData);
+
+export const awsServices: Service[] = expanded.services;
+export const globalParameters: CommandParameter[] = expanded.globalParameters;
+"""
+
+
+def _js_literal_to_json(literal: str) -> str:
+    def replace(match):
+        if match.group(1) is not None:
+            return match.group(1)
+        if match.group(2) is not None:
+            return f'"{match.group(2)}"'
+        return ''
+    return JS_LITERAL_TOKEN.sub(replace, literal)
+
+
+@traced('load_legacy_ts', 'data')
+def load_legacy_ts(path: str = TS_FILE) -> List[Dict]:
+    """Read the awsServices array out of a TS module that inlines the data"""
+    with open(path, 'r') as f:
+        content = f.read()
+    match = LEGACY_ARRAY_PATTERN.search(content)
+    if not match:
+        raise ValueError(f"No inline awsServices array in {path}")
+    literal = match.group(1)
+    try:
+        return json.loads(literal)
+    except ValueError:
+        # Hand-written files use JS object syntax (unquoted keys, trailing commas)
+        return json.loads(_js_literal_to_json(literal))
+
+
+def is_global_parameter(param: Dict) -> bool:
+    return param['name'].split(' ', 1)[0] in GLOBAL_PARAMETER_NAMES
+
+
+@traced('intern_globals', 'data')
+def intern_globals(data: List[Dict]) -> Dict:
+    """Services list -> stored form, with each distinct global parameter kept once"""
+    table: List[Dict] = []
+    index: Dict[str, int] = {}
+    services = []
+    for service in data:
+        commands = []
+        for command in service['commands']:
+            if 'parameters' in command:
+                refs = []
+                for param in command['parameters']:
+                    if not is_global_parameter(param):
+                        refs.append(param)
+                        continue
+                    # Keys sorted so key order doesn't split entries (aws-data.js does the same)
+                    key = json.dumps(param, sort_keys=True)
+                    if key not in index:
+                        index[key] = len(table)
+                        table.append(param)
+                    refs.append(index[key])
+                command = {**command, 'parameters': refs}
+            commands.append(command)
+        services.append({**service, 'commands': commands})
+    return {'globalParameters': table, 'services': services}
+
+
+@traced('expand_globals', 'data')
+def expand_globals(stored) -> List[Dict]:
+    """Stored form -> services list (plain lists from older files pass through)"""
+    if isinstance(stored, list):
+        return stored
+    table = stored['globalParameters']
+    for service in stored['services']:
+        for command in service['commands']:
+            if 'parameters' in command:
+                command['parameters'] = [dict(table[p]) if isinstance(p, int) else p
+                                         for p in command['parameters']]
+    return stored['services']
+
+
+def _packed_fields(record: Dict, fields: tuple) -> None:
+    extra = set(record) - set(fields)
+    if extra:
+        raise ValueError(f"String-table format cannot store {sorted(extra)} on {record.get('name')}")
+
+
+@traced('pack_strings', 'data')
+def pack_strings(stored: Dict) -> Dict:
+    """Stored form -> string-table form (most frequent strings get the smallest indexes)"""
+    counts: Counter = Counter()
+    for param in stored['globalParameters']:
+        counts.update(param.values())
+    for service in stored['services']:
+        counts.update((service['name'], service.get('description')))
+        for command in service['commands']:
+            counts.update((command['name'], command.get('description')))
+            for param in command.get('parameters', []):
+                if not isinstance(param, int):
+                    counts.update(param.values())
+    counts.pop(None, None)
+
+    strings = [string for string, _ in counts.most_common()]
+    index = {string: i for i, string in enumerate(strings)}
+
+    def describe(record: Dict) -> int:
+        return index[record['description']] if record.get('description') is not None else -1
+
+    def pack_param(param: Dict) -> List[int]:
+        _packed_fields(param, ('name', 'description'))
+        packed = [index[param['name']]]
+        if param.get('description') is not None:
+            packed.append(index[param['description']])
+        return packed
+
+    def pack_command(command: Dict) -> List:
+        _packed_fields(command, ('name', 'description', 'parameters'))
+        packed = [index[command['name']], describe(command)]
+        if 'parameters' in command:
+            packed.append([p if isinstance(p, int) else pack_param(p) for p in command['parameters']])
+        return packed
+
+    services = []
+    for service in stored['services']:
+        _packed_fields(service, ('name', 'description', 'commands'))
+        services.append([index[service['name']], describe(service),
+                         [pack_command(command) for command in service['commands']]])
+
+    return {
+        'format': PACKED_FORMAT,
+        'strings': strings,
+        'globalParameters': [pack_param(param) for param in stored['globalParameters']],
+        'services': services
+    }
+
+
+@traced('unpack_strings', 'data')
+def unpack_strings(packed: Dict) -> Dict:
+    """String-table form -> stored form (globals stay interned)"""
+    strings = packed['strings']
+
+    def record(name: int, description: int) -> Dict:
+        result = {'name': strings[name]}
+        if description >= 0:
+            result['description'] = strings[description]
+        return result
+
+    def unpack_param(param: List[int]) -> Dict:
+        return record(param[0], param[1] if len(param) > 1 else -1)
+
+    services = []
+    for name, description, commands in packed['services']:
+        service = record(name, description)
+        service['commands'] = []
+        for command in commands:
+            unpacked = record(command[0], command[1])
+            if len(command) > 2:
+                unpacked['parameters'] = [p if isinstance(p, int) else unpack_param(p) for p in command[2]]
+            service['commands'].append(unpacked)
+        services.append(service)
+
+    return {'globalParameters': [unpack_param(param) for param in packed['globalParameters']],
+            'services': services}
+
+
+def is_packed(path: str) -> bool:
+    """Whether the JSON store at path uses the string-table form"""
+    if not os.path.exists(path):
+        return False
+    with open(path, 'r') as f:
+        return f'"format":"{PACKED_FORMAT}"' in f.read(64)
+
+
+def load_services(path: str = DATA_FILE) -> List[Dict]:
+    """Load the services list from the JSON store (or, before migration, the TS module)"""
+    if os.path.exists(path):
+        with span('json.load', 'io', path=path), open(path, 'r') as f:
+            stored = json.load(f)
+        if isinstance(stored, dict) and stored.get('format') == PACKED_FORMAT:
+            stored = unpack_strings(stored)
+        return expand_globals(stored)
+
+    legacy_path = os.path.splitext(path)[0] + '.ts'
+    if os.path.exists(legacy_path):
+        return load_legacy_ts(legacy_path)
+
+    raise FileNotFoundError(f"No data at {path} (or {legacy_path})")
+
+
+def generate_typescript(json_path: str = DATA_FILE) -> str:
+    """TS module that types and re-exports a JSON data file"""
+    return TS_TEMPLATE.format(json_name=os.path.basename(json_path))
+
+
+def _write_atomic(path: str, content: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def shard_content(service: Dict, packed: bool = False) -> str:
+    """One service in stored (or string-table) form, as written to its shard"""
+    stored = intern_globals([service])
+    if packed:
+        stored = pack_strings(stored)
+    # ensure_ascii off so the bytes (and hash) match aws-data.js
+    return json.dumps(stored, separators=(',', ':'), ensure_ascii=False)
+
+
+@traced('write_shards', 'data')
+def write_shards(data: List[Dict], manifest_path: str = MANIFEST_FILE, shard_dir: str = SHARD_DIR,
+                 packed: bool = False) -> Dict:
+    """Write one content-hashed file per service plus the manifest; returns the manifest
+
+    packed: write the shards in string-table form (save_services() follows the store)
+    Shards no longer in the manifest are deleted.
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    services = []
+    current = set()
+    for service in data:
+        content = shard_content(service, packed)
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+        file_name = f"{service['name']}.{digest}.json"
+        current.add(file_name)
+        shard_path = os.path.join(shard_dir, file_name)
+        # Same name means same content, so existing shards are left alone
+        if not os.path.exists(shard_path):
+            _write_atomic(shard_path, content)
+
+        entry = {'name': service['name']}
+        if 'description' in service:
+            entry['description'] = service['description']
+        entry['hash'] = digest
+        entry['commands'] = [command['name'] for command in service['commands']]
+        services.append(entry)
+
+    for file_name in os.listdir(shard_dir):
+        if file_name.endswith('.json') and file_name not in current:
+            os.remove(os.path.join(shard_dir, file_name))
+
+    # Any added, removed or changed service changes the version
+    version_source = json.dumps([[entry['name'], entry['hash']] for entry in services],
+                                separators=(',', ':'), ensure_ascii=False)
+    manifest = {'version': hashlib.sha256(version_source.encode('utf-8')).hexdigest()[:12], 'services': services}
+
+    os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+    _write_atomic(manifest_path, json.dumps(manifest, separators=(',', ':'), ensure_ascii=False) + '\n')
+    return manifest
+
+
+def save_services(data: List[Dict], path: str = DATA_FILE, backup: Optional[str] = None,
+                  typescript: bool = True, packed: Optional[bool] = None,
+                  shards: Optional[bool] = None) -> None:
+    """Write the services list (globals interned) to the JSON store and regenerate its TS module
+
+    backup: copy the current JSON here first (e.g. '.dev-data/aws-commands.backup-before-x.json')
+    packed: write the string-table form (default: whatever form the file has now)
+    shards: also write the per-service shards and manifest (default: only for the main store)
+    """
+    if packed is None:
+        packed = is_packed(path)
+    if shards is None:
+        shards = typescript and os.path.abspath(path) == os.path.abspath(DATA_FILE)
+
+    if backup:
+        ts_path = os.path.splitext(path)[0] + '.ts'
+        os.makedirs(os.path.dirname(backup) or '.', exist_ok=True)
+        if os.path.exists(path):
+            shutil.copy(path, backup)
+        elif typescript and os.path.exists(ts_path):
+            # First save after the legacy TS fallback: that file is about to be replaced
+            shutil.copy(ts_path, os.path.splitext(backup)[0] + '.ts')
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    stored = intern_globals(data)
+    if packed:
+        stored = pack_strings(stored)
+    with span('json.dumps', 'io', packed=packed):
+        # Compact and unescaped, byte for byte what aws-data.js writes
+        content = json.dumps(stored, separators=(',', ':'), ensure_ascii=False)
+    with span('write', 'io', path=path, bytes=len(content)):
+        _write_atomic(path, content + '\n')
+
+    if typescript:
+        _write_atomic(os.path.splitext(path)[0] + '.ts', generate_typescript(path))
+
+    if shards:
+        write_shards(data, packed=packed)
+
+
+def data_stats(data: List[Dict]) -> str:
+    """'N services, N commands, N parameters'"""
+    commands = sum(len(s['commands']) for s in data)
+    parameters = sum(sum(len(c.get('parameters', [])) for c in s['commands']) for s in data)
+    return f"{len(data)} services, {commands} commands, {parameters} parameters"
+
+
+if __name__ == "__main__":
+    if '--format' in sys.argv:
+        target = sys.argv[sys.argv.index('--format') + 1]
+        if target not in ('packed', 'plain'):
+            print("❌ --format takes 'packed' or 'plain'")
+            sys.exit(1)
+        services = load_services()
+        before = os.path.getsize(DATA_FILE) if os.path.exists(DATA_FILE) else 0
+        save_services(services, packed=(target == 'packed'))
+        print(f"✅ {DATA_FILE}: {before / 1024:.0f} KB -> {os.path.getsize(DATA_FILE) / 1024:.0f} KB ({target})")
+        sys.exit(0)
+
+    if '--shards' in sys.argv:
+        manifest = write_shards(load_services(), packed=is_packed(DATA_FILE))
+        print(f"✅ {len(manifest['services'])} shards in {SHARD_DIR}, manifest "
+              f"{MANIFEST_FILE} ({os.path.getsize(MANIFEST_FILE) / 1024:.0f} KB)")
+        sys.exit(0)
+
+    if '--migrate' not in sys.argv:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    source = sys.argv[sys.argv.index('--migrate') + 1] if len(sys.argv) > sys.argv.index('--migrate') + 1 else TS_FILE
+    print(f"📦 Migrating {source} -> {DATA_FILE}")
+    services = load_legacy_ts(source)
+    if os.path.abspath(source) == os.path.abspath(TS_FILE):
+        os.makedirs('.dev-data', exist_ok=True)
+        shutil.copy(TS_FILE, os.path.join('.dev-data', 'aws-commands.backup-before-json.ts'))
+    save_services(services)
+    print(f"✅ {data_stats(services)}")
+    print(f"💾 Saved {DATA_FILE} and regenerated {TS_FILE}, {MANIFEST_FILE} and {SHARD_DIR}")
@@ -0,0 +1,128 @@
+"""
+Shared AWS CLI help runner
+Fetches `aws <service> <command> help` output for the extraction scripts,
+consulting the on-disk help cache (see help_cache.py) before spawning `aws`.
+Commands run through the shared AsyncCommandRunner (see aws_runner.py), so they
+get bounded concurrency, adaptive timeouts and retries.
+
+Environment:
+    AWS_CLI=command           what to run instead of `aws`, e.g. "python3 scripts/fake-aws.py"
+    AWS_HELP_CACHE=off        disable the help cache
+    AWS_HELP_CACHE_DIR=path   cache location (default: .dev-data/help-cache)
+    AWS_HELP_CACHE_MAX_MB=N   cache size budget before LRU eviction (default: 256)
+    AWS_RUNNER_JOBS=N         concurrent `aws` processes (default: CPU count)
+    AWS_TRACE=path            record a Chrome trace of the run (see tracing.py)
+"""
+
+import os
+import re
+import shlex
+import subprocess
+import threading
+from typing import List, Optional
+
+from aws_runner import AsyncCommandRunner
+from help_cache import HelpCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+from tracing import mark, span, traced
+
+# Pattern: X\x08X is how the man renderer prints bold text
+BOLD_PATTERN = re.compile(r'(.)\x08\1')
+
+_version = None
+_cache = None
+_cache_lock = threading.Lock()
+_runner = None
+
+
+def aws_cli() -> List[str]:
+    """Command line prefix that runs the AWS CLI (`aws`, or $AWS_CLI)"""
+    return shlex.split(os.environ.get('AWS_CLI', 'aws'))
+
+
+def aws_env() -> dict:
+    """Environment for running the AWS CLI without a pager"""
+    return {**os.environ, 'AWS_PAGER': ''}
+
+
+@traced('strip_formatting', 'parse')
+def strip_formatting(help_text: str) -> str:
+    """Remove terminal formatting characters (backspace codes for bold text)"""
+    return BOLD_PATTERN.sub(r'\1', help_text)
+
+
+def get_awscli_version() -> str:
+    """Installed AWS CLI version string, e.g. 'aws-cli/2.15.0' ('' if unknown)"""
+    global _version
+    if _version is None:
+        try:
+            result = subprocess.run(
+                [*aws_cli(), '--version'],
+                capture_output=True,
+                text=True,
+                timeout=15,
+                env=aws_env()
+            )
+            # v1 prints the version on stderr, v2 on stdout
+            output = (result.stdout or result.stderr).strip()
+            _version = output.split()[0] if output else ''
+        except Exception:
+            _version = ''
+    return _version
+
+
+def get_help_cache() -> Optional[HelpCache]:
+    """Shared help cache instance, or None if disabled via AWS_HELP_CACHE=off"""
+    global _cache
+    if os.environ.get('AWS_HELP_CACHE', '').lower() in ('0', 'off', 'false', 'no'):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            max_mb = os.environ.get('AWS_HELP_CACHE_MAX_MB')
+            _cache = HelpCache(
+                root=os.environ.get('AWS_HELP_CACHE_DIR', DEFAULT_CACHE_DIR),
+                max_bytes=int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES
+            )
+    return _cache
+
+
+def get_runner() -> AsyncCommandRunner:
+    """Shared runner instance (set .concurrency before the first command runs)"""
+    global _runner
+    with _cache_lock:
+        if _runner is None:
+            jobs = os.environ.get('AWS_RUNNER_JOBS')
+            _runner = AsyncCommandRunner(
+                concurrency=int(jobs) if jobs else (os.cpu_count() or 4),
+                env=aws_env()
+            )
+    return _runner
+
+
+async def fetch_help_async(runner: AsyncCommandRunner, service: str, command: str) -> str:
+    """Get AWS CLI help output for a command ('' if it failed after retries)"""
+    cache = get_help_cache()
+    # Without a known CLI version we can't key the cache safely
+    version = get_awscli_version() if cache else ''
+
+    if cache and version:
+        with span('cache get', 'cache', command=f"{service} {command}"):
+            cached = cache.get(version, service, command)
+        if cached is not None:
+            mark('cache hit', 'cache', command=f"{service} {command}")
+            return strip_formatting(cached)
+
+    raw_text = await runner.run([*aws_cli(), service, command, 'help'])
+    if not raw_text:
+        return ""
+
+    if cache and version:
+        with span('cache put', 'cache', command=f"{service} {command}"):
+            cache.put(version, service, command, raw_text)
+
+    return strip_formatting(raw_text)
+
+
+def run_aws_help(service: str, command: str) -> str:
+    """Get AWS CLI help output for a command ('' on error or repeated timeouts)"""
+    runner = get_runner()
+    return runner.submit(fetch_help_async(runner, service, command)).result()
@@ -0,0 +1,203 @@
+"""
+Async AWS CLI runner
+Shared asyncio subprocess runner for the extraction scripts:
+- a semaphore-limited pool of concurrent `aws` processes
+- per-command latency tracking (p50/p99)
+- timeouts that adapt to the observed p99 instead of a fixed 10/15/30s
+- exponential-backoff retries when a command times out
+- a list of commands that still failed, for the final report
+
+The event loop runs in a background thread, so synchronous scripts can submit
+work with submit()/run_sync() and consume concurrent.futures.Future results in
+whatever order they like.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from tracing import lane, mark, span
+
+
+class AsyncCommandRunner:
+    """Bounded-concurrency subprocess runner with adaptive timeouts and retries"""
+
+    def __init__(self, concurrency: int = 8, initial_timeout: float = 15.0,
+                 min_timeout: float = 5.0, max_timeout: float = 60.0,
+                 timeout_factor: float = 3.0, min_samples: int = 20,
+                 max_retries: int = 3, backoff: float = 0.5, env: Optional[Dict] = None):
+        self.concurrency = concurrency
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_factor = timeout_factor
+        self.min_samples = min_samples
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.env = env if env is not None else {**os.environ, 'AWS_PAGER': ''}
+
+        self.latencies: List[float] = []
+        self.failures: List[Dict] = []
+        self.retries = 0
+
+        self._semaphore = None
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        # Live `aws` processes, killed by close()
+        self._processes = set()
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Observed latency percentile in seconds (None before any sample)"""
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+    def current_timeout(self) -> float:
+        """Timeout for the next attempt: a multiple of p99 once enough samples exist"""
+        with self._lock:
+            enough = len(self.latencies) >= self.min_samples
+        if not enough:
+            return self.initial_timeout
+        adaptive = self.percentile(99) * self.timeout_factor
+        return min(self.max_timeout, max(self.min_timeout, adaptive))
+
+    @staticmethod
+    def _kill(process) -> None:
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    def _record_failure(self, args: List[str], reason: str, attempts: int) -> None:
+        with self._lock:
+            self.failures.append({'command': ' '.join(args), 'reason': reason, 'attempts': attempts})
+
+    async def run(self, args: List[str]) -> Optional[str]:
+        """Run a command and return its stdout, or None if it ultimately failed"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        reason = 'not run'
+        attempt = 0
+        command = ' '.join(args)
+        async with self._semaphore:
+            with lane() as tid:
+                for attempt in range(self.max_retries + 1):
+                    # Give each retry more headroom than the last
+                    timeout = min(self.max_timeout, self.current_timeout() * (2 ** attempt))
+                    started = time.monotonic()
+                    try:
+                        with span('spawn', 'subprocess', tid=tid, command=command):
+                            process = await asyncio.create_subprocess_exec(
+                                *args,
+                                stdout=asyncio.subprocess.PIPE,
+                                stderr=asyncio.subprocess.PIPE,
+                                env=self.env,
+                                # Own process group, so a timeout also kills the groff/pager
+                                # children `aws help` spawns (they hold our pipes open)
+                                start_new_session=(os.name == 'posix')
+                            )
+                    except OSError as e:
+                        reason = str(e)
+                        break
+
+                    self._processes.add(process)
+                    try:
+                        # CLI start-up, help rendering (groff) and reading the output
+                        with span('run', 'subprocess', tid=tid, command=command, attempt=attempt):
+                            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                    except asyncio.TimeoutError:
+                        self._kill(process)
+                        await process.wait()
+                        reason = f"timed out after {timeout:.1f}s"
+                        mark('timeout', 'subprocess', command=command, timeout=timeout)
+                        if attempt < self.max_retries:
+                            with self._lock:
+                                self.retries += 1
+                            with span('backoff', 'subprocess', tid=tid, command=command):
+                                await asyncio.sleep(self.backoff * (2 ** attempt))
+                            continue
+                        break
+                    except asyncio.CancelledError:
+                        # close(): don't leave the process group running
+                        self._kill(process)
+                        await process.wait()
+                        raise
+                    finally:
+                        self._processes.discard(process)
+
+                    with self._lock:
+                        self.latencies.append(time.monotonic() - started)
+
+                    if process.returncode != 0:
+                        # Non-zero exits (unknown command, bad args) are not transient
+                        error = stderr.decode('utf-8', errors='replace').strip().split('\n')[0]
+                        reason = f"exit code {process.returncode}: {error}"
+                        break
+
+                    return stdout.decode('utf-8', errors='replace')
+
+        self._record_failure(args, reason, attempt + 1)
+        return None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='aws-runner', daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def submit(self, coroutine) -> Future:
+        """Schedule a coroutine on the runner's loop from synchronous code"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+
+    def run_sync(self, args: List[str]) -> Optional[str]:
+        """Blocking version of run()"""
+        return self.submit(self.run(args)).result()
+
+    async def _cancel_all(self) -> None:
+        """Kill every live `aws` process group and cancel the other tasks on the loop"""
+        # The children run in their own session, so Ctrl-C never reaches them
+        for process in list(self._processes):
+            self._kill(process)
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self) -> None:
+        """Cancel pending work, kill running `aws` processes and stop the background loop"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+            self._semaphore = None
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._cancel_all(), loop).result(timeout=10)
+            except concurrent.futures.TimeoutError:
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+    def summary(self) -> str:
+        """One-line latency/retry/failure summary"""
+        with self._lock:
+            runs = len(self.latencies)
+        if not runs:
+            return f"0 runs, {self.retries} retries, {len(self.failures)} failures"
+        return (f"{runs} runs, p50 {self.percentile(50):.2f}s, p99 {self.percentile(99):.2f}s, "
+                f"timeout {self.current_timeout():.1f}s, {self.retries} retries, {len(self.failures)} failures")
@@ -0,0 +1,141 @@
+"""
+In-process AWS CLI help backend
+Builds the awscli command table once (the same objects `aws ... help` uses) and
+reads each operation's argument table directly, instead of spawning `aws`,
+loading plugins and rendering the man page through groff for every command.
+
+get_parameters() renders the OPTIONS section in the `aws ... help` layout and
+runs it through parse_parameters(), so both backends produce identical
+{'name', 'description'} entries for the same command.
+"""
+
+import html
+import re
+import threading
+from typing import Dict, List, Optional
+
+from help_parser import parse_parameters
+
+try:
+    # Recent awscli 1.x releases bundle botocore and alias `import botocore` to
+    # their copy once awscli is imported. Importing it before anything else
+    # loads botocore keeps model lookups in this process on the CLI's models.
+    import awscli
+except ImportError:
+    awscli = None
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+PARAGRAPH_PATTERN = re.compile(r'</p>|<br\s*/?>|</li>', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def html_to_text(documentation: str) -> str:
+    """Convert botocore HTML documentation to a single line of plain text"""
+    text = TAG_PATTERN.sub(' ', documentation or '')
+    text = html.unescape(text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def html_to_paragraphs(documentation: str) -> List[str]:
+    """Convert botocore HTML documentation to plain text paragraphs"""
+    paragraphs = [html_to_text(p) for p in PARAGRAPH_PATTERN.split(documentation or '')]
+    return [p for p in paragraphs if p]
+
+
+def _subcommand_table(command) -> Dict:
+    # awscli v2 exposes subcommand_table; v1 only has _get_command_table()
+    table = getattr(command, 'subcommand_table', None)
+    if table is None:
+        table = command._get_command_table()
+    return table
+
+
+class InProcessHelp:
+    """Reads command arguments from an in-process awscli CLIDriver"""
+
+    def __init__(self):
+        from awscli.clidriver import create_clidriver
+        # Same form as aws_help.get_awscli_version()
+        self.version = f"aws-cli/{awscli.__version__}"
+        self._driver = create_clidriver()
+        self._command_table = None
+        self._service_tables = {}
+        # awscli builds argument tables lazily and is not thread-safe
+        self._lock = threading.Lock()
+
+    def _get_service_table(self, service: str) -> Optional[Dict]:
+        if self._command_table is None:
+            self._command_table = self._driver._get_command_table()
+        if service not in self._service_tables:
+            service_command = self._command_table.get(service)
+            self._service_tables[service] = (
+                _subcommand_table(service_command) if service_command is not None else None
+            )
+        return self._service_tables[service]
+
+    def _get_arg_groups(self, service: str, command: str) -> Optional[List[List]]:
+        """Documented named arguments of a command, grouped like the help page"""
+        service_table = self._get_service_table(service)
+        if service_table is None or command not in service_table:
+            return None
+
+        groups = {}
+        for argument in service_table[command].arg_table.values():
+            if getattr(argument, '_UNDOCUMENTED', False) or getattr(argument, 'positional_arg', False):
+                continue
+            # Boolean pairs (--x / --no-x) share a group_name, like the help output
+            group_key = getattr(argument, 'group_name', None) or argument.name
+            groups.setdefault(group_key, []).append(argument)
+        return list(groups.values())
+
+    def command_names(self, service: str) -> Optional[List[str]]:
+        """Names of a service's CLI commands, customizations included, or None if awscli doesn't know the service"""
+        with self._lock:
+            service_table = self._get_service_table(service)
+            if service_table is None:
+                return None
+            return sorted(name for name, command in service_table.items()
+                          if not getattr(command, '_UNDOCUMENTED', False))
+
+    @staticmethod
+    def _documentation(arguments: List) -> str:
+        return next((a.documentation for a in arguments if a.documentation), '')
+
+    def get_parameters(self, service: str, command: str) -> Optional[List[Dict[str, str]]]:
+        """Parameters for a command, or None if awscli doesn't know the command"""
+        options = self.render_options(service, command)
+        return None if options is None else parse_parameters(options)
+
+    def render_options(self, service: str, command: str) -> Optional[str]:
+        """Render the OPTIONS section as plain text in the `aws ... help` layout"""
+        with self._lock:
+            groups = self._get_arg_groups(service, command)
+            if groups is None:
+                return None
+
+            lines = ['OPTIONS']
+            for arguments in groups:
+                names = ' | '.join(f"--{argument.name}" for argument in arguments)
+                lines.append(f"       {names} ({arguments[0].cli_type_name})")
+                for paragraph in html_to_paragraphs(self._documentation(arguments)):
+                    lines.append(f"          {paragraph}")
+                    lines.append('')
+                if lines[-1] != '':
+                    lines.append('')
+            return '\n'.join(lines) + '\n'
+
+
+_instance = None
+_instance_lock = threading.Lock()
+
+
+def get_inprocess_help() -> Optional[InProcessHelp]:
+    """Shared InProcessHelp instance, or None if the awscli package isn't importable"""
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            try:
+                _instance = InProcessHelp()
+            except ImportError:
+                return None
+    return _instance
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Extraction load test
+Fetches help for many commands through the real extraction path
+(aws_help.fetch_help_async on the shared runner, with the help cache) against
+scripts/fake-aws.py, so concurrency, retries and caching can be measured at
+catalog scale without the AWS CLI. Runs a cold pass (empty cache) and a warm
+pass, reports throughput, latency percentiles, retries, failures and cache hits,
+and appends the run to reports/benchmarks/extraction.jsonl.
+
+Latency and faults come from the fake CLI's FAKE_AWS_* variables (see
+fake-aws.py); AWS_CLI may point at another binary.
+
+Usage:
+    python3 scripts/benchmarks/bench-extraction.py                       # Recorded commands
+    python3 scripts/benchmarks/bench-extraction.py --catalog --jobs 32   # Every botocore command
+    FAKE_AWS_LATENCY_MS=300 FAKE_AWS_JITTER_MS=200 FAKE_AWS_HANG_RATE=0.01 \\
+        python3 scripts/benchmarks/bench-extraction.py --limit 2000 --jobs 64
+"""
+
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+RESULTS_FILE = os.path.join('reports', 'benchmarks', 'extraction.jsonl')
+
+
+def option_value(argv: List[str], flag: str, default: str) -> str:
+    return argv[argv.index(flag) + 1] if flag in argv[:-1] else default
+
+
+def list_tasks(catalog: bool, limit: int) -> List[Tuple[str, str]]:
+    """(service, command) pairs to fetch"""
+    if catalog:
+        from botocore_models import get_loader, list_services, load_service_model, cli_command_names
+        loader = get_loader()
+        tasks = [(service, command) for service in list_services(loader)
+                 for command in cli_command_names(load_service_model(loader, service))]
+    else:
+        import gzip
+        corpus = os.path.join(BENCH_DIR, 'corpus', 'help-pages.jsonl.gz')
+        with gzip.open(corpus, 'rt', encoding='utf-8') as f:
+            tasks = [(page['service'], page['command']) for page in map(json.loads, f)]
+    return tasks[:limit] if limit else tasks
+
+
+def run_pass(name: str, tasks: List[Tuple[str, str]], jobs: int) -> Dict:
+    """Fetch every task once on a fresh runner; returns the pass statistics"""
+    import aws_help
+    from aws_runner import AsyncCommandRunner
+
+    runner = AsyncCommandRunner(concurrency=jobs, env=aws_help.aws_env())
+    cache = aws_help.get_help_cache()
+    hits_before, misses_before = cache.hits, cache.misses
+
+    started = time.perf_counter()
+    futures = [runner.submit(aws_help.fetch_help_async(runner, *task)) for task in tasks]
+    empty = sum(1 for future in futures if not future.result())
+    elapsed = time.perf_counter() - started
+    runner.close()
+
+    result = {
+        'seconds': round(elapsed, 3),
+        'commands_per_second': round(len(tasks) / elapsed, 1) if elapsed else None,
+        'runs': len(runner.latencies),
+        'p50_seconds': runner.percentile(50),
+        'p99_seconds': runner.percentile(99),
+        'retries': runner.retries,
+        'failures': len(runner.failures),
+        'empty': empty,
+        'cache_hits': cache.hits - hits_before,
+        'cache_misses': cache.misses - misses_before
+    }
+    print(f"  {name:<5} {elapsed:7.2f}s  {result['commands_per_second']:>8,.1f} cmd/s  "
+          f"{runner.summary()}, {result['cache_hits']} cache hits")
+    return result
+
+
+def main():
+    argv = sys.argv[1:]
+    catalog = '--catalog' in argv
+    jobs = max(1, int(option_value(argv, '--jobs', str(os.cpu_count() or 4))))
+    limit = int(option_value(argv, '--limit', '0'))
+
+    workdir = tempfile.mkdtemp(prefix='bench-extraction-')
+    # Configure the fake CLI and an empty cache before aws_help creates its singletons
+    os.environ.setdefault('AWS_CLI', shlex.join([sys.executable, os.path.join(SCRIPTS_DIR, 'fake-aws.py')]))
+    os.environ['AWS_HELP_CACHE'] = 'on'
+    os.environ['AWS_HELP_CACHE_DIR'] = os.path.join(workdir, 'help-cache')
+    os.environ['FAKE_AWS_STATE_DIR'] = os.path.join(workdir, 'fake-aws')
+    if catalog:
+        os.environ['FAKE_AWS_CATALOG'] = 'botocore'
+
+    try:
+        tasks = list_tasks(catalog, limit)
+        fake_settings = {k: v for k, v in sorted(os.environ.items()) if k.startswith('FAKE_AWS_') and k != 'FAKE_AWS_STATE_DIR'}
+        print(f"🏋️  Extraction load test: {len(tasks)} commands, {jobs} workers")
+        print(f"   AWS_CLI={os.environ['AWS_CLI']}")
+        if fake_settings:
+            print(f"   {' '.join(f'{k}={v}' for k, v in fake_settings.items())}")
+        print()
+
+        # Let the CLI start up once (the fake builds its catalog) outside the timed passes
+        import aws_help
+        subprocess.run([*aws_help.aws_cli(), 'help'], env=aws_help.aws_env(), capture_output=True)
+
+        passes = {'cold': run_pass('cold', tasks, jobs), 'warm': run_pass('warm', tasks, jobs)}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commands': len(tasks),
+        'jobs': jobs,
+        'fake_aws': fake_settings,
+        'passes': passes
+    }
+
+    if '--no-save' not in argv:
+        os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+        with open(RESULTS_FILE, 'a') as f:
+            f.write(json.dumps(run) + '\n')
+        print(f"\n💾 Appended to {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
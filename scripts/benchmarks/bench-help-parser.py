@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Help parser benchmark
+Parses every page of the recorded corpus (see record-help-corpus.py) with
+help_parser.parse_parameters and reports throughput in pages/sec. The best of
+several rounds is kept, and each run is appended to
+reports/benchmarks/help-parser.jsonl so throughput can be tracked over time.
+
+Only a corpus recorded from `aws help` (record-help-corpus.py --source cli)
+measures the parser on real input; any other corpus needs --synthetic.
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from help_parser import parse_parameters
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'help-pages.jsonl.gz')
+RESULTS_FILE = os.path.join('reports', 'benchmarks', 'help-parser.jsonl')
+
+
+def load_corpus():
+    with gzip.open(CORPUS_FILE, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def corpus_source(pages) -> str:
+    """How the pages were recorded: cli (real `aws help`), inprocess (synthetic) or mixed"""
+    sources = {page.get('source', 'unknown') for page in pages}
+    return sources.pop() if len(sources) == 1 else 'mixed'
+
+
+def main():
+    rounds = 5
+    if '--rounds' in sys.argv:
+        rounds = int(sys.argv[sys.argv.index('--rounds') + 1])
+
+    if not os.path.exists(CORPUS_FILE):
+        print(f"❌ No corpus at {CORPUS_FILE}; run record-help-corpus.py first")
+        sys.exit(1)
+
+    corpus = load_corpus()
+    source = corpus_source(corpus)
+    pages = [page['text'] for page in corpus]
+    total_bytes = sum(len(page) for page in pages)
+    print(f"📚 Corpus: {len(pages)} pages, {total_bytes / 1024:.0f} KiB, source {source}\n")
+    if source != 'cli':
+        if '--synthetic' not in sys.argv:
+            print(f"❌ Corpus source is {source}, not `aws help`: throughput on it doesn't reflect real help pages.\n"
+                  f"   Re-record with record-help-corpus.py --source cli (needs groff), or pass --synthetic")
+            sys.exit(1)
+        print("⚠️  Not recorded from `aws help` (--synthetic): don't quote these numbers as parser throughput\n")
+
+    timings = []
+    params = 0
+    for round_idx in range(1, rounds + 1):
+        started = time.perf_counter()
+        params = sum(len(parse_parameters(page)) for page in pages)
+        elapsed = time.perf_counter() - started
+        timings.append(elapsed)
+        print(f"  round {round_idx}: {elapsed * 1000:.1f} ms ({len(pages) / elapsed:.0f} pages/s)")
+
+    best = min(timings)
+    result = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'pages': len(pages),
+        'corpus_source': source,
+        'parameters': params,
+        'rounds': rounds,
+        'best_seconds': round(best, 6),
+        'pages_per_second': round(len(pages) / best, 1),
+        'mib_per_second': round(total_bytes / best / (1024 * 1024), 2)
+    }
+
+    print(f"\n📊 Best: {result['pages_per_second']:.0f} pages/s, "
+          f"{result['mib_per_second']:.1f} MiB/s, {params} parameters")
+
+    if '--no-save' not in sys.argv:
+        os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+        with open(RESULTS_FILE, 'a') as f:
+            f.write(json.dumps(result) + '\n')
+        print(f"💾 Appended to {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env node
+
+/**
+ * Merge stage benchmark (run by bench-pipeline.py)
+ * Times mergeParameters() from merge-parameters.js on a cleaned and an extracted
+ * data file and prints one JSON object: best round, items merged and heap growth.
+ *
+ * Usage: node --expose-gc scripts/benchmarks/bench-merge.js <cleaned.json> <extracted.json> [rounds]
+ */
+
+const fs = require('fs');
+const { mergeParameters } = require('../merge-parameters');
+
+const [cleanedPath, extractedPath, roundsArg] = process.argv.slice(2);
+const rounds = parseInt(roundsArg || '5', 10);
+
+const cleanedText = fs.readFileSync(cleanedPath, 'utf8');
+const extractedText = fs.readFileSync(extractedPath, 'utf8');
+
+let best = Infinity;
+let items = 0;
+let heapGrowth = 0;
+
+for (let round = 0; round < rounds; round++) {
+    // Fresh copies every round: the merge works in place
+    const cleanedData = JSON.parse(cleanedText);
+    const extractedData = JSON.parse(extractedText);
+    if (global.gc) global.gc();
+    const heapBefore = process.memoryUsage().heapUsed;
+
+    const started = process.hrtime.bigint();
+    mergeParameters(cleanedData, extractedData);
+    const elapsed = Number(process.hrtime.bigint() - started) / 1e9;
+
+    heapGrowth = Math.max(heapGrowth, process.memoryUsage().heapUsed - heapBefore);
+    best = Math.min(best, elapsed);
+    items = cleanedData.reduce((sum, s) => sum + s.commands.length, 0);
+}
+
+console.log(JSON.stringify({
+    best_seconds: best,
+    items,
+    peak_memory_mib: heapGrowth / (1024 * 1024)
+}));
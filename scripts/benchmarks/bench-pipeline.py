@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Pipeline stage benchmark
+Runs each stage of the data pipeline against the recorded corpus in
+scripts/benchmarks/corpus (help pages and botocore model snippets, see
+record-help-corpus.py), with no network and no `aws` binary:
+
+    extract      cached extraction: help cache put + get and parse of every page
+    parse        help_parser.parse_parameters over every page
+    models       ServiceModel, CLI command names and fingerprints per model snippet
+                 (skipped without botocore)
+    clean        clean-commands.py name fixing and de-duplication
+    merge        merge-parameters.js merge (skipped without node)
+    emit         aws_data.save_services(): globals interning, JSON and TS module
+    emit-packed  the same in string-table form
+    shards       aws_data.write_shards(): per-service shards and the manifest
+    load         aws_data.load_services() of the emitted store
+
+For every stage it reports the best wall time of several rounds, throughput and
+peak memory (tracemalloc; heap growth for the node stage). Each run is appended
+to reports/benchmarks/pipeline.jsonl; --check exits non-zero when a stage is more
+than 25% slower than in the previous run at the same --scale.
+
+The extract and parse stages only time real input on a corpus recorded from
+`aws help` (record-help-corpus.py --source cli); any other corpus needs
+--synthetic.
+
+Usage:
+    python3 scripts/benchmarks/bench-pipeline.py
+    python3 scripts/benchmarks/bench-pipeline.py --rounds 10 --scale 20
+    python3 scripts/benchmarks/bench-pipeline.py --stage parse --stage emit --no-save
+    python3 scripts/benchmarks/bench-pipeline.py --check
+    python3 scripts/benchmarks/bench-pipeline.py --synthetic   # On an in-process corpus
+"""
+
+import copy
+import gzip
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from aws_data import load_services, save_services, write_shards
+from fingerprints import model_fingerprints
+from help_cache import HelpCache
+from help_parser import parse_parameters
+
+try:
+    # Only the models stage needs botocore
+    from botocore.model import ServiceModel
+    from botocore_models import cli_command_names
+except ImportError:
+    ServiceModel = None
+
+CORPUS_FILE = os.path.join(BENCH_DIR, 'corpus', 'help-pages.jsonl.gz')
+MODELS_FILE = os.path.join(BENCH_DIR, 'corpus', 'models.json.gz')
+RESULTS_FILE = os.path.join('reports', 'benchmarks', 'pipeline.jsonl')
+REGRESSION_THRESHOLD = 0.25
+# Stages faster than this are all timer noise at the default scale
+REGRESSION_MIN_SECONDS = 0.002
+
+
+def load_clean_commands():
+    """clean-commands.py as a module (its file name is not importable)"""
+    spec = importlib.util.spec_from_file_location('clean_commands', os.path.join(SCRIPTS_DIR, 'clean-commands.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class SnippetLoader:
+    """Stands in for botocore's data loader, serving the recorded model snippets"""
+
+    def __init__(self, models: Dict):
+        self.models = models
+
+    def load_service_model(self, service_name: str, type_name: str) -> Dict:
+        return self.models[service_name]
+
+
+class Corpus:
+    """Recorded pages and models, plus the services list built from them"""
+
+    def __init__(self, scale: int):
+        with gzip.open(CORPUS_FILE, 'rt', encoding='utf-8') as f:
+            self.pages = [json.loads(line) for line in f]
+        with gzip.open(MODELS_FILE, 'rt', encoding='utf-8') as f:
+            self.models = json.load(f)
+        self.page_bytes = sum(len(page['text']) for page in self.pages)
+        # cli (real `aws help`), inprocess (synthetic) or mixed
+        sources = {page.get('source', 'unknown') for page in self.pages}
+        self.source = sources.pop() if len(sources) == 1 else 'mixed'
+
+        services: Dict[str, Dict] = {}
+        for page in self.pages:
+            service = services.setdefault(page['service'], {
+                'name': page['service'], 'description': f"AWS {page['service'].upper()}", 'commands': []})
+            service['commands'].append({'name': page['command'], 'description': f"{page['command']} command",
+                                        'parameters': parse_parameters(page['text'])})
+
+        # --scale N repeats the services under new names to approach full-catalog size
+        self.services = []
+        for copy_idx in range(scale):
+            for service in services.values():
+                name = service['name'] if copy_idx == 0 else f"{service['name']}-{copy_idx}"
+                self.services.append({**copy.deepcopy(service), 'name': name})
+
+        self.commands = sum(len(s['commands']) for s in self.services)
+
+
+def dirty_copy(services: List[Dict]) -> List[Dict]:
+    """Services with some underscore names and duplicates for the clean stage to fix"""
+    data = copy.deepcopy(services)
+    for service in data:
+        commands = service['commands']
+        for i, command in enumerate(commands[:]):
+            if i % 10 == 0:
+                command['name'] = command['name'].replace('-', '_')
+            if i % 20 == 0:
+                commands.append(copy.deepcopy(command))
+    return data
+
+
+def make_stages(corpus: Corpus, workdir: str) -> Dict[str, Dict]:
+    """Stage name -> {'setup': () -> arg, 'run': arg -> items, 'unit': str}"""
+    clean_module = load_clean_commands()
+    store_path = os.path.join(workdir, 'aws-commands.json')
+    round_dirs = iter(range(1_000_000))
+
+    def fresh_dir() -> str:
+        path = os.path.join(workdir, f"round-{next(round_dirs)}")
+        os.makedirs(path)
+        return path
+
+    def run_extract(cache: HelpCache) -> int:
+        for page in corpus.pages:
+            cache.put('bench', page['service'], page['command'], page['text'])
+        for page in corpus.pages:
+            parse_parameters(cache.get('bench', page['service'], page['command']))
+        return len(corpus.pages)
+
+    def run_parse(_) -> int:
+        for page in corpus.pages:
+            parse_parameters(page['text'])
+        return len(corpus.pages)
+
+    def run_models(_) -> int:
+        loader = SnippetLoader(corpus.models)
+        operations = 0
+        for name, snippet in corpus.models.items():
+            operations += len(cli_command_names(ServiceModel(snippet, service_name=name)))
+            model_fingerprints(loader, name)
+        return operations
+
+    def run_clean(data: List[Dict]) -> int:
+        clean_module.clean_services(data, verbose=False)
+        return sum(len(s['commands']) for s in data)
+
+    def run_emit(path: str, packed: bool = False) -> int:
+        save_services(corpus.services, os.path.join(path, 'aws-commands.json'), packed=packed)
+        return corpus.commands
+
+    def run_shards(path: str) -> int:
+        write_shards(corpus.services, os.path.join(path, 'aws-manifest.json'), os.path.join(path, 'services'))
+        return corpus.commands
+
+    def setup_load() -> str:
+        if not os.path.exists(store_path):
+            save_services(corpus.services, store_path, typescript=False)
+        return store_path
+
+    def run_load(path: str) -> int:
+        return sum(len(s['commands']) for s in load_services(path))
+
+    return {
+        'extract': {'setup': lambda: HelpCache(fresh_dir()), 'run': run_extract, 'unit': 'pages',
+                    'bytes': corpus.page_bytes},
+        'parse': {'setup': lambda: None, 'run': run_parse, 'unit': 'pages', 'bytes': corpus.page_bytes},
+        'models': {'setup': lambda: None, 'run': run_models, 'unit': 'operations'},
+        'clean': {'setup': lambda: dirty_copy(corpus.services), 'run': run_clean, 'unit': 'commands'},
+        'emit': {'setup': fresh_dir, 'run': run_emit, 'unit': 'commands'},
+        'emit-packed': {'setup': fresh_dir, 'run': lambda path: run_emit(path, packed=True), 'unit': 'commands'},
+        'shards': {'setup': fresh_dir, 'run': run_shards, 'unit': 'commands'},
+        'load': {'setup': setup_load, 'run': run_load, 'unit': 'commands'},
+    }
+
+
+def measure(stage: Dict, rounds: int) -> Dict:
+    """Best-of-rounds wall time, then one traced round for peak memory"""
+    timings = []
+    items = 0
+    for _ in range(rounds):
+        arg = stage['setup']()
+        started = time.perf_counter()
+        items = stage['run'](arg)
+        timings.append(time.perf_counter() - started)
+
+    arg = stage['setup']()
+    tracemalloc.start()
+    stage['run'](arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best = min(timings)
+    result = {
+        'best_seconds': round(best, 6),
+        'items': items,
+        'unit': stage['unit'],
+        'items_per_second': round(items / best, 1) if best else None,
+        'peak_memory_mib': round(peak / (1024 * 1024), 2)
+    }
+    if 'bytes' in stage:
+        result['mib_per_second'] = round(stage['bytes'] / best / (1024 * 1024), 2) if best else None
+    return result
+
+
+def measure_merge(corpus: Corpus, workdir: str, rounds: int) -> Optional[Dict]:
+    """Run the node merge benchmark; None when node is not available"""
+    if not shutil.which('node'):
+        return None
+
+    # Cleaned data with every other command's parameters dropped, so half get merged
+    cleaned = copy.deepcopy(corpus.services)
+    for service in cleaned:
+        for i, command in enumerate(service['commands']):
+            if i % 2 == 0:
+                command['parameters'] = []
+    cleaned_path = os.path.join(workdir, 'merge-cleaned.json')
+    extracted_path = os.path.join(workdir, 'merge-extracted.json')
+    with open(cleaned_path, 'w') as f:
+        json.dump(cleaned, f)
+    with open(extracted_path, 'w') as f:
+        json.dump(corpus.services, f)
+
+    output = subprocess.run(
+        ['node', '--expose-gc', os.path.join(BENCH_DIR, 'bench-merge.js'), cleaned_path, extracted_path, str(rounds)],
+        capture_output=True, text=True, check=True
+    ).stdout
+    measured = json.loads(output)
+    best = measured['best_seconds']
+    return {
+        'best_seconds': round(best, 6),
+        'items': measured['items'],
+        'unit': 'commands',
+        'items_per_second': round(measured['items'] / best, 1) if best else None,
+        'peak_memory_mib': round(measured['peak_memory_mib'], 2)
+    }
+
+
+def previous_run(scale: int, source: str) -> Optional[Dict]:
+    """The last recorded run at the same scale on a corpus from the same source"""
+    if not os.path.exists(RESULTS_FILE):
+        return None
+    with open(RESULTS_FILE, 'r') as f:
+        runs = [json.loads(line) for line in f if line.strip()]
+    runs = [run for run in runs if run.get('scale') == scale and run.get('corpus_source', 'unknown') == source]
+    return runs[-1] if runs else None
+
+
+def regressions(previous: Dict, current: Dict) -> List[str]:
+    """Stages more than REGRESSION_THRESHOLD slower than in the previous run"""
+    slower = []
+    for name, result in current['stages'].items():
+        before = previous['stages'].get(name)
+        if not before or result['best_seconds'] < REGRESSION_MIN_SECONDS:
+            continue
+        if result['best_seconds'] > before['best_seconds'] * (1 + REGRESSION_THRESHOLD):
+            change = result['best_seconds'] / before['best_seconds'] - 1
+            slower.append(f"{name}: {before['best_seconds'] * 1000:.1f} ms -> "
+                          f"{result['best_seconds'] * 1000:.1f} ms (+{change:.0%})")
+    return slower
+
+
+def option_values(argv: List[str], flag: str) -> List[str]:
+    return [argv[i + 1] for i, arg in enumerate(argv[:-1]) if arg == flag]
+
+
+def main():
+    argv = sys.argv[1:]
+    rounds = int((option_values(argv, '--rounds') or ['5'])[0])
+    scale = max(1, int((option_values(argv, '--scale') or ['1'])[0]))
+    selected = option_values(argv, '--stage')
+
+    for path in (CORPUS_FILE, MODELS_FILE):
+        if not os.path.exists(path):
+            print(f"❌ No corpus at {path}; run record-help-corpus.py first")
+            sys.exit(1)
+
+    corpus = Corpus(scale)
+    print(f"📚 Corpus: {len(corpus.pages)} pages, {len(corpus.models)} models, "
+          f"{len(corpus.services)} services / {corpus.commands} commands at scale {scale}, source {corpus.source}\n")
+    if corpus.source != 'cli':
+        if '--synthetic' not in argv:
+            print(f"❌ Corpus source is {corpus.source}, not `aws help`: extract and parse timings on it don't "
+                  f"reflect real help pages.\n"
+                  f"   Re-record with record-help-corpus.py --source cli (needs groff), or pass --synthetic")
+            sys.exit(1)
+        print("⚠️  Not recorded from `aws help` (--synthetic): don't quote extract and parse timings\n")
+
+    workdir = tempfile.mkdtemp(prefix='bench-pipeline-')
+    stages: Dict[str, Dict] = {}
+    try:
+        stage_defs = make_stages(corpus, workdir)
+        names = list(stage_defs) + ['merge']
+        unknown = [name for name in selected if name not in names]
+        if unknown:
+            print(f"❌ Unknown stage(s): {', '.join(unknown)} (stages: {', '.join(names)})")
+            sys.exit(1)
+
+        for name in names:
+            if selected and name not in selected:
+                continue
+            if name == 'merge':
+                result = measure_merge(corpus, workdir, rounds)
+                if result is None:
+                    print(f"  {name:<12} skipped (node not found)")
+                    continue
+            elif name == 'models' and ServiceModel is None:
+                print(f"  {name:<12} skipped (botocore not installed)")
+                continue
+            else:
+                result = measure(stage_defs[name], rounds)
+            stages[name] = result
+            print(f"  {name:<12} {result['best_seconds'] * 1000:9.1f} ms  "
+                  f"{result['items_per_second']:>10,.0f} {result['unit']}/s  "
+                  f"peak {result['peak_memory_mib']:.1f} MiB")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'scale': scale,
+        'corpus_source': corpus.source,
+        'rounds': rounds,
+        'stages': stages
+    }
+
+    slower = []
+    if '--check' in argv:
+        previous = previous_run(scale, corpus.source)
+        if previous is None:
+            print(f"\nℹ️  No previous run at scale {scale} to check against")
+        else:
+            slower = regressions(previous, run)
+            if slower:
+                print(f"\n❌ Slower than the previous run ({previous['timestamp']}):")
+                for line in slower:
+                    print(f"   {line}")
+            else:
+                print(f"\n✅ No stage more than {REGRESSION_THRESHOLD:.0%} slower than {previous['timestamp']}")
+
+    if '--no-save' not in argv:
+        os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+        with open(RESULTS_FILE, 'a') as f:
+            f.write(json.dumps(run) + '\n')
+        print(f"\n💾 Appended to {RESULTS_FILE}")
+
+    if slower:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
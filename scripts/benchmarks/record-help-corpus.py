@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Record a corpus of AWS CLI help pages for the parser and pipeline benchmarks
+Writes scripts/benchmarks/corpus/help-pages.jsonl.gz, one
+{"service", "command", "source", "cli", "text"} object per line (source: cli or
+inprocess, cli: the AWS CLI version that produced the page) for a fixed sample
+of services,
+and scripts/benchmarks/corpus/models.json.gz, each sampled service's botocore
+model cut down to the sampled operations and the shapes their inputs reach.
+
+Sources:
+    --source cli        run `aws <service> <command> help` (default; needs groff or mandoc)
+    --source inprocess  render the OPTIONS section from the awscli package in the
+                        help-page layout (for machines without groff). These pages
+                        are synthetic: no bold, nested structure members, wrapped
+                        paragraphs or example blocks, so benchmarks and parity
+                        checks on them don't reflect real `aws help` output
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aws_help import get_awscli_version, run_aws_help
+from awscli_inprocess import get_inprocess_help
+from botocore_models import get_loader, load_service_model, cli_command_name, cli_command_names
+from fingerprints import input_shapes
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'help-pages.jsonl.gz')
+MODELS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'models.json.gz')
+
+SAMPLE_SERVICES = [
+    'ec2', 'apigateway', 'iam', 'lambda', 'dynamodb', 'ecs',
+    'rds', 'cloudformation', 'sns', 'sqs', 'eks', 'logs'
+]
+
+
+def sample_commands(service: str, per_service: int) -> List[str]:
+    """Evenly spaced sample of a service's commands"""
+    commands = cli_command_names(load_service_model(get_loader(), service))
+    step = max(1, len(commands) // per_service)
+    return commands[::step][:per_service]
+
+
+def model_snippet(service: str, commands: List[str]) -> Dict:
+    """A service's botocore model with only the given commands' operations and input shapes"""
+    model = get_loader().load_service_model(service, 'service-2')
+    wanted = set(commands)
+    operations = {name: op for name, op in model['operations'].items() if cli_command_name(name) in wanted}
+    referenced = set()
+    for operation in operations.values():
+        referenced |= input_shapes(model['shapes'], operation)
+    return {
+        'version': model.get('version'),
+        'metadata': model['metadata'],
+        'operations': operations,
+        'shapes': {name: model['shapes'][name] for name in sorted(referenced)}
+    }
+
+
+def render_page(renderer, service: str, command: str) -> str:
+    """Help page with the in-process OPTIONS section between the usual neighbours"""
+    options = renderer.render_options(service, command)
+    if options is None:
+        return ''
+    return (f"NAME\n       {command} -\n\nSYNOPSIS\n            {command}\n\n"
+            f"{options}\nGLOBAL OPTIONS\n       --debug (boolean)\n\n"
+            f"       Turn on debug logging.\n\nOUTPUT\n")
+
+
+def main():
+    source = 'inprocess' if '--source' in sys.argv and 'inprocess' in sys.argv else 'cli'
+    per_service = 20
+    if '--per-service' in sys.argv:
+        per_service = int(sys.argv[sys.argv.index('--per-service') + 1])
+
+    renderer = get_inprocess_help() if source == 'inprocess' else None
+    if source == 'inprocess' and renderer is None:
+        print("❌ --source inprocess needs the awscli package")
+        sys.exit(1)
+    # `aws help` renders man pages through groff (or mandoc) and fails without them
+    if source == 'cli' and not (shutil.which('groff') or shutil.which('mandoc')):
+        print("❌ --source cli needs groff or mandoc for `aws ... help`")
+        sys.exit(1)
+
+    version = renderer.version if renderer else get_awscli_version()
+    print(f"📼 Recording help pages ({source}, {version}, {per_service} per service)...\n")
+
+    pages = []
+    models = {}
+    for service in SAMPLE_SERVICES:
+        recorded = 0
+        commands = sample_commands(service, per_service)
+        models[service] = model_snippet(service, commands)
+        for command in commands:
+            if renderer:
+                text = render_page(renderer, service, command)
+            else:
+                text = run_aws_help(service, command)
+            if text:
+                pages.append({'service': service, 'command': command, 'source': source, 'cli': version, 'text': text})
+                recorded += 1
+        print(f"  ✓ {service}: {recorded} pages")
+
+    os.makedirs(os.path.dirname(CORPUS_FILE), exist_ok=True)
+    # mtime=0 keeps the file byte-identical across re-recordings of the same pages
+    with gzip.GzipFile(CORPUS_FILE, 'wb', mtime=0) as f:
+        for page in pages:
+            f.write((json.dumps(page) + '\n').encode('utf-8'))
+
+    with gzip.GzipFile(MODELS_FILE, 'wb', mtime=0) as f:
+        f.write(json.dumps(models, sort_keys=True).encode('utf-8'))
+
+    print(f"\n💾 {len(pages)} pages saved to {CORPUS_FILE}")
+    if source == 'inprocess':
+        print("⚠️  Synthetic pages: re-record with --source cli where groff is installed")
+    print(f"💾 {len(models)} model snippets saved to {MODELS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
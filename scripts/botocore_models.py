@@ -0,0 +1,67 @@
+"""
+Botocore service model helpers
+Loads service models straight from botocore's data loader (the local
+service-2.json files), without building a client. Creating a client per lookup
+also resolves endpoints and generates a client class, which dominates the cost
+of walking the whole catalog.
+"""
+
+import threading
+from typing import Dict, List
+
+try:
+    # Recent awscli 1.x releases bundle botocore and alias `import botocore` to
+    # their copy once awscli is imported, so load it first: fingerprints and
+    # command lists then come from the same models as `aws ... help`
+    import awscli  # noqa: F401
+except ImportError:
+    pass
+
+from botocore import xform_name
+from botocore.model import ServiceModel
+from botocore.session import Session
+
+_models: Dict[str, ServiceModel] = {}
+# Models are loaded from thread pools (verify-commands.py)
+_models_lock = threading.Lock()
+
+# CLI service names whose botocore model has another name
+BOTOCORE_SERVICE_NAMES = {'s3api': 's3'}
+
+
+def get_loader(session: Session = None):
+    """botocore data loader (honours AWS_DATA_PATH like the CLI does)"""
+    return (session or Session()).get_component('data_loader')
+
+
+def list_services(loader) -> List[str]:
+    """All service names that have a service-2 model, sorted"""
+    services = loader.list_available_services('service-2')
+    return sorted(s for s in services if not s.startswith('_'))
+
+
+def load_service_model(loader, service_name: str) -> ServiceModel:
+    """Load (and memoize) the ServiceModel for a service"""
+    with _models_lock:
+        if service_name in _models:
+            return _models[service_name]
+    # Loaded outside the lock so different services load in parallel; if two
+    # threads load the same one, the first stored wins
+    model = ServiceModel(loader.load_service_model(service_name, 'service-2'), service_name=service_name)
+    with _models_lock:
+        return _models.setdefault(service_name, model)
+
+
+def botocore_service_name(cli_service: str) -> str:
+    """Name of the botocore model behind a CLI service (s3api -> s3)"""
+    return BOTOCORE_SERVICE_NAMES.get(cli_service, cli_service)
+
+
+def cli_command_name(operation_name: str) -> str:
+    """Operation name to CLI command name (DescribeDBInstances -> describe-db-instances)"""
+    return xform_name(operation_name).replace('_', '-')
+
+
+def cli_command_names(service_model: ServiceModel) -> List[str]:
+    """Sorted CLI command names for every operation of a service"""
+    return sorted(cli_command_name(op) for op in service_model.operation_names)
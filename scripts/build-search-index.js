@@ -0,0 +1,58 @@
+#!/usr/bin/env node
+
+/**
+ * Build the Fuse.js search index
+ * Runs Fuse.createIndex over the commands in lib/aws-manifest.json with the keys
+ * and weights in lib/search-keys.json (the ones lib/aws-search.ts searches with)
+ * and writes it to lib/aws-search-index.json, so the browser only has to
+ * Fuse.parseIndex() it instead of tokenizing every command on page load. The
+ * manifest's version goes with it, so a stale index is never used.
+ *
+ * Runs before `npm run dev` / `npm run build`; run it by hand after changing the data:
+ *   node scripts/build-search-index.js
+ */
+
+const fs = require('fs');
+const path = require('path');
+const Fuse = require('fuse.js');
+const { ROOT, MANIFEST_FILE } = require('./aws-data');
+
+const KEYS_FILE = path.join(ROOT, 'lib', 'search-keys.json');
+const INDEX_FILE = path.join(ROOT, 'lib', 'aws-search-index.json');
+
+// Same records, in the same order, as buildSearchableCommands() in lib/aws-search.ts:
+// the index refers to them by position
+function searchableCommands(manifest) {
+    const commands = [];
+    manifest.services.forEach(service => {
+        service.commands.forEach(command => {
+            commands.push({
+                displayText: `aws ${service.name} ${command}`,
+                service: service.name,
+                command
+            });
+        });
+    });
+    return commands;
+}
+
+function buildSearchIndex(manifest, keys) {
+    return { version: manifest.version, ...Fuse.createIndex(keys, searchableCommands(manifest)).toJSON() };
+}
+
+if (require.main === module) {
+    const started = process.hrtime.bigint();
+    const manifest = JSON.parse(fs.readFileSync(MANIFEST_FILE, 'utf8'));
+    const keys = JSON.parse(fs.readFileSync(KEYS_FILE, 'utf8'));
+
+    const index = buildSearchIndex(manifest, keys);
+    const content = JSON.stringify(index) + '\n';
+    fs.writeFileSync(`${INDEX_FILE}.tmp`, content);
+    fs.renameSync(`${INDEX_FILE}.tmp`, INDEX_FILE);
+
+    const elapsed = Number(process.hrtime.bigint() - started) / 1e6;
+    console.log(`🔎 Search index: ${index.records.length} commands, ${(content.length / 1024).toFixed(0)} KB ` +
+        `-> ${path.relative(ROOT, INDEX_FILE)} (${elapsed.toFixed(0)} ms)`);
+}
+
+module.exports = { searchableCommands, buildSearchIndex };
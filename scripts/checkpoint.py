@@ -0,0 +1,80 @@
+"""
+Extraction checkpoint journal
+Append-only JSON Lines file with one entry per finished command, written (and
+fsync'd) as each command completes. A crashed, interrupted or preempted run can
+then be resumed: finished entries are replayed instead of extracted again.
+A last line left unfinished by a crash is dropped before the next append.
+"""
+
+import json
+import os
+from typing import Dict, Tuple
+
+DEFAULT_JOURNAL_FILE = os.path.join('.dev-data', 'extract-parameters.journal.jsonl')
+
+
+class CheckpointJournal:
+    """Append-only journal of finished (service, command) extractions"""
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_FILE):
+        self.path = path
+        self._file = None
+
+    def load(self) -> Dict[Tuple[str, str], Dict]:
+        """Read finished entries, keyed by (service, command)"""
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                entries[(entry['service'], entry['command'])] = entry
+        return entries
+
+    def reset(self) -> None:
+        """Start a fresh journal, discarding entries from a previous run"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _drop_partial_line(self) -> None:
+        """Truncate the file after its last complete line"""
+        with open(self.path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            keep = 0
+            position = end
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b'\n')
+                if newline != -1:
+                    keep = position + newline + 1
+                    break
+            if keep != end:
+                f.truncate(keep)
+
+    def record(self, service: str, command: str, **fields) -> None:
+        """Durably append one finished command"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            if os.path.exists(self.path):
+                # Otherwise the first new entry would be glued onto a partial line
+                self._drop_partial_line()
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps({'service': service, 'command': command, **fields}) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Delete the journal once its results are safely in the final output"""
+        self.reset()
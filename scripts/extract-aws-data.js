@@ -12,6 +12,9 @@ const path = require('path');
 
 const execAsync = promisify(exec);
 
+// What to run instead of `aws`, e.g. AWS_CLI="python3 scripts/fake-aws.py"
+const AWS_CLI = process.env.AWS_CLI || 'aws';
+
 // Common AWS services to extract
 const AWS_SERVICES = [
     'ec2', 's3', 's3api', 'lambda', 'dynamodb', 'rds', 'iam', 'cloudformation',
@@ -22,7 +25,7 @@ const AWS_SERVICES = [
 
 async function getServiceCommands(serviceName) {
     try {
-        const { stdout } = await execAsync(`aws ${serviceName} help 2>&1`);
+        const { stdout } = await execAsync(`${AWS_CLI} ${serviceName} help 2>&1`);
 
         // Extract commands - look for lines that start with spaces and contain command names
         const commands = [];
@@ -58,7 +61,7 @@ async function getServiceCommands(serviceName) {
 
 async function getCommandParameters(serviceName, commandName) {
     try {
-        const { stdout } = await execAsync(`aws ${serviceName} ${commandName} help 2>&1`);
+        const { stdout } = await execAsync(`${AWS_CLI} ${serviceName} ${commandName} help 2>&1`);
 
         const parameters = [];
         const lines = stdout.split('\n');
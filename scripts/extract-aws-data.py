@@ -4,34 +4,22 @@ AWS CLI Data Extraction Script
 Extracts all services, commands, and parameters from AWS CLI v2
 """
 
-import subprocess
 import json
 import re
 from typing import List, Dict, Any
 
+from aws_help import aws_cli, get_runner
+
 def run_command(cmd: List[str]) -> str:
-    """Run a command and return its output"""
-    try:
-        # Disable AWS CLI pager to get full output
-        env = {'AWS_PAGER': ''}
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env={**subprocess.os.environ, **env}
-        )
-        return result.stdout
-    except Exception as e:
-        print(f"Error running {' '.join(cmd)}: {e}")
-        return ""
+    """Run a command and return its output ('' on error or repeated timeouts)"""
+    return get_runner().run_sync(cmd) or ""
 
 def get_all_services() -> List[str]:
     """Get list of all AWS services using aws help"""
     print("📋 Getting list of AWS services...")
     
     # Use aws help and parse the output
-    output = run_command(['aws', 'help'])
+    output = run_command([*aws_cli(), 'help'])
     
     # Look for service names in the help output
     # AWS CLI v2 lists services after "AVAILABLE SERVICES" section
@@ -76,7 +64,7 @@ def get_all_services() -> List[str]:
 
 def get_service_commands(service: str) -> List[str]:
     """Get all commands for a service"""
-    output = run_command(['aws', service, 'help'])
+    output = run_command([*aws_cli(), service, 'help'])
     
     commands = []
     in_commands_section = False
@@ -107,7 +95,7 @@ def get_service_commands(service: str) -> List[str]:
 
 def get_command_parameters(service: str, command: str) -> List[Dict[str, str]]:
     """Get all parameters for a command"""
-    output = run_command(['aws', service, command, 'help'])
+    output = run_command([*aws_cli(), service, command, 'help'])
     
     parameters = []
     in_options_section = False
@@ -231,7 +219,7 @@ def main():
     print(f"\n💾 Saved to: {output_file}")
     print(f"\n💡 Next steps:")
     print(f"   1. Review the extracted data")
-    print(f"   2. Merge with existing data in lib/aws-commands.ts")
+    print(f"   2. Merge with existing data in lib/aws-commands.json")
     print(f"   3. Update imports if needed")
 
 if __name__ == '__main__':
@@ -7,56 +7,36 @@ all services, commands, and parameters.
 
 import json
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 try:
-    from awscli.clidriver import CLIDriver
+    from botocore.model import ServiceModel
     from botocore.session import Session
     from botocore import xform_name
+    from botocore_models import get_loader, list_services, load_service_model
 except ImportError:
     print("❌ Error: awscli library not found")
     print("Install with: pip install awscli")
     sys.exit(1)
 
 
-def get_all_services(session: Session) -> List[str]:
+def get_all_services(loader) -> List[str]:
     """Get list of all available AWS services"""
-    services = session.get_available_services()
     # Filter out non-standard services
-    filtered = [s for s in services if not s.startswith('_')]
-    return sorted(filtered)
+    return list_services(loader)
 
 
-def get_service_commands(session: Session, service_name: str) -> List[str]:
-    """Get all operations (commands) for a service"""
-    try:
-        client = session.create_client(service_name, region_name='us-east-1')
-        # Get service model
-        service_model = client._service_model
-        # Get all operation names
-        operations = list(service_model.operation_names)
-        # Convert to CLI command format (PascalCase -> kebab-case)
-        commands = [xform_name(op) for op in operations]
-        return sorted(commands)
-    except Exception as e:
-        print(f"   ⚠️  Error getting commands for {service_name}: {e}")
-        return []
+def get_service_commands(service_model: ServiceModel) -> Dict[str, str]:
+    """Map CLI command name -> operation name for every operation of a service"""
+    # Convert to CLI command format (PascalCase -> snake_case)
+    return {xform_name(op): op for op in service_model.operation_names}
 
 
-def get_command_parameters(session: Session, service_name: str, operation_name: str) -> List[Dict[str, str]]:
+def get_command_parameters(service_model: ServiceModel, operation_name: str) -> List[Dict[str, str]]:
     """Get all parameters for a command"""
     try:
-        client = session.create_client(service_name, region_name='us-east-1')
-        service_model = client._service_model
-        
-        # Convert kebab-case to PascalCase for operation lookup
-        operation_pascal = ''.join(word.capitalize() for word in operation_name.split('-'))
-        
         # Get operation model
-        if operation_pascal not in service_model.operation_names:
-            return []
-        
-        operation_model = service_model.operation_model(operation_pascal)
+        operation_model = service_model.operation_model(operation_name)
         
         # Get input shape
         if not operation_model.input_shape:
@@ -99,12 +79,10 @@ def get_command_parameters(session: Session, service_name: str, operation_name:
         return []
 
 
-def get_service_description(session: Session, service_name: str) -> str:
+def get_service_description(service_model: ServiceModel) -> str:
     """Get service description"""
+    service_name = service_model.service_name
     try:
-        client = session.create_client(service_name, region_name='us-east-1')
-        service_model = client._service_model
-        
         # Get service documentation
         if hasattr(service_model, 'documentation'):
             return service_model.documentation or f"AWS {service_name.upper()} Service"
@@ -120,19 +98,25 @@ def get_service_description(session: Session, service_name: str) -> str:
         return f"AWS {service_name.upper()} Service"
 
 
-def extract_service_data(session: Session, service_name: str, max_commands: int = 20) -> Dict[str, Any]:
-    """Extract all data for a service"""
+def extract_service_data(loader, service_name: str, max_commands: Optional[int] = None) -> Dict[str, Any]:
+    """Extract all data for a service from a single loaded service model"""
     print(f"\n📦 Extracting {service_name}...")
     
+    try:
+        service_model = load_service_model(loader, service_name)
+    except Exception as e:
+        print(f"   ⚠️  Error getting commands for {service_name}: {e}")
+        return {'name': service_name, 'description': f"AWS {service_name.upper()} Service", 'commands': []}
+    
     # Get service description
-    description = get_service_description(session, service_name)
+    description = get_service_description(service_model)
     
     # Get commands
-    commands = get_service_commands(session, service_name)
+    commands = get_service_commands(service_model)
     print(f"   Found {len(commands)} commands")
     
-    # Limit commands
-    commands = commands[:max_commands]
+    # Optionally limit commands
+    command_names = sorted(commands)[:max_commands]
     
     service_data = {
         'name': service_name,
@@ -140,9 +124,9 @@ def extract_service_data(session: Session, service_name: str, max_commands: int
         'commands': []
     }
     
-    for cmd in commands:
+    for cmd in command_names:
         try:
-            params = get_command_parameters(session, service_name, cmd)
+            params = get_command_parameters(service_model, commands[cmd])
             
             # Get command description (operation description)
             cmd_description = f"{cmd} operation for {service_name}"
@@ -162,22 +146,25 @@ def extract_service_data(session: Session, service_name: str, max_commands: int
 def main():
     print("🚀 AWS CLI Data Extraction (using awscli library)\n")
     
-    # Create botocore session
-    session = Session()
+    # One loader for the whole run; each service model is read from disk once
+    loader = get_loader(Session())
     
     # Get all services
     print("📋 Getting list of AWS services...")
-    all_services = get_all_services(session)
+    all_services = get_all_services(loader)
     print(f"✓ Found {len(all_services)} services\n")
     
-    # Ask user how many services to process
-    print(f"How many services would you like to extract?")
-    print(f"  1. First 10 services (quick test)")
-    print(f"  2. First 30 services (recommended)")
-    print(f"  3. First 50 services (comprehensive)")
-    print(f"  4. All {len(all_services)} services (may take 15-20 minutes)")
-    
-    choice = input("\nEnter choice (1-4) [default: 2]: ").strip() or "2"
+    if '--all' in sys.argv:
+        choice = "4"
+    else:
+        # Ask user how many services to process
+        print(f"How many services would you like to extract?")
+        print(f"  1. First 10 services (quick test)")
+        print(f"  2. First 30 services")
+        print(f"  3. First 50 services")
+        print(f"  4. All {len(all_services)} services (complete - under a minute)")
+        
+        choice = input("\nEnter choice (1-4) [default: 4]: ").strip() or "4"
     
     if choice == "1":
         services = all_services[:10]
@@ -196,7 +183,7 @@ def main():
     
     for service in services:
         try:
-            service_data = extract_service_data(session, service, max_commands=15)
+            service_data = extract_service_data(loader, service)
             all_data.append(service_data)
             
             total_commands += len(service_data['commands'])
@@ -6,54 +6,35 @@ This script uses boto3 (which comes with AWS CLI) to extract service definitions
 
 import json
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 try:
-    import boto3
     from botocore import xform_name
+    from botocore.model import ServiceModel
     from botocore.session import Session
+    from botocore_models import get_loader, list_services, load_service_model
 except ImportError:
-    print("❌ Error: boto3 library not found")
-    print("boto3 should be installed with AWS CLI")
+    print("❌ Error: botocore library not found")
+    print("botocore should be installed with AWS CLI (or: pip install boto3)")
     sys.exit(1)
 
 
-def get_all_services(session: Session) -> List[str]:
+def get_all_services(loader) -> List[str]:
     """Get list of all available AWS services"""
-    services = session.get_available_services()
     # Filter out non-standard services
-    filtered = [s for s in services if not s.startswith('_')]
-    return sorted(filtered)
+    return list_services(loader)
 
 
-def get_service_commands(session: Session, service_name: str) -> List[str]:
-    """Get all operations (commands) for a service"""
-    try:
-        client = session.create_client(service_name, region_name='us-east-1')
-        # Access service model through _service_model (private attribute)
-        service_model = client._service_model
-        operations = list(service_model.operation_names)
-        # Convert to CLI command format (PascalCase -> kebab-case)
-        commands = [xform_name(op) for op in operations]
-        return sorted(commands)
-    except Exception as e:
-        print(f"   ⚠️  Error getting commands for {service_name}: {e}")
-        return []
+def get_service_commands(service_model: ServiceModel) -> Dict[str, str]:
+    """Map CLI command name -> operation name for every operation of a service"""
+    # Convert to CLI command format (PascalCase -> snake_case)
+    return {xform_name(op): op for op in service_model.operation_names}
 
 
-def get_command_parameters(session: Session, service_name: str, operation_name: str) -> List[Dict[str, str]]:
+def get_command_parameters(service_model: ServiceModel, operation_name: str) -> List[Dict[str, str]]:
     """Get all parameters for a command"""
     try:
-        client = session.create_client(service_name, region_name='us-east-1')
-        service_model = client._service_model
-        
-        # Convert kebab-case to PascalCase
-        operation_pascal = ''.join(word.capitalize() for word in operation_name.split('-'))
-        
-        if operation_pascal not in service_model.operation_names:
-            return []
-        
-        operation_model = service_model.operation_model(operation_pascal)
+        operation_model = service_model.operation_model(operation_name)
         
         if not operation_model.input_shape:
             return []
@@ -87,12 +68,10 @@ def get_command_parameters(session: Session, service_name: str, operation_name:
         return []
 
 
-def get_service_description(session: Session, service_name: str) -> str:
+def get_service_description(service_model: ServiceModel) -> str:
     """Get service description"""
+    service_name = service_model.service_name
     try:
-        client = session.create_client(service_name, region_name='us-east-1')
-        service_model = client._service_model
-        
         if hasattr(service_model, 'documentation'):
             doc = service_model.documentation or ''
             if doc:
@@ -112,12 +91,18 @@ def get_service_description(session: Session, service_name: str) -> str:
         return f"AWS {service_name.upper()} Service"
 
 
-def extract_service_data(session: Session, service_name: str, max_commands: int = 20) -> Dict[str, Any]:
-    """Extract all data for a service"""
+def extract_service_data(loader, service_name: str, max_commands: Optional[int] = None) -> Dict[str, Any]:
+    """Extract all data for a service from a single loaded service model"""
     print(f"\n📦 {service_name}...")
     
-    description = get_service_description(session, service_name)
-    commands = get_service_commands(session, service_name)
+    try:
+        service_model = load_service_model(loader, service_name)
+    except Exception as e:
+        print(f"   ⚠️  Error loading model for {service_name}: {e}")
+        return None
+    
+    description = get_service_description(service_model)
+    commands = get_service_commands(service_model)
     
     if not commands:
         print(f"   ⚠️  No commands found")
@@ -125,8 +110,8 @@ def extract_service_data(session: Session, service_name: str, max_commands: int
     
     print(f"   {len(commands)} commands", end='')
     
-    # Limit commands
-    commands = commands[:max_commands]
+    # Optionally limit commands
+    command_names = sorted(commands)[:max_commands]
     
     service_data = {
         'name': service_name,
@@ -135,9 +120,9 @@ def extract_service_data(session: Session, service_name: str, max_commands: int
     }
     
     total_params = 0
-    for cmd in commands:
+    for cmd in command_names:
         try:
-            params = get_command_parameters(session, service_name, cmd)
+            params = get_command_parameters(service_model, commands[cmd])
             total_params += len(params)
             
             service_data['commands'].append({
@@ -155,22 +140,26 @@ def extract_service_data(session: Session, service_name: str, max_commands: int
 def main():
     print("🚀 AWS Data Extraction (using boto3)\n")
     
-    session = Session()
+    # One loader for the whole run; each service model is read from disk once
+    loader = get_loader(Session())
     
     print("📋 Getting AWS services...")
-    all_services = get_all_services(session)
+    all_services = get_all_services(loader)
     print(f"✓ Found {len(all_services)} services\n")
     
-    print("How many services to extract?")
-    print("  1. First 10 (quick test - 1 min)")
-    print("  2. First 30 (recommended - 3 min)")
-    print("  3. First 50 (comprehensive - 5 min)")
-    print(f"  4. All {len(all_services)} (complete - 15-20 min)")
-    
-    choice = input("\nChoice (1-4) [2]: ").strip() or "2"
+    if '--all' in sys.argv:
+        choice = "4"
+    else:
+        print("How many services to extract?")
+        print("  1. First 10 (quick test)")
+        print("  2. First 30")
+        print("  3. First 50")
+        print(f"  4. All {len(all_services)} (complete - under a minute)")
+        
+        choice = input("\nChoice (1-4) [4]: ").strip() or "4"
     
     limits = {"1": 10, "2": 30, "3": 50, "4": len(all_services)}
-    services = all_services[:limits.get(choice, 30)]
+    services = all_services[:limits.get(choice, len(all_services))]
     
     print(f"\n📊 Extracting {len(services)} services...\n")
     
@@ -181,7 +170,7 @@ def main():
     for i, service in enumerate(services, 1):
         try:
             print(f"[{i}/{len(services)}]", end=' ')
-            service_data = extract_service_data(session, service, max_commands=15)
+            service_data = extract_service_data(loader, service)
             
             if service_data:
                 all_data.append(service_data)
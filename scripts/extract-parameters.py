@@ -5,146 +5,121 @@ Extracts parameters from AWS CLI help for all commands
 """
 
 import json
-import subprocess
-import re
 import os
-from typing import List, Dict
+import shlex
+import sys
+import time
+from typing import Callable, List, Dict, Optional, Set, Tuple
+from aws_help import run_aws_help, fetch_help_async, get_awscli_version, get_help_cache, get_runner, strip_formatting
+from help_parser import parse_parameters
+from aws_data import load_services
+from awscli_inprocess import get_inprocess_help
+from fingerprints import FingerprintStore, fingerprint, model_fingerprints
+from checkpoint import CheckpointJournal
+from tracing import span
 
-def run_aws_help(service: str, command: str) -> str:
-    """Get AWS CLI help output for a command"""
+CHANGES_REPORT_FILE = 'reports/extraction-changes.json'
+FAILURES_REPORT_FILE = 'reports/extraction-failures.json'
+
+def fetch_parameters(service: str, command: str, backend: str = 'subprocess') -> Optional[Tuple[List[Dict[str, str]], str]]:
+    """Fetch and parse parameters for one command
+
+    Returns (parameters, help fingerprint), or None if no help is available.
+    Both backends fingerprint the parsed parameters, so switching backends
+    doesn't mark unchanged commands as changed.
+    """
+    if backend == 'inprocess':
+        params = get_inprocess_help().get_parameters(service, command)
+        if params is not None:
+            return params, fingerprint(params)
+        # Not in the awscli command table - fall back to `aws ... help`
+    
+    return parse_help(run_aws_help(service, command))
+
+def parse_help(help_text: str) -> Optional[Tuple[List[Dict[str, str]], str]]:
+    """(parameters, help fingerprint) for help text, or None if there is none"""
+    if not help_text:
+        return None
+    params = parse_parameters(help_text)
+    return params, fingerprint(params)
+
+def get_model_loader():
+    """botocore data loader, or None if botocore isn't installed"""
     try:
-        env = {'AWS_PAGER': ''}
-        result = subprocess.run(
-            ['aws', service, command, 'help'],
-            capture_output=True,
-            text=True,
-            timeout=15,
-            env={**os.environ, **env}
-        )
-        # Remove terminal formatting characters (backspace codes for bold text)
-        # Pattern: X\x08X becomes X (removes backspace and duplicate char)
-        help_text = result.stdout
-        help_text = re.sub(r'(.)\x08\1', r'\1', help_text)
-        return help_text
-    except Exception as e:
-        return ""
+        from botocore_models import get_loader
+    except ImportError:
+        return None
+    return get_loader()
 
-def parse_parameters(help_text: str) -> List[Dict[str, str]]:
-    """Parse parameters from AWS CLI help output"""
-    parameters = []
-    lines = help_text.split('\n')
-    
-    in_options = False
-    current_param = None
-    
-    for i, line in enumerate(lines):
-        # Detect OPTIONS section - look for line that contains only "OPTIONS" (with possible whitespace)
-        if line.strip() == 'OPTIONS':
-            in_options = True
-            continue
-        
-        # Stop at next major section (all caps line)
-        if in_options and line.strip() and line.strip().isupper() and len(line.strip()) > 3:
-            # Don't stop at single-word constraints like "Constraints:"
-            if current_param:
-                parameters.append(current_param)
-            # Only stop if it's a major section (not indented)
-            if not line.startswith(' ' * 5):
-                break
-        
-        if in_options:
-            # Pattern 1: Boolean flag format: --param | --no-param
-            bool_match = re.match(r'^\s{6,}(--[a-z0-9-]+)\s+\|\s+(--no-[a-z0-9-]+)', line)
-            if bool_match:
-                # Save previous parameter
-                if current_param:
-                    parameters.append(current_param)
-                
-                param_name = bool_match.group(1)
-                full_name = f"{param_name} | {bool_match.group(2)}"
-                
-                current_param = {
-                    'name': full_name,
-                    'description': ''
-                }
-            # Pattern 2: Alternative boolean format: --param1 | --param2 (type)
-            else: # This 'else' covers cases where bool_match is None
-                alt_bool_match = re.match(r'^\s{6,}(--[a-z0-9-]+)\s+\|\s+(--[a-z0-9-]+)\s+\(([^)]+)\)', line)
-                if alt_bool_match:
-                    if current_param:
-                        parameters.append(current_param)
-                    param1 = alt_bool_match.group(1)
-                    param2 = alt_bool_match.group(2)
-                    full_name = f"{param1} | {param2}"
-                    current_param = {'name': full_name, 'description': ''}
-                # Pattern 3: Standard format: --parameter-name (type)
-                else: # This 'else' covers cases where alt_bool_match is also None
-                    param_match = re.match(r'^\s{6,}(--[a-z0-9-]+)\s+\(([^)]+)\)', line)
-                    if param_match:
-                        # Save previous parameter
-                        if current_param:
-                            parameters.append(current_param)
-                        
-                        param_name = param_match.group(1)
-                        param_type = param_match.group(2)
-                        
-                        # Check if required
-                        is_required = '[required]' in line.lower()
-                        
-                        # Build parameter name with type
-                        if param_type in ['string', 'integer', 'long', 'float', 'double', 'timestamp']:
-                            full_name = f"{param_name} <value>"
-                        elif param_type == 'boolean':
-                            full_name = f"{param_name} | --no-{param_name.lstrip('--')}"
-                        else:
-                            full_name = f"{param_name} <value>"
-                        
-                        current_param = {
-                            'name': full_name,
-                            'description': ''
-                        }
-            # Continue description for current parameter
-            if current_param and line.strip() and not line.startswith(' ' * 12):
-                # Continue description (lines with moderate indentation)
-                # Skip lines that are too indented (likely examples or constraints)
-                if line.strip() and not line.strip().startswith('o '):
-                    if current_param['description']:
-                        current_param['description'] += ' ' + line.strip()
-                    else:
-                        current_param['description'] = line.strip()
-    
-    if current_param:
-        parameters.append(current_param)
-    
-    # Clean up descriptions
-    for param in parameters:
-        desc = param['description']
-        # Remove extra whitespace
-        desc = re.sub(r'\s+', ' ', desc).strip()
-        # Truncate if too long
-        if len(desc) > 250:
-            desc = desc[:247] + '...'
-        param['description'] = desc
-    
-    return parameters
+def known_help_fingerprint(service: str, command: str, backend: str) -> Optional[str]:
+    """A command's current help fingerprint, if it is available without running `aws`"""
+    if backend == 'inprocess':
+        params = get_inprocess_help().get_parameters(service, command)
+        if params is not None:
+            return fingerprint(params)
+    
+    cache = get_help_cache()
+    version = get_awscli_version() if cache else ''
+    cached = cache.get(version, service, command) if version else None
+    if cached is None:
+        return None
+    return fingerprint(parse_parameters(strip_formatting(cached)))
 
-def load_cleaned_data():
-    """Load cleaned command data"""
-    with open('lib/aws-commands.ts', 'r') as f:
-        content = f.read()
+def select_changed_commands(data, store: FingerprintStore, loader, help_fingerprint: Callable[[str, str], Optional[str]],
+                            cli_version: str) -> Tuple[Set[Tuple[str, str]], Dict]:
+    """Pick the commands whose botocore model or help fingerprint changed since the last run
+    
+    help_fingerprint(service, command) gives a command's current help fingerprint
+    when it can be had cheaply (None otherwise); it is only asked about commands
+    that have no per-operation model.
+    """
+    selected = set()
+    model_prints = {}
     
-    match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-    if not match:
-        return []
+    for service_data in data:
+        service_name = service_data['name']
+        prints = model_fingerprints(loader, service_name)
+        model_prints[service_name] = prints
+        service_changed = prints is not None and store.services.get(service_name) != prints['service']
+        
+        for command in service_data['commands']:
+            cmd_name = command['name']
+            previous = store.get_command(service_name, cmd_name)
+            if not previous:
+                # Never extracted with fingerprints recorded
+                selected.add((service_name, cmd_name))
+            elif prints is not None and cmd_name in prints['commands']:
+                if service_changed and previous.get('model') != prints['commands'][cmd_name]:
+                    selected.add((service_name, cmd_name))
+            elif service_changed:
+                # Customization (e.g. wait) of a service whose model changed
+                selected.add((service_name, cmd_name))
+            else:
+                # CLI-only service or customization: no per-operation model, so
+                # compare its help, or re-check it after a CLI upgrade
+                current = help_fingerprint(service_name, cmd_name)
+                if current is not None:
+                    changed = current != previous.get('help')
+                else:
+                    changed = previous.get('cli') != cli_version
+                if changed:
+                    selected.add((service_name, cmd_name))
     
-    return eval(match.group(1))
+    return selected, model_prints
 
-def extract_parameters(test_mode=False, force_mode=False):
+def timed_out(runner, service: str, command: str) -> bool:
+    """Whether the runner gave up on a command's help after repeated timeouts"""
+    suffix = f" {service} {command} help"
+    return any(failure['command'].endswith(suffix) and failure['reason'].startswith('timed out')
+               for failure in runner.failures)
+
+def extract_parameters(test_mode=False, force_mode=False, jobs=1, backend='subprocess', incremental=False, resume=False):
     """Extract parameters for all commands"""
     print("🔧 AWS Parameter Extraction\n")
     
     # Load cleaned data
-    data = load_cleaned_data()
+    with span('load data'):
+        data = load_services()
     print(f"📂 Loaded {len(data)} services")
     
     total_commands = sum(len(s['commands']) for s in data)
@@ -157,71 +132,274 @@ def extract_parameters(test_mode=False, force_mode=False):
     if force_mode:
         print("⚡ FORCE MODE: Re-extracting ALL commands (including those with existing params)\n")
     
+    if backend == 'inprocess' and get_inprocess_help() is None:
+        print("⚠️  awscli package not importable, falling back to subprocess backend\n")
+        backend = 'subprocess'
+    
+    store = FingerprintStore()
+    loader = get_model_loader()
+    model_prints = {}
+    cli_version = get_awscli_version()
+    
+    if incremental:
+        if loader is None:
+            print("❌ INCREMENTAL MODE needs botocore (pip install botocore)")
+            return
+        print("🔁 INCREMENTAL MODE: Re-extracting commands whose botocore model changed\n")
+        with span('model fingerprints', changed_only=True):
+            selected, model_prints = select_changed_commands(
+                data, store, loader,
+                lambda service, command: known_help_fingerprint(service, command, backend),
+                cli_version
+            )
+        needs_extraction = lambda service, command: (service, command['name']) in selected
+    else:
+        if loader is not None:
+            with span('model fingerprints'):
+                model_prints = {s['name']: model_fingerprints(loader, s['name']) for s in data}
+        needs_extraction = lambda service, command: force_mode or not command.get('parameters')
+    
+    journal = CheckpointJournal()
+    if resume:
+        finished = journal.load()
+        print(f"↺ RESUME MODE: {len(finished)} commands already finished in {journal.path}\n")
+    else:
+        finished = {}
+        journal.reset()
+    
+    if backend == 'inprocess':
+        # awscli isn't thread-safe, and in-process lookups are cheap anyway
+        print("🐍 IN-PROCESS MODE: reading arguments from awscli directly\n")
+        jobs = 1
+    elif jobs > 1:
+        print(f"🚀 PARALLEL MODE: {jobs} workers\n")
+    
+    # Work out which commands need extraction, in service/command order
+    tasks = []
+    for service_data in data:
+        for command in service_data['commands']:
+            key = (service_data['name'], command['name'])
+            if key not in finished and needs_extraction(service_data['name'], command):
+                tasks.append(key)
+    
     processed = 0
     skipped = 0
+    resumed = 0
+    failed = 0
     total_params = 0
+    changes = {'services': [], 'commands': {}}
+    started = time.monotonic()
     
-    for service_idx, service_data in enumerate(data, 1):
-        service_name = service_data['name']
-        commands = service_data['commands']
-        
-        print(f"[{service_idx}/{len(data)}] {service_name} ({len(commands)} commands)")
-        
-        for cmd_idx, command in enumerate(commands, 1):
-            cmd_name = command['name']
-            
-            # Skip if already has parameters (unless force mode)
-            if not force_mode and command.get('parameters') and len(command['parameters']) > 0:
-                print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - skipped (has {len(command['parameters'])} params)")
-                skipped += 1
-                continue
-            
-            # Extract parameters
-            help_text = run_aws_help(service_name, cmd_name)
-            
-            if not help_text:
-                print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ⚠️  no help")
-                continue
+    runner = get_runner()
+    futures = []
+    if backend == 'inprocess':
+        results = (fetch_parameters(*task, backend=backend) for task in tasks)
+    else:
+        # All commands are queued on the runner up front (it caps concurrency at
+        # --jobs); results are consumed in submission order so output stays
+        # deterministic and each command is journaled as soon as it's reached
+        runner.concurrency = jobs
+        futures = [runner.submit(fetch_help_async(runner, *task)) for task in tasks]
+        results = (parse_help(future.result()) for future in futures)
+    
+    try:
+        for service_idx, service_data in enumerate(data, 1):
+            service_name = service_data['name']
+            commands = service_data['commands']
             
-            params = parse_parameters(help_text)
+            print(f"[{service_idx}/{len(data)}] {service_name} ({len(commands)} commands)")
             
-            old_count = len(command.get('parameters', []))
-            command['parameters'] = params
+            for cmd_idx, command in enumerate(commands, 1):
+                cmd_name = command['name']
+                
+                # Replay commands finished by the interrupted run
+                entry = finished.get((service_name, cmd_name))
+                if entry:
+                    command['parameters'] = entry['parameters']
+                    store.set_command(service_name, cmd_name, model=entry.get('model'), help=entry.get('help'),
+                                      cli=entry.get('cli'))
+                    if entry.get('changed'):
+                        changes['commands'].setdefault(service_name, []).append(cmd_name)
+                    total_params += len(entry['parameters'])
+                    resumed += 1
+                    print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ↺ {len(entry['parameters'])} params (checkpoint)")
+                    continue
+                
+                # Skip if already has parameters / unchanged (unless force mode)
+                if not needs_extraction(service_name, command):
+                    if not incremental:
+                        print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - skipped (has {len(command['parameters'])} params)")
+                    skipped += 1
+                    continue
+                
+                # Waiting for the fetch plus parsing (the fetch itself is on a worker row)
+                with span('command', 'command', service=service_name, command=cmd_name):
+                    result = next(results)
+                
+                prints = model_prints.get(service_name)
+                model_print = prints['commands'].get(cmd_name) if prints else None
+                
+                if result is None:
+                    print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ⚠️  no help")
+                    failed += 1
+                    # Remembered so --incremental only retries it once the model or
+                    # CLI changes; timeouts are retried on the next run
+                    if not timed_out(runner, service_name, cmd_name):
+                        store.set_command(service_name, cmd_name, model=model_print, cli=cli_version)
+                    continue
+                
+                params, help_print = result
+                previous_help = store.get_command(service_name, cmd_name).get('help')
+                
+                old_count = len(command.get('parameters', []))
+                command['parameters'] = params
+                
+                total_params += len(params)
+                processed += 1
+                
+                changed = bool(previous_help) and previous_help != help_print
+                store.set_command(service_name, cmd_name, model=model_print, help=help_print, cli=cli_version)
+                journal.record(service_name, cmd_name, parameters=params, model=model_print, help=help_print,
+                               cli=cli_version, changed=changed)
+                
+                if incremental and previous_help == help_print:
+                    print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - = help unchanged")
+                    continue
+                if changed:
+                    changes['commands'].setdefault(service_name, []).append(cmd_name)
+                
+                if (force_mode or incremental) and old_count > 0:
+                    print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ✓ {len(params)} params (was {old_count})")
+                else:
+                    print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ✓ {len(params)} params")
             
-            total_params += len(params)
-            processed += 1
+            prints = model_prints.get(service_name)
+            if prints:
+                if store.services.get(service_name) not in (None, prints['service']):
+                    changes['services'].append(service_name)
+                store.services[service_name] = prints['service']
             
-            if force_mode and old_count > 0:
-                print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ✓ {len(params)} params (was {old_count})")
-            else:
-                print(f"  [{cmd_idx}/{len(commands)}] {cmd_name} - ✓ {len(params)} params")
+            done = processed + failed
+            if done and jobs > 1:
+                elapsed = time.monotonic() - started
+                print(f"  ⏱  {done}/{len(tasks)} commands, {done / elapsed:.1f} cmd/s")
+    except KeyboardInterrupt:
+        for future in futures:
+            future.cancel()
+        runner.close()
+        journal.close()
+        print(f"\n⏸  Interrupted after {processed} commands; progress is in {journal.path}")
+        print(f"   Continue with the same flags: {resume_command(sys.argv)}")
+        raise SystemExit(130)
+    journal.close()
+    
+    elapsed = time.monotonic() - started
     
     print(f"\n✅ Extraction Complete!")
     print(f"📊 Statistics:")
     print(f"   Services processed: {len(data)}")
     print(f"   Commands processed: {processed}")
     print(f"   Commands skipped: {skipped}")
+    if resume:
+        print(f"   Commands resumed from checkpoint: {resumed}")
+    print(f"   Commands without help: {failed}")
     print(f"   Parameters extracted: {total_params}")
+    print(f"   Elapsed: {elapsed:.1f}s ({(processed + failed) / elapsed if elapsed else 0:.1f} cmd/s, {jobs} workers, {backend} backend)")
+    
+    print(f"   Runner: {runner.summary()}")
+    
+    cache = get_help_cache()
+    if cache:
+        print(f"   Help cache: {cache.stats()}")
+    
+    if runner.failures:
+        print(f"\n⚠️  {len(runner.failures)} commands failed after retries:")
+        for failure in runner.failures:
+            print(f"   {failure['command']} - {failure['reason']} ({failure['attempts']} attempts)")
+        os.makedirs('reports', exist_ok=True)
+        with open(FAILURES_REPORT_FILE, 'w') as f:
+            json.dump(runner.failures, f, indent=2)
+        print(f"   Failure list saved to: {FAILURES_REPORT_FILE}")
+    
+    if incremental:
+        changed_commands = sum(len(c) for c in changes['commands'].values())
+        print(f"\n🔁 Changes since last run:")
+        print(f"   Services with a changed model: {', '.join(changes['services']) or 'none'}")
+        print(f"   Commands with changed help: {changed_commands}")
+        for service_name, changed in changes['commands'].items():
+            print(f"      {service_name}: {', '.join(changed)}")
+        
+        os.makedirs('reports', exist_ok=True)
+        with open(CHANGES_REPORT_FILE, 'w') as f:
+            json.dump(changes, f, indent=2)
+        print(f"   Report saved to: {CHANGES_REPORT_FILE}")
     
     # Save to JSON
-    output_file = '.dev-data/parameters-extracted-full.json' if force_mode else 'lib/parameters-extracted.json'
-    with open(output_file, 'w') as f:
+    output_file = '.dev-data/parameters-extracted-full.json' if force_mode or incremental else 'lib/parameters-extracted.json'
+    with span('save extracted', 'io', path=output_file), open(output_file, 'w') as f:
         json.dump(data, f, indent=2)
     
+    with span('save fingerprints', 'io'):
+        store.save()
+    
+    # Everything in the journal is now in the output file
+    journal.remove()
+    
     print(f"\n💾 Saved to: {output_file}")
 
+def resume_command(argv: List[str]) -> str:
+    """Command line that resumes this run: its own arguments plus --resume"""
+    args = ['python3', *argv]
+    if '--resume' not in args:
+        args.append('--resume')
+    return shlex.join(args)
+
+def parse_jobs(argv: List[str]) -> int:
+    """Read --jobs N / --jobs=N / -j N from the command line (default: 1)"""
+    for i, arg in enumerate(argv):
+        if arg in ('--jobs', '-j') and i + 1 < len(argv):
+            return max(1, int(argv[i + 1]))
+        if arg.startswith('--jobs='):
+            return max(1, int(arg.split('=', 1)[1]))
+    return 1
+
+def parse_backend(argv: List[str]) -> str:
+    """Read --backend subprocess|inprocess from the command line (default: subprocess)"""
+    for i, arg in enumerate(argv):
+        if arg == '--backend' and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith('--backend='):
+            value = arg.split('=', 1)[1]
+        else:
+            continue
+        if value not in ('subprocess', 'inprocess'):
+            raise SystemExit(f"Unknown backend: {value} (expected subprocess or inprocess)")
+        return value
+    return 'subprocess'
+
 if __name__ == '__main__':
-    import sys
-    
     # Check for test mode and force mode
     test_mode = '--test' in sys.argv
     force_mode = '--force' in sys.argv
+    incremental = '--incremental' in sys.argv
+    resume = '--resume' in sys.argv
+    jobs = parse_jobs(sys.argv)
+    backend = parse_backend(sys.argv)
     
-    if test_mode:
+    if resume:
+        print("Resuming the previous extraction run from its checkpoint journal\n")
+    elif test_mode:
         print("Running in TEST mode (first 5 services)\n")
+    elif incremental:
+        print("Running INCREMENTAL extraction (only commands whose botocore model changed)\n")
     elif force_mode:
         print("Running FULL extraction with FORCE mode (re-extract all commands)")
-        print("This will take 15-20 minutes...\n")
+        if backend == 'inprocess':
+            print("Using the in-process backend, this should take well under a minute...\n")
+        elif jobs > 1:
+            print(f"Using {jobs} workers, this should take a minute or two...\n")
+        else:
+            print("This will take 15-20 minutes (use --jobs N to parallelize)...\n")
     else:
         print("Running FULL extraction (all services)")
         print("This will take 10-15 minutes...\n")
@@ -230,4 +408,4 @@ if __name__ == '__main__':
             print("Cancelled")
             sys.exit(0)
     
-    extract_parameters(test_mode=test_mode, force_mode=force_mode)
+    extract_parameters(test_mode=test_mode, force_mode=force_mode, jobs=jobs, backend=backend, incremental=incremental, resume=resume)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Fake AWS CLI
+Stand-in for the `aws` binary that serves recorded help pages, so the extraction
+scripts can run fast and deterministically without the real CLI, and so the
+runner and help cache can be load-tested. Select it with:
+
+    export AWS_CLI="python3 scripts/fake-aws.py"
+
+Supported invocations: `--version`, `help`, `<service> help` and
+`<service> <command> help`. Anything else exits 252, like the real CLI does for
+an invalid choice.
+
+Environment:
+    FAKE_AWS_CORPUS=path       help pages (default: scripts/benchmarks/corpus/help-pages.jsonl.gz)
+    FAKE_AWS_CATALOG=botocore  list every botocore service and command instead of only the
+                               recorded ones; commands without a recorded page get one
+                               synthesized from a recorded page. The service/command list
+                               is built once and kept in the state directory
+    FAKE_AWS_LATENCY_MS=N      delay before answering (default: 0)
+    FAKE_AWS_JITTER_MS=N       extra uniform random delay of up to N ms
+    FAKE_AWS_FAIL_RATE=p       fraction of calls that exit 255 with an error on stderr
+    FAKE_AWS_HANG_RATE=p       fraction of calls that hang until killed (exercises timeouts)
+    FAKE_AWS_FAIL_ATTEMPTS=N   only inject faults into the first N calls of each command
+    FAKE_AWS_SEED=s            reproducible latency and faults per (command, attempt)
+    FAKE_AWS_STATE_DIR=path    per-command attempt counts and the botocore catalog
+                               (default: .dev-data/fake-aws; delete it to start over)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'corpus', 'help-pages.jsonl.gz')
+DEFAULT_STATE_DIR = os.path.join('.dev-data', 'fake-aws')
+
+# Exit codes of the real CLI
+EXIT_INVALID_CHOICE = 252
+EXIT_SERVICE_ERROR = 255
+
+LIST_PAGE = """{title}()                                                              {title}()
+
+
+
+NAME
+       {title} -
+
+DESCRIPTION
+       {description}
+
+{heading}
+{items}
+SEE ALSO
+       Served by scripts/fake-aws.py
+
+"""
+
+
+class Catalog:
+    """Services, commands and help pages the fake CLI knows about"""
+
+    def __init__(self, corpus_file: str, use_botocore: bool):
+        with open(corpus_file, 'rb') as f:
+            raw = f.read()
+        self.digest = hashlib.sha256(raw).hexdigest()[:12]
+        self.pages: Dict[Tuple[str, str], str] = {}
+        for line in gzip.decompress(raw).decode('utf-8').splitlines():
+            page = json.loads(line)
+            self.pages[(page['service'], page['command'])] = page['text']
+        self.listing = self._botocore_listing() if use_botocore else None
+
+    @staticmethod
+    def _botocore_listing() -> Dict[str, List[str]]:
+        """{service: [commands]} for every botocore model, built once per state directory"""
+        path = os.path.join(state_dir(), 'catalog.json')
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return json.load(f)
+
+        from botocore_models import BOTOCORE_SERVICE_NAMES, get_loader, list_services, load_service_model, cli_command_names
+        loader = get_loader()
+        listing = {service: cli_command_names(load_service_model(loader, service)) for service in list_services(loader)}
+        for cli_name, model_name in BOTOCORE_SERVICE_NAMES.items():
+            listing[cli_name] = listing.get(model_name, [])
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(listing, f)
+        os.replace(tmp_path, path)
+        return listing
+
+    def services(self) -> List[str]:
+        if self.listing is not None:
+            return sorted(self.listing)
+        return sorted({service for service, _ in self.pages})
+
+    def commands(self, service: str) -> List[str]:
+        if self.listing is not None and service in self.listing:
+            return self.listing[service]
+        return sorted(command for svc, command in self.pages if svc == service)
+
+    def page(self, service: str, command: str) -> Optional[str]:
+        if (service, command) in self.pages:
+            return self.pages[(service, command)]
+        if self.listing is None or command not in self.commands(service):
+            return None
+        # Same recorded page for the same command every time
+        keys = sorted(self.pages)
+        source_service, source_command = keys[int(hashlib.sha256(f"{service}/{command}".encode()).hexdigest(), 16) % len(keys)]
+        return self.pages[(source_service, source_command)].replace(source_command, command)
+
+
+def list_page(title: str, description: str, heading: str, names: List[str]) -> str:
+    items = ''.join(f"       o {name}\n\n" for name in names)
+    return LIST_PAGE.format(title=title, description=description, heading=heading, items=items)
+
+
+def state_dir() -> str:
+    path = os.environ.get('FAKE_AWS_STATE_DIR', DEFAULT_STATE_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def next_attempt(key: str) -> int:
+    """0 for a command's first call, 1 for its second, ... (safe across concurrent calls)"""
+    path = os.path.join(state_dir(), hashlib.sha256(key.encode('utf-8')).hexdigest()[:16])
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, b'.')
+        # O_APPEND: our offset is the end of our own byte, whatever others wrote
+        return os.lseek(fd, 0, os.SEEK_CUR) - 1
+    finally:
+        os.close(fd)
+
+
+def inject(args: List[str]) -> None:
+    """Apply the configured latency and faults to this call"""
+    env = os.environ
+    seed = env.get('FAKE_AWS_SEED')
+    fail_attempts = env.get('FAKE_AWS_FAIL_ATTEMPTS')
+    key = ' '.join(args)
+
+    attempt = next_attempt(key) if (seed is not None or fail_attempts) else 0
+    rng = random.Random(f"{seed}:{key}:{attempt}") if seed is not None else random.Random()
+
+    delay_ms = float(env.get('FAKE_AWS_LATENCY_MS', 0)) + rng.uniform(0, float(env.get('FAKE_AWS_JITTER_MS', 0)))
+    if delay_ms > 0:
+        time.sleep(delay_ms / 1000)
+
+    if fail_attempts and attempt >= int(fail_attempts):
+        return
+    roll = rng.random()
+    hang_rate = float(env.get('FAKE_AWS_HANG_RATE', 0))
+    if roll < hang_rate:
+        time.sleep(24 * 3600)
+    if roll < hang_rate + float(env.get('FAKE_AWS_FAIL_RATE', 0)):
+        sys.stderr.write(f"\nAn error occurred (ThrottlingException) when calling `aws {key}`: "
+                         f"Rate exceeded (injected by fake-aws)\n")
+        sys.exit(EXIT_SERVICE_ERROR)
+
+
+def invalid_choice(choice: str) -> None:
+    sys.stderr.write(f"\naws: error: argument command: Invalid choice, valid choices are: ... ({choice})\n")
+    sys.exit(EXIT_INVALID_CHOICE)
+
+
+def main(args: List[str]) -> None:
+    catalog = Catalog(os.environ.get('FAKE_AWS_CORPUS', CORPUS_FILE),
+                      os.environ.get('FAKE_AWS_CATALOG') == 'botocore')
+
+    if args == ['--version']:
+        print(f"aws-cli/fake-{catalog.digest} Python/{sys.version.split()[0]} fake-aws")
+        return
+
+    inject(args)
+
+    if args == ['help']:
+        sys.stdout.write(list_page('AWS', 'The AWS Command Line Interface (recorded pages).',
+                                   'AVAILABLE SERVICES', catalog.services()))
+    elif len(args) == 2 and args[1] == 'help':
+        commands = catalog.commands(args[0])
+        if not commands:
+            invalid_choice(args[0])
+        sys.stdout.write(list_page(args[0].upper(), f"Commands for {args[0]}.", 'AVAILABLE COMMANDS', commands))
+    elif len(args) == 3 and args[2] == 'help':
+        page = catalog.page(args[0], args[1])
+        if page is None:
+            invalid_choice(f"{args[0]} {args[1]}")
+        sys.stdout.write(page)
+    else:
+        invalid_choice(' '.join(args))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
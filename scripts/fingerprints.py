@@ -0,0 +1,109 @@
+"""
+Extraction fingerprints
+Records a SHA-256 of each service's botocore model (service-2.json), of each
+operation's slice of that model and of each command's parsed parameters (the
+same whichever backend produced them), so later runs can re-extract only the
+services and commands whose fingerprint changed.
+
+Stored in .dev-data/fingerprints.json:
+    {
+      "services": {"ec2": "<model sha>", ...},
+      "commands": {"ec2/describe-instances": {"model": "<sha>", "help": "<sha>", "cli": "aws-cli/..."}, ...}
+    }
+
+"cli" is the AWS CLI version the command was last extracted with. Commands
+without a per-operation model (CLI-only services and customizations) are
+re-checked against their help fingerprint when the current help is at hand
+without running `aws`, and otherwise when the CLI version changes.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Set
+
+DEFAULT_FINGERPRINT_FILE = os.path.join('.dev-data', 'fingerprints.json')
+
+
+def fingerprint(value) -> str:
+    """SHA-256 of a string, or of the canonical JSON form of any other value"""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+def _shape_closure(shapes: Dict, shape_name: str, seen: Set[str]) -> None:
+    """Collect the names of a shape and every shape it references"""
+    if not shape_name or shape_name in seen or shape_name not in shapes:
+        return
+    seen.add(shape_name)
+    shape = shapes[shape_name]
+    for member in shape.get('members', {}).values():
+        _shape_closure(shapes, member.get('shape'), seen)
+    for key in ('member', 'key', 'value'):
+        if key in shape:
+            _shape_closure(shapes, shape[key].get('shape'), seen)
+
+
+def input_shapes(shapes: Dict, operation: Dict) -> Set[str]:
+    """Names of every shape an operation's input reaches"""
+    referenced: Set[str] = set()
+    _shape_closure(shapes, operation.get('input', {}).get('shape'), referenced)
+    return referenced
+
+
+def model_fingerprints(loader, service_name: str) -> Optional[Dict]:
+    """Fingerprint a service model and each of its operations
+
+    Returns {'service': sha, 'commands': {cli command name: sha}}, or None if
+    botocore has no model for the service (CLI-only services like configure).
+    CLI service names are mapped to their model first (s3api -> s3).
+    """
+    from botocore_models import botocore_service_name, cli_command_name
+
+    try:
+        model = loader.load_service_model(botocore_service_name(service_name), 'service-2')
+    except Exception:
+        return None
+
+    shapes = model.get('shapes', {})
+    commands = {}
+    for operation_name, operation in model.get('operations', {}).items():
+        # An operation changes when its definition or any input shape it reaches changes
+        referenced = input_shapes(shapes, operation)
+        commands[cli_command_name(operation_name)] = fingerprint({
+            'operation': operation,
+            'shapes': {name: shapes[name] for name in sorted(referenced)}
+        })
+
+    return {'service': fingerprint(model), 'commands': commands}
+
+
+class FingerprintStore:
+    """Persistent service/command fingerprints from the previous run"""
+
+    def __init__(self, path: str = DEFAULT_FINGERPRINT_FILE):
+        self.path = path
+        self.services: Dict[str, str] = {}
+        self.commands: Dict[str, Dict[str, str]] = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                stored = json.load(f)
+            self.services = stored.get('services', {})
+            self.commands = stored.get('commands', {})
+
+    @staticmethod
+    def command_key(service: str, command: str) -> str:
+        return f"{service}/{command}"
+
+    def get_command(self, service: str, command: str) -> Dict[str, str]:
+        return self.commands.get(self.command_key(service, command), {})
+
+    def set_command(self, service: str, command: str, **fingerprints: Optional[str]) -> None:
+        entry = self.commands.setdefault(self.command_key(service, command), {})
+        entry.update({kind: fp for kind, fp in fingerprints.items() if fp})
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'services': self.services, 'commands': self.commands}, f, indent=2, sort_keys=True)
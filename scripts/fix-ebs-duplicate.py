@@ -1,21 +1,11 @@
 #!/usr/bin/env python3
 """Fix EBS duplicate by reloading and saving properly"""
 
-import json
+from aws_data import DATA_FILE, load_services, save_services
 
 print("🔧 Fixing EBS Duplicate\n")
 
-# Load as proper JSON (not eval)
-with open('lib/aws-commands.ts', 'r') as f:
-    content = f.read()
-
-# Extract JSON part
-import re
-match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-json_str = match.group(1)
-
-# Parse as JSON
-data = json.loads(json_str)
+data = load_services()
 
 print(f"📂 Loaded {len(data)} services\n")
 
@@ -43,38 +33,9 @@ if duplicates:
     ebs['commands'] = unique_commands
     print(f"EBS after: {len(ebs['commands'])} commands\n")
     
-    # Backup
-    import shutil
-    shutil.copy('lib/aws-commands.ts', '.dev-data/aws-commands.backup-before-ebs-dedup.ts')
-    print("💾 Backup saved\n")
-    
-    # Save
-    ts_content = f"""// AWS CLI command structure
-export interface CommandParameter {{
-  name: string;
-  description?: string;
-}}
-
-export interface Command {{
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}}
-
-export interface Service {{
-  name: string;
-  description?: string;
-  commands: Command[];
-}}
-
-// AWS CLI data structure
-export const awsServices: Service[] = {json.dumps(data, indent=2)};
-"""
-    
-    with open('lib/aws-commands.ts', 'w') as f:
-        f.write(ts_content)
-    
-    print("💾 Saved to lib/aws-commands.ts")
+    # Save (with backup)
+    save_services(data, backup='.dev-data/aws-commands.backup-before-ebs-dedup.json')
+    print(f"💾 Saved to {DATA_FILE}")
     
     # Stats
     total_commands = sum(len(s['commands']) for s in data)
@@ -8,6 +8,8 @@ import subprocess
 import json
 import re
 
+from aws_help import aws_cli
+
 # List of AWS services to include (from user's request)
 SERVICES = [
     # Core Identity & Access
@@ -34,7 +36,7 @@ def get_service_commands(service):
     """Get list of commands for a service"""
     try:
         result = subprocess.run(
-            ['aws', service, 'help'],
+            [*aws_cli(), service, 'help'],
             capture_output=True,
             text=True,
             timeout=5
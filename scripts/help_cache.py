@@ -0,0 +1,159 @@
+"""
+AWS CLI Help Cache
+On-disk, compressed, content-addressed cache of raw `aws <service> <command> help`
+output, keyed by (awscli version, service, command).
+
+Layout (under .dev-data/help-cache by default):
+    objects/ab/abcd...gz   gzip'd help text, named by the SHA-256 of its content
+    keys/12/1234...        SHA-256 of the object a (version, service, command) key points at
+
+Identical help pages (common for waiters and aliases) are stored once. When the
+objects grow past max_bytes the least recently used ones are evicted; keys that
+point at an evicted object are treated as misses.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from typing import List, Optional, Tuple
+
+DEFAULT_CACHE_DIR = os.path.join('.dev-data', 'help-cache')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class HelpCache:
+    """Content-addressed help text cache with size-based LRU eviction"""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+        self._lock = threading.Lock()
+
+    def _key_path(self, version: str, service: str, command: str) -> str:
+        digest = _digest(f"{version}\0{service}\0{command}".encode('utf-8'))
+        return os.path.join(self.root, 'keys', digest[:2], digest)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], digest + '.gz')
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, version: str, service: str, command: str) -> Optional[str]:
+        """Return cached help text, or None on a miss"""
+        key_path = self._key_path(version, service, command)
+        try:
+            with open(key_path, 'r') as f:
+                object_path = self._object_path(f.read().strip())
+            with open(object_path, 'rb') as f:
+                text = gzip.decompress(f.read()).decode('utf-8')
+        except (OSError, EOFError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the object so eviction sees it as recently used
+        try:
+            os.utime(object_path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, version: str, service: str, command: str, text: str) -> None:
+        """Store help text for a key"""
+        raw = text.encode('utf-8')
+        digest = _digest(raw)
+        object_path = self._object_path(digest)
+
+        added = 0
+        if not os.path.exists(object_path):
+            compressed = gzip.compress(raw)
+            self._write_atomic(object_path, compressed)
+            added = len(compressed)
+        self._write_atomic(self._key_path(version, service, command), digest.encode('ascii'))
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += added
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def _objects(self) -> List[Tuple[float, int, str]]:
+        """List (mtime, size, path) for every stored object"""
+        objects = []
+        objects_dir = os.path.join(self.root, 'objects')
+        for dirpath, _, filenames in os.walk(objects_dir):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                objects.append((stat.st_mtime, stat.st_size, path))
+        return objects
+
+    def size(self) -> int:
+        """Total compressed size of all stored objects in bytes"""
+        return sum(size for _, size, _ in self._objects())
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least recently used objects until under budget; returns bytes freed"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        # Evict down to 90% of the budget so we don't evict on every put
+        target = int(limit * 0.9)
+
+        with self._lock:
+            objects = sorted(self._objects())
+            total = sum(size for _, size, _ in objects)
+            freed = 0
+            removed = set()
+            for _, size, path in objects:
+                if total - freed <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                freed += size
+                removed.add(os.path.basename(path)[:-len('.gz')])
+
+            if removed:
+                self._remove_dangling_keys(removed)
+            self._size = total - freed
+        return freed
+
+    def _remove_dangling_keys(self, removed_digests: set) -> None:
+        keys_dir = os.path.join(self.root, 'keys')
+        for dirpath, _, filenames in os.walk(keys_dir):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    with open(path, 'r') as f:
+                        if f.read().strip() in removed_digests:
+                            os.remove(path)
+                except OSError:
+                    continue
+
+    def stats(self) -> str:
+        """One-line hit/miss summary"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0
+        return f"{self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate)"
@@ -0,0 +1,92 @@
+"""
+AWS CLI help text parser
+Turns the OPTIONS section of `aws <service> <command> help` output into
+[{'name': '--instance-ids <value>', 'description': '...'}, ...].
+
+Single pass over the lines with precompiled patterns: one regex recognises all
+three option header layouts, and descriptions are collected as lists of lines
+and joined once per parameter.
+"""
+
+import re
+from typing import Dict, List
+
+from tracing import traced
+
+MAX_DESCRIPTION_LENGTH = 250
+
+# Heading that starts the section we parse
+OPTIONS_HEADING = re.compile(r'^[ \t]*OPTIONS[ \t]*$', re.MULTILINE)
+
+# Option header lines, indented 6+ columns:
+#   --dry-run | --no-dry-run          (boolean pair, type optional)
+#   --cli-input-json | --cli-input-yaml (string)
+#   --instance-ids (list)
+PARAM_HEADER = re.compile(
+    r'\s{6,}(--[a-z0-9-]+)\s+'
+    r'(?:\|\s+(--no-[a-z0-9-]+|--[a-z0-9-]+(?=\s+\([^)]+\)))'
+    r'|\(([^)]+)\))'
+)
+
+WHITESPACE = re.compile(r'\s+')
+
+# Deeper-indented lines are examples, nested members and constraints
+DESCRIPTION_MAX_INDENT = ' ' * 12
+SECTION_INDENT = ' ' * 5
+
+
+def _param_name(match) -> str:
+    name, alternative, param_type = match.groups()
+    if alternative:
+        return f"{name} | {alternative}"
+    if param_type == 'boolean':
+        return f"{name} | --no-{name.lstrip('-')}"
+    return f"{name} <value>"
+
+
+def _finish(name: str, parts: List[str]) -> Dict[str, str]:
+    description = WHITESPACE.sub(' ', ' '.join(parts)).strip()
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        description = description[:MAX_DESCRIPTION_LENGTH - 3] + '...'
+    return {'name': name, 'description': description}
+
+
+@traced('parse_parameters', 'parse')
+def parse_parameters(help_text: str) -> List[Dict[str, str]]:
+    """Parse parameters from AWS CLI help output"""
+    parameters = []
+    if not help_text:
+        return parameters
+
+    heading = OPTIONS_HEADING.search(help_text)
+    if heading is None:
+        return parameters
+
+    name = None
+    parts: List[str] = []
+
+    for line in help_text[heading.end():].split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        # An unindented all-caps heading (GLOBAL OPTIONS, EXAMPLES, OUTPUT) ends the section
+        if len(stripped) > 3 and stripped.isupper() and not line.startswith(SECTION_INDENT):
+            break
+
+        if stripped.startswith('--'):
+            match = PARAM_HEADER.match(line)
+            if match:
+                if name is not None:
+                    parameters.append(_finish(name, parts))
+                name = _param_name(match)
+                parts = []
+
+        # The header line itself is kept as the start of the description (it shows the type)
+        if name is not None and not line.startswith(DESCRIPTION_MAX_INDENT) and not stripped.startswith('o '):
+            parts.append(stripped)
+
+    if name is not None:
+        parameters.append(_finish(name, parts))
+
+    return parameters
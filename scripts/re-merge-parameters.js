@@ -7,6 +7,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { ROOT, DATA_FILE, loadServices, saveServices } = require('./aws-data');
 
 console.log('🔄 Re-Merging Parameters (Smart Strategy)\n');
 
@@ -30,16 +31,7 @@ extractedData.forEach(service => {
 });
 
 // Load current data
-const currentPath = path.join(__dirname, '..', 'lib', 'aws-commands.ts');
-const currentContent = fs.readFileSync(currentPath, 'utf8');
-
-const match = currentContent.match(/export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);/);
-if (!match) {
-  console.error('❌ Could not parse aws-commands.ts');
-  process.exit(1);
-}
-
-const currentData = eval(match[1]);
+const currentData = loadServices();
 
 console.log(`📂 Loaded current data:`);
 const currentParams = currentData.reduce((sum, s) => 
@@ -87,37 +79,11 @@ console.log(`   Replaced (extracted had more): ${replaced}`);
 console.log(`   Preserved (existing had more): ${preserved}`);
 console.log(`   Added (was empty): ${added}\n`);
 
-// Generate final TypeScript file
-const tsContent = `// AWS CLI command structure
-export interface CommandParameter {
-  name: string;
-  description?: string;
-}
-
-export interface Command {
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}
-
-export interface Service {
-  name: string;
-  description?: string;
-  commands: Command[];
-}
-
-// AWS CLI data structure
-export const awsServices: Service[] = ${JSON.stringify(currentData, null, 2)};
-`;
-
-// Backup current file
-const backupPath = path.join(__dirname, '..', '.dev-data', `aws-commands.backup-${new Date().toISOString().split('T')[0]}-remerge.ts`);
-fs.copyFileSync(currentPath, backupPath);
+// Save updated data (with backup)
+const backupPath = path.join(ROOT, '.dev-data', `aws-commands.backup-${new Date().toISOString().split('T')[0]}-remerge.json`);
+saveServices(currentData, DATA_FILE, { backup: backupPath });
 console.log(`💾 Backup saved to: ${backupPath}`);
-
-// Save updated data
-fs.writeFileSync(currentPath, tsContent);
-console.log(`💾 Updated: ${currentPath}\n`);
+console.log(`💾 Updated: ${DATA_FILE}\n`);
 
 // Final statistics
 const finalParams = currentData.reduce((sum, s) => 
@@ -1,17 +1,12 @@
 #!/usr/bin/env python3
 """Remove duplicate commands from all services"""
 
-import json
-import re
+from aws_data import DATA_FILE, load_services, save_services
 
 print("🔧 Removing Duplicate Commands\n")
 
 # Load current data
-with open('lib/aws-commands.ts', 'r') as f:
-    content = f.read()
-
-match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-data = eval(match.group(1))
+data = load_services()
 
 print(f"📂 Loaded {len(data)} services\n")
 
@@ -56,38 +51,9 @@ else:
     print(f"   Total duplicates removed: {total_removed}")
     print(f"   Affected services: {', '.join(services_fixed)}\n")
     
-    # Backup
-    import shutil
-    shutil.copy('lib/aws-commands.ts', '.dev-data/aws-commands.backup-before-dedup.ts')
-    print("💾 Backup saved\n")
-    
-    # Save cleaned data
-    ts_content = f"""// AWS CLI command structure
-export interface CommandParameter {{
-  name: string;
-  description?: string;
-}}
-
-export interface Command {{
-  name: string;
-  description?: string;
-  parameters: CommandParameter[];
-}}
-
-export interface Service {{
-  name: string;
-  description?: string;
-  commands: Command[];
-}}
-
-// AWS CLI data structure
-export const awsServices: Service[] = {json.dumps(data, indent=2)};
-"""
-    
-    with open('lib/aws-commands.ts', 'w') as f:
-        f.write(ts_content)
-    
-    print("💾 Saved cleaned data to lib/aws-commands.ts")
+    # Save cleaned data (with backup)
+    save_services(data, backup='.dev-data/aws-commands.backup-before-dedup.json')
+    print(f"💾 Saved cleaned data to {DATA_FILE}")
     
     # Final stats
     total_commands = sum(len(s['commands']) for s in data)
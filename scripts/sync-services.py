@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+AWS Service Sync Script
+Brings services in lib/aws-commands.json in line with their botocore models:
+loads the data once, diffs each service's commands against the CLI's command
+table (its botocore operations plus customizations such as `wait`), fetches
+parameters for missing commands (and commands without parameters) in parallel,
+and writes the file once at the end. --dry-run stops after the diff report.
+
+Usage:
+    python3 scripts/sync-services.py ecr ecs eks
+    python3 scripts/sync-services.py all --jobs 16
+    python3 scripts/sync-services.py lambda --prune --dry-run
+"""
+
+import os
+import sys
+from typing import Dict, List
+
+from awscli_inprocess import get_inprocess_help
+from aws_data import DATA_FILE, data_stats, load_services, save_services
+from aws_help import fetch_help_async, get_runner
+from botocore_models import botocore_service_name, get_loader, list_services, load_service_model, cli_command_names
+from help_parser import parse_parameters
+from tracing import span
+
+BACKUP_FILE = '.dev-data/aws-commands.backup-before-sync.json'
+
+
+def parse_args(argv: List[str]) -> Dict:
+    options = {'services': [], 'jobs': os.cpu_count() or 4, 'prune': False, 'dry_run': False}
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--jobs', '-j'):
+            options['jobs'] = max(1, int(next(args)))
+        elif arg.startswith('--jobs='):
+            options['jobs'] = max(1, int(arg.split('=', 1)[1]))
+        elif arg == '--prune':
+            options['prune'] = True
+        elif arg == '--dry-run':
+            options['dry_run'] = True
+        else:
+            options['services'].append(arg)
+    return options
+
+
+def sync_services(services: List[str], jobs: int, prune: bool = False, dry_run: bool = False) -> None:
+    print("🔄 AWS Service Sync\n")
+
+    with span('load data'):
+        data = load_services()
+    by_name = {service['name']: service for service in data}
+
+    loader = get_loader()
+    available = set(list_services(loader))
+
+    # The CLI's command table lists customizations (wait, get-login-password,
+    # s3 cp, ...) next to the operations; without it only operations are known
+    renderer = get_inprocess_help()
+    if renderer is None:
+        print("  ⚠️  awscli not importable: diffing against botocore operations only")
+        if prune:
+            print("❌ --prune needs awscli, otherwise CLI customizations would be dropped")
+            return
+
+    if services == ['all']:
+        services = [service['name'] for service in data if botocore_service_name(service['name']) in available]
+
+    # Diff every service first, so all fetches can be queued at once
+    plans = []
+    for name in services:
+        if botocore_service_name(name) not in available:
+            print(f"  ⚠️  {name}: no botocore model, skipped")
+            continue
+
+        with span('load model', service=name):
+            model = load_service_model(loader, botocore_service_name(name))
+        table = renderer.command_names(name) if renderer else None
+        cli_commands = set(table if table is not None else cli_command_names(model))
+
+        service = by_name.get(name)
+        if service is None:
+            service = {'name': name, 'description': model.metadata.get('serviceFullName', name), 'commands': []}
+
+        existing = {command['name']: command for command in service['commands']}
+        fetch = sorted(cmd for cmd in cli_commands if cmd not in existing or not existing[cmd].get('parameters'))
+        stale = sorted(cmd for cmd in existing if cmd not in cli_commands)
+
+        plans.append({'service': service, 'existing': existing, 'fetch': fetch, 'stale': stale,
+                      'new_service': name not in by_name})
+        missing = sum(1 for cmd in fetch if cmd not in existing)
+        print(f"  {name}: {len(existing)} current, {missing} missing, "
+              f"{len(fetch) - missing} without parameters, {len(stale)} not in the CLI")
+
+    if dry_run:
+        print("\n🔍 Dry run - nothing fetched, lib/aws-commands.json not written")
+        return
+
+    tasks = [(plan['service']['name'], cmd) for plan in plans for cmd in plan['fetch']]
+    print(f"\n📥 Fetching parameters for {len(tasks)} commands ({jobs} workers)...\n")
+
+    runner = get_runner()
+    runner.concurrency = jobs
+    futures = iter([runner.submit(fetch_help_async(runner, *task)) for task in tasks])
+
+    added = updated = pruned = 0
+    for plan in plans:
+        service, existing = plan['service'], plan['existing']
+        for cmd in plan['fetch']:
+            with span('command', 'command', service=service['name'], command=cmd):
+                help_text = next(futures).result()
+                params = parse_parameters(help_text) if help_text else []
+            if cmd in existing:
+                existing[cmd]['parameters'] = params
+                updated += 1
+            else:
+                service['commands'].append({'name': cmd, 'description': f'{cmd} command', 'parameters': params})
+                added += 1
+
+        if prune and plan['stale']:
+            stale = set(plan['stale'])
+            service['commands'] = [command for command in service['commands'] if command['name'] not in stale]
+            pruned += len(stale)
+
+        service['commands'].sort(key=lambda x: x['name'])
+        if plan['new_service']:
+            data.append(service)
+
+        if plan['fetch']:
+            print(f"  ✓ {service['name']}: {len(service['commands'])} commands")
+
+    data.sort(key=lambda x: x['name'])
+
+    print(f"\n✅ Sync complete!")
+    print(f"   Services synced: {len(plans)}")
+    print(f"   Commands added: {added}")
+    print(f"   Commands re-extracted: {updated}")
+    if prune:
+        print(f"   Commands pruned: {pruned}")
+    print(f"   Runner: {runner.summary()}")
+
+    if runner.failures:
+        print(f"\n⚠️  {len(runner.failures)} commands failed after retries (saved with no parameters)")
+
+    if not (added or updated or pruned):
+        print("\n✨ Nothing to write")
+        return
+
+    with span('save data'):
+        save_services(data, backup=BACKUP_FILE)
+
+    print(f"\n💾 Saved to {DATA_FILE} (backup: {BACKUP_FILE})")
+    print(f"📊 Final: {data_stats(data)}")
+
+
+if __name__ == "__main__":
+    options = parse_args(sys.argv[1:])
+    if not options['services']:
+        print(__doc__.strip())
+        sys.exit(1)
+    sync_services(options['services'], options['jobs'], options['prune'], options['dry_run'])
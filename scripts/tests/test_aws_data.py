@@ -0,0 +1,130 @@
+"""
+Data store tests
+save_services() followed by load_services() gives back the same services list in
+both the plain and the string-table form, global parameters are interned once
+whatever their key order, shards take the store's form, and aws-data.js writes
+the same bytes.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from aws_data import is_packed, load_services, save_services, write_shards
+
+SERVICES = [
+    {'name': 'ec2', 'description': 'Amazon Elastic Compute Cloud', 'commands': [
+        {'name': 'describe-instances', 'description': 'Describes instances', 'parameters': [
+            {'name': '--instance-ids', 'description': 'The instance IDs'},
+            {'name': '--dry-run'},
+            {'name': '--debug', 'description': 'Turn on debug logging'},
+            {'name': '--region', 'description': 'The region to use'},
+        ]},
+        {'name': 'wait', 'parameters': [
+            {'description': 'Turn on debug logging', 'name': '--debug'},
+        ]},
+    ]},
+    {'name': 'translate', 'description': 'Übersetzung — “quotes”\tand a tab', 'commands': [
+        {'name': 'translate-text', 'description': 'Translates text', 'parameters': [
+            {'name': '--text', 'description': 'Größe ≤ 10 KB'},
+            {'name': '--region', 'description': 'The region to use'},
+        ]},
+        {'name': 'list-languages'},
+    ]},
+]
+
+
+class SaveLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def save(self, name: str, packed: bool) -> str:
+        path = os.path.join(self.directory, name)
+        save_services(json.loads(json.dumps(SERVICES)), path, typescript=False, packed=packed, shards=False)
+        return path
+
+    def test_plain_round_trip(self):
+        path = self.save('plain.json', packed=False)
+        self.assertFalse(is_packed(path))
+        self.assertEqual(load_services(path), SERVICES)
+
+    def test_packed_round_trip(self):
+        path = self.save('packed.json', packed=True)
+        self.assertTrue(is_packed(path))
+        self.assertEqual(load_services(path), SERVICES)
+
+    def test_save_keeps_form(self):
+        path = self.save('packed.json', packed=True)
+        save_services(load_services(path), path, typescript=False, shards=False)
+        self.assertTrue(is_packed(path))
+
+    def test_globals_interned_once(self):
+        with open(self.save('plain.json', packed=False)) as f:
+            stored = json.load(f)
+        self.assertEqual([param['name'] for param in stored['globalParameters']], ['--debug', '--region'])
+        self.assertEqual(stored['services'][0]['commands'][1]['parameters'], [0])
+
+    def test_compact_output(self):
+        with open(self.save('plain.json', packed=False), encoding='utf-8') as f:
+            content = f.read()
+        self.assertEqual(content.count('\n'), 1)
+        self.assertIn('Übersetzung', content)
+
+    def write_shards(self, name: str, packed: bool) -> str:
+        directory = os.path.join(self.directory, name)
+        write_shards(json.loads(json.dumps(SERVICES)), os.path.join(directory, 'manifest.json'),
+                     os.path.join(directory, 'services'), packed=packed)
+        return directory
+
+    def test_shards_round_trip(self):
+        for packed in (False, True):
+            shard_dir = os.path.join(self.write_shards('packed' if packed else 'plain', packed), 'services')
+            shards = sorted(os.listdir(shard_dir))
+            self.assertEqual([is_packed(os.path.join(shard_dir, shard)) for shard in shards], [packed] * 2)
+            self.assertEqual([load_services(os.path.join(shard_dir, shard))[0] for shard in shards], SERVICES)
+
+    @unittest.skipIf(shutil.which('node') is None, 'node not installed')
+    def test_same_shards_as_node(self):
+        for packed in (False, True):
+            python_dir = self.write_shards('python', packed)
+            node_dir = os.path.join(self.directory, 'node')
+            script = ("const path = require('path');"
+                      "const { writeShards } = require(process.argv[1]);"
+                      "writeShards(JSON.parse(process.argv[2]), path.join(process.argv[3], 'manifest.json'),"
+                      " path.join(process.argv[3], 'services'), process.argv[4] === 'packed');")
+            subprocess.run(['node', '-e', script, os.path.join(SCRIPTS_DIR, 'aws-data.js'),
+                            json.dumps(SERVICES), node_dir, 'packed' if packed else 'plain'], check=True)
+            for name in ['manifest.json'] + [os.path.join('services', shard)
+                                             for shard in sorted(os.listdir(os.path.join(python_dir, 'services')))]:
+                with open(os.path.join(python_dir, name), 'rb') as python_file, \
+                        open(os.path.join(node_dir, name), 'rb') as node_file:
+                    self.assertEqual(python_file.read(), node_file.read(), name)
+            shutil.rmtree(python_dir)
+            shutil.rmtree(node_dir)
+
+    @unittest.skipIf(shutil.which('node') is None, 'node not installed')
+    def test_same_bytes_as_node(self):
+        for packed in (False, True):
+            python_path = self.save('python.json', packed)
+            node_path = os.path.join(self.directory, 'node.json')
+            script = ("const { saveServices } = require(process.argv[1]);"
+                      "saveServices(JSON.parse(process.argv[2]), process.argv[3],"
+                      " { typescript: false, shards: false, packed: process.argv[4] === 'packed' });")
+            subprocess.run(['node', '-e', script, os.path.join(SCRIPTS_DIR, 'aws-data.js'),
+                            json.dumps(SERVICES), node_path, 'packed' if packed else 'plain'], check=True)
+            with open(python_path, 'rb') as python_file, open(node_path, 'rb') as node_file:
+                self.assertEqual(python_file.read(), node_file.read(), 'packed' if packed else 'plain')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Checkpoint journal tests
+Entries written by CheckpointJournal.record() are read back by load(), and a
+line left unfinished by a crash loses only that entry.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from checkpoint import CheckpointJournal
+
+
+class CheckpointJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'journal', 'extract.jsonl')
+
+    def journal(self) -> CheckpointJournal:
+        journal = CheckpointJournal(self.path)
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_round_trip(self):
+        journal = self.journal()
+        journal.record('ec2', 'describe-instances', parameters=[{'name': '--dry-run'}], help='abc')
+        journal.record('s3api', 'get-object', parameters=[])
+        journal.close()
+
+        entries = self.journal().load()
+        self.assertEqual(set(entries), {('ec2', 'describe-instances'), ('s3api', 'get-object')})
+        self.assertEqual(entries[('ec2', 'describe-instances')]['parameters'], [{'name': '--dry-run'}])
+        self.assertEqual(entries[('ec2', 'describe-instances')]['help'], 'abc')
+
+    def test_later_entry_wins(self):
+        journal = self.journal()
+        journal.record('ec2', 'run-instances', parameters=[])
+        journal.record('ec2', 'run-instances', parameters=[{'name': '--count <value>'}])
+        journal.close()
+        self.assertEqual(self.journal().load()[('ec2', 'run-instances')]['parameters'], [{'name': '--count <value>'}])
+
+    def test_partial_last_line_after_crash(self):
+        journal = self.journal()
+        journal.record('ec2', 'describe-instances', parameters=[])
+        journal.close()
+        with open(self.path, 'a') as f:
+            f.write('{"service": "ec2", "command": "run-inst')
+
+        resumed = self.journal()
+        self.assertEqual(set(resumed.load()), {('ec2', 'describe-instances')})
+        resumed.record('ec2', 'stop-instances', parameters=[])
+        resumed.close()
+
+        self.assertEqual(set(self.journal().load()), {('ec2', 'describe-instances'), ('ec2', 'stop-instances')})
+
+    def test_partial_only_line(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            f.write('{"service": "ec2"')
+        journal = self.journal()
+        journal.record('ec2', 'stop-instances', parameters=[])
+        journal.close()
+        self.assertEqual(set(self.journal().load()), {('ec2', 'stop-instances')})
+
+    def test_reset_and_remove(self):
+        journal = self.journal()
+        journal.record('ec2', 'describe-instances', parameters=[])
+        journal.reset()
+        self.assertEqual(journal.load(), {})
+        journal.record('ec2', 'describe-instances', parameters=[])
+        journal.remove()
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Fingerprint selection tests
+model_fingerprints() and extract-parameters.py's select_changed_commands() on
+small in-memory models: a run right after a full run selects nothing, and only
+commands whose model or help changed are picked up afterwards.
+"""
+
+import copy
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from fingerprints import FingerprintStore, fingerprint, model_fingerprints
+
+try:
+    # CLI command names come from botocore.xform_name
+    import botocore_models
+except ImportError:
+    botocore_models = None
+
+
+def load_extract_parameters():
+    spec = importlib.util.spec_from_file_location('extract_parameters', os.path.join(SCRIPTS_DIR, 'extract-parameters.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def model(*operations):
+    return {
+        'operations': {name: {'name': name, 'input': {'shape': f"{name}Request"}} for name in operations},
+        'shapes': {f"{name}Request": {'type': 'structure', 'members': {}} for name in operations},
+    }
+
+
+class FakeLoader:
+    """Stands in for botocore's data loader"""
+
+    def __init__(self, models):
+        self.models = models
+
+    def load_service_model(self, service_name, type_name):
+        if service_name not in self.models:
+            raise KeyError(service_name)
+        return self.models[service_name]
+
+
+DATA = [
+    {'name': 'ec2', 'commands': [{'name': 'describe-instances'}, {'name': 'run-instances'}, {'name': 'wait'}]},
+    {'name': 's3api', 'commands': [{'name': 'get-object'}]},
+    {'name': 'configure', 'commands': [{'name': 'list'}, {'name': 'broken'}]},
+]
+
+HELP = {('ec2', 'wait'): 'wait-help', ('configure', 'list'): 'list-help'}
+
+CLI_VERSION = 'aws-cli/1.0.0'
+
+
+@unittest.skipIf(botocore_models is None, 'botocore not installed')
+class SelectChangedCommandsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.extract = load_extract_parameters()
+
+    def setUp(self):
+        self.models = {
+            'ec2': model('DescribeInstances', 'RunInstances'),
+            's3': model('GetObject'),
+        }
+        self.help = dict(HELP)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = FingerprintStore(os.path.join(directory.name, 'fingerprints.json'))
+        self.full_run()
+
+    def help_fingerprint(self, service, command):
+        text = self.help.get((service, command))
+        return None if text is None else fingerprint(text)
+
+    def full_run(self):
+        """Record fingerprints the way a full extraction does"""
+        loader = FakeLoader(self.models)
+        for service in DATA:
+            prints = model_fingerprints(loader, service['name'])
+            if prints:
+                self.store.services[service['name']] = prints['service']
+            for command in service['commands']:
+                model_print = prints['commands'].get(command['name']) if prints else None
+                # configure broken has no help page: only model and CLI version are kept
+                help_print = None if command['name'] == 'broken' else fingerprint(
+                    self.help.get((service['name'], command['name']), command['name']))
+                self.store.set_command(service['name'], command['name'], model=model_print,
+                                       help=help_print, cli=CLI_VERSION)
+
+    def select(self, cli_version=CLI_VERSION):
+        selected, _ = self.extract.select_changed_commands(
+            DATA, self.store, FakeLoader(self.models), self.help_fingerprint, cli_version)
+        return selected
+
+    def test_cli_service_name_maps_to_model(self):
+        prints = model_fingerprints(FakeLoader(self.models), 's3api')
+        self.assertIsNotNone(prints)
+        self.assertIn('get-object', prints['commands'])
+
+    def test_nothing_after_full_run(self):
+        self.assertEqual(self.select(), set())
+
+    def test_changed_operation(self):
+        self.models['ec2'] = copy.deepcopy(self.models['ec2'])
+        self.models['ec2']['shapes']['RunInstancesRequest']['members']['DryRun'] = {'shape': 'Boolean'}
+        # The wait customization is re-checked with its service
+        self.assertEqual(self.select(), {('ec2', 'run-instances'), ('ec2', 'wait')})
+
+    def test_cli_only_help_changed(self):
+        self.help[('configure', 'list')] = 'new list help'
+        self.assertEqual(self.select(), {('configure', 'list')})
+
+    def test_cli_upgrade_without_known_help(self):
+        self.help.clear()
+        self.assertEqual(self.select('aws-cli/2.0.0'), {('ec2', 'wait'), ('configure', 'list'), ('configure', 'broken')})
+
+    def test_never_extracted(self):
+        self.store.commands.pop(FingerprintStore.command_key('ec2', 'describe-instances'))
+        self.assertEqual(self.select(), {('ec2', 'describe-instances')})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Help parser tests
+parse_parameters() on a page in the `aws ... help` (groff) layout, parity
+between the subprocess and in-process backends over the corpus pages recorded
+from `aws help`, and the in-process parameter names against the help document
+awscli itself generates (the reST that `aws help` hands to groff).
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+import unittest
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aws_help import strip_formatting
+from awscli_inprocess import get_inprocess_help
+from help_parser import MAX_DESCRIPTION_LENGTH, parse_parameters
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks', 'corpus', 'help-pages.jsonl.gz')
+
+
+def bold(text: str) -> str:
+    """Bold text the way groff prints it (X\\bX)"""
+    return ''.join(f"{c}\b{c}" for c in text)
+
+
+PAGE = f"""DESCRIBE-INSTANCES()                                      DESCRIBE-INSTANCES()
+
+
+
+{bold('NAME')}
+       describe-instances -
+
+{bold('DESCRIPTION')}
+       Describes the specified instances or all instances.
+
+{bold('SYNOPSIS')}
+            describe-instances
+          [--instance-ids <value>]
+          [--dry-run | --no-dry-run]
+
+{bold('OPTIONS')}
+       {bold('--instance-ids')} (list)
+          The instance IDs. This paragraph is long enough that groff wraps it
+          onto a second line at the terminal width.
+
+              Nested member text stays out of the description.
+
+       {bold('--dry-run')} | {bold('--no-dry-run')} (boolean)
+          Checks whether you have the required permissions for the action.
+
+       {bold('--cli-input-json')} | {bold('--cli-input-yaml')} (string)
+          Reads arguments from the JSON string provided.
+
+       {bold('--max-items')} (integer)
+          {'word ' * 80}
+
+{bold('GLOBAL OPTIONS')}
+       {bold('--debug')} (boolean)
+          Turn on debug logging.
+"""
+
+
+class ParseParametersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parameters = parse_parameters(strip_formatting(PAGE))
+
+    def test_names(self):
+        self.assertEqual([p['name'] for p in self.parameters], [
+            '--instance-ids <value>',
+            '--dry-run | --no-dry-run',
+            '--cli-input-json | --cli-input-yaml',
+            '--max-items <value>',
+        ])
+
+    def test_description_joins_wrapped_lines(self):
+        self.assertEqual(
+            self.parameters[0]['description'],
+            '--instance-ids (list) The instance IDs. This paragraph is long enough that '
+            'groff wraps it onto a second line at the terminal width.'
+        )
+
+    def test_description_truncated(self):
+        description = self.parameters[3]['description']
+        self.assertEqual(len(description), MAX_DESCRIPTION_LENGTH)
+        self.assertTrue(description.endswith('...'))
+
+    def test_no_options_section(self):
+        self.assertEqual(parse_parameters('NAME\n       ls -\n'), [])
+        self.assertEqual(parse_parameters(''), [])
+
+
+def corpus_pages():
+    with gzip.open(CORPUS_FILE, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@unittest.skipUnless(os.path.exists(CORPUS_FILE), 'no recorded corpus')
+class BackendParityTest(unittest.TestCase):
+    """Both extraction backends must write the same parameters for a command"""
+
+    def test_corpus(self):
+        renderer = get_inprocess_help()
+        if renderer is None:
+            self.skipTest('awscli package not importable')
+
+        # In-process pages are the renderer's own output; comparing against them
+        # would test nothing. Pages recorded with another CLI version describe
+        # other models.
+        pages = [page for page in corpus_pages() if page.get('source') == 'cli']
+        if not pages:
+            self.skipTest('no corpus pages recorded from `aws help` (record-help-corpus.py --source cli)')
+        pages = [page for page in pages if page.get('cli') == renderer.version]
+        if not pages:
+            self.skipTest(f'corpus not recorded with {renderer.version}')
+
+        for page in pages:
+            with self.subTest(service=page['service'], command=page['command']):
+                self.assertEqual(
+                    renderer.get_parameters(page['service'], page['command']),
+                    parse_parameters(strip_formatting(page['text']))
+                )
+
+
+# An option heading in awscli's help document: ``--dry-run`` | ``--no-dry-run`` (boolean)
+DOC_OPTION_NAME = re.compile(r'``(--[^`]+)``')
+
+
+def document_options(document: str) -> list:
+    """Option names per heading in the OPTIONS section of an awscli help document"""
+    section = document.split('\nOptions\n=======\n', 1)[-1].split('\nGlobal Options\n', 1)[0]
+    return [' | '.join(DOC_OPTION_NAME.findall(line.split(' (', 1)[0]))
+            for line in section.splitlines() if line.startswith('``--')]
+
+
+@unittest.skipUnless(os.path.exists(CORPUS_FILE), 'no recorded corpus')
+class HelpDocumentParityTest(unittest.TestCase):
+    """In-process parameter names match the help document awscli renders for `aws help`
+
+    The document is built by awscli's own help command, independently of the
+    argument tables InProcessHelp reads, so names, boolean pairs and order are
+    checked without groff. The groff layout itself is covered by PAGE above and
+    by BackendParityTest once CLI pages are recorded.
+    """
+
+    def test_corpus_commands(self):
+        renderer = get_inprocess_help()
+        if renderer is None:
+            self.skipTest('awscli package not importable')
+
+        from awscli.bcdoc import docevents
+        from awscli.clidriver import create_clidriver
+        from awscli_inprocess import _subcommand_table
+
+        driver = create_clidriver()
+        command_table = driver._get_command_table()
+
+        def document(service: str, command: str) -> str:
+            help_command = _subcommand_table(command_table[service])[command].create_help_command()
+            # What HelpCommand.__call__ does before handing the document to groff
+            handler = help_command.EventHandlerClass(help_command)
+            with warnings.catch_warnings():
+                # awscli's example loader leaves the example files open
+                warnings.simplefilter('ignore', ResourceWarning)
+                docevents.generate_events(driver.session, help_command)
+            handler.unregister()
+            return help_command.doc.getvalue().decode('utf-8')
+
+        for page in corpus_pages():
+            with self.subTest(service=page['service'], command=page['command']):
+                names = [parameter['name'].replace(' <value>', '')
+                         for parameter in renderer.get_parameters(page['service'], page['command'])]
+                self.assertEqual(names, document_options(document(page['service'], page['command'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
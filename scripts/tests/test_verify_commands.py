@@ -0,0 +1,82 @@
+"""
+Command verification tests
+verify-commands.py's get_actual_commands() on a small in-memory model: CLI
+service names are mapped to their botocore model, and concurrent lookups share
+one memoized ServiceModel.
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+try:
+    import botocore_models
+except ImportError:
+    botocore_models = None
+
+
+def load_verify_commands():
+    spec = importlib.util.spec_from_file_location('verify_commands', os.path.join(SCRIPTS_DIR, 'verify-commands.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def model(*operations):
+    return {
+        'metadata': {},
+        'operations': {name: {'name': name} for name in operations},
+        'shapes': {},
+    }
+
+
+class FakeLoader:
+    """Stands in for botocore's data loader, counting loads per service"""
+
+    def __init__(self, models):
+        self.models = models
+        self.loads = []
+
+    def load_service_model(self, service_name, type_name):
+        self.loads.append(service_name)
+        return self.models[service_name]
+
+
+@unittest.skipIf(botocore_models is None, 'botocore not installed')
+class GetActualCommandsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.verify = load_verify_commands()
+
+    def setUp(self):
+        # The memo is module-wide: start and end each test without these models
+        self.names = ('s3', 'test-service')
+        self.addCleanup(self.forget_models)
+        self.forget_models()
+
+    def forget_models(self):
+        for name in self.names:
+            botocore_models._models.pop(name, None)
+
+    def test_cli_service_uses_its_botocore_model(self):
+        loader = FakeLoader({'s3': model('GetObject', 'PutObject')})
+        commands = self.verify.get_actual_commands(loader, {'s3'}, 's3api')
+        self.assertEqual(commands, {'get-object', 'put-object'})
+        self.assertEqual(loader.loads, ['s3'])
+
+    def test_concurrent_lookups_share_one_model(self):
+        loader = FakeLoader({'test-service': model('ListThings')})
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            models = list(pool.map(lambda _: botocore_models.load_service_model(loader, 'test-service'), range(32)))
+        self.assertTrue(all(m is models[0] for m in models))
+        self.assertEqual(models[0].operation_names, ['ListThings'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Pipeline tracing
+Opt-in spans for the extraction scripts: each stage (load, fetch, parse, save)
+and each command records how long it took, and the run is exported as Chrome
+trace JSON - open it in https://ui.perfetto.dev or chrome://tracing - with a
+per-span summary table printed at exit.
+
+    AWS_TRACE=reports/traces/extract.json python3 scripts/extract-parameters.py --force --jobs 8
+
+Without AWS_TRACE every helper is a no-op (traced() returns the function
+unchanged), so instrumented code costs nothing in normal runs.
+
+    from tracing import span, traced, mark
+
+    with span('save', 'io', path=path):
+        ...
+
+    @traced('parse_parameters', 'parse')
+    def parse_parameters(help_text): ...
+
+Spans on the aws-runner event loop overlap (one per running `aws` process), so
+they are drawn on one row per worker slot instead of the loop's thread.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+TRACE_ENV = 'AWS_TRACE'
+
+# Worker rows get thread ids well clear of real ones
+LANE_TID_BASE = 1_000_000
+
+
+class Tracer:
+    """Collects complete ('X') and instant ('i') trace events in memory"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.events: List[Dict] = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._threads: Dict[int, str] = {}
+        self._lanes: List[bool] = []
+
+    def now(self) -> float:
+        """Microseconds since the tracer started"""
+        return (time.perf_counter_ns() - self._origin) / 1000
+
+    def _tid(self) -> int:
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        if tid not in self._threads:
+            with self._lock:
+                self._threads[tid] = thread.name
+        return tid
+
+    def add(self, name: str, category: str, start: float, end: float, args: Dict, tid: Optional[int] = None) -> None:
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': end - start,
+                 'pid': self.pid, 'tid': self._tid() if tid is None else tid}
+        if args:
+            event['args'] = args
+        with self._lock:
+            self.events.append(event)
+
+    def mark(self, name: str, category: str, args: Dict) -> None:
+        event = {'name': name, 'cat': category, 'ph': 'i', 's': 't', 'ts': self.now(),
+                 'pid': self.pid, 'tid': self._tid()}
+        if args:
+            event['args'] = args
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def lane(self):
+        """Lowest free worker row, held for the duration of the block"""
+        with self._lock:
+            try:
+                slot = self._lanes.index(False)
+            except ValueError:
+                slot = len(self._lanes)
+                self._lanes.append(False)
+            self._lanes[slot] = True
+        try:
+            yield LANE_TID_BASE + slot
+        finally:
+            with self._lock:
+                self._lanes[slot] = False
+
+    def summary(self) -> List[Dict]:
+        """Per span name: count, total, mean, p95 and max in ms, by total time"""
+        with self._lock:
+            events = [event for event in self.events if event['ph'] == 'X']
+        durations = defaultdict(list)
+        categories = {}
+        for event in events:
+            durations[event['name']].append(event['dur'] / 1000)
+            categories[event['name']] = event['cat']
+
+        rows = []
+        for name, values in durations.items():
+            values.sort()
+            rows.append({
+                'name': name,
+                'category': categories[name],
+                'count': len(values),
+                'total_ms': round(sum(values), 3),
+                'mean_ms': round(sum(values) / len(values), 3),
+                'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))], 3),
+                'max_ms': round(values[-1], 3)
+            })
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def export(self) -> None:
+        """Write the Chrome trace JSON and print the summary table"""
+        wall_ms = self.now() / 1000
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+            lanes = len(self._lanes)
+
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                     'args': {'name': os.path.basename(sys.argv[0]) or 'python'}}]
+        for tid, name in threads.items():
+            metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}})
+        for slot in range(lanes):
+            metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': LANE_TID_BASE + slot,
+                             'args': {'name': f'aws worker {slot + 1}'}})
+
+        rows = self.summary()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms',
+                       'otherData': {'wall_ms': round(wall_ms, 3), 'summary': rows}}, f)
+
+        print(f"\n🧵 Trace: {len(events)} events over {wall_ms / 1000:.2f}s saved to {self.path}")
+        print(format_summary(rows, wall_ms))
+
+
+def format_summary(rows: List[Dict], wall_ms: float) -> str:
+    """Fixed-width table of summary() rows (nested spans overlap, so % can add up past 100)"""
+    width = max([len(row['name']) for row in rows] + [4])
+    lines = [f"   {'span':<{width}} {'count':>7} {'total ms':>11} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9} {'% wall':>7}"]
+    for row in rows:
+        share = 100 * row['total_ms'] / wall_ms if wall_ms else 0
+        lines.append(f"   {row['name']:<{width}} {row['count']:>7} {row['total_ms']:>11,.1f} {row['mean_ms']:>9.2f} "
+                     f"{row['p95_ms']:>9.2f} {row['max_ms']:>9.2f} {share:>6.1f}%")
+    return '\n'.join(lines)
+
+
+def _start() -> Optional[Tracer]:
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return None
+    tracer = Tracer(path)
+    atexit.register(tracer.export)
+    return tracer
+
+
+_tracer = _start()
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+class _Span:
+    __slots__ = ('name', 'category', 'args', 'tid', 'start')
+
+    def __init__(self, name: str, category: str, args: Dict, tid: Optional[int]):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.tid = tid
+
+    def __enter__(self):
+        self.start = _tracer.now()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        _tracer.add(self.name, self.category, self.start, _tracer.now(), self.args, self.tid)
+        return False
+
+
+_NO_SPAN = nullcontext()
+
+
+def span(name: str, category: str = 'stage', tid: Optional[int] = None, **args):
+    """Context manager timing a block (args end up in the trace event)"""
+    if _tracer is None:
+        return _NO_SPAN
+    return _Span(name, category, args, tid)
+
+
+def mark(name: str, category: str = 'event', **args) -> None:
+    """Instant event, e.g. a retry or a timeout"""
+    if _tracer is not None:
+        _tracer.mark(name, category, args)
+
+
+def lane():
+    """Context manager yielding a worker-row tid for overlapping spans (None when off)"""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.lane()
+
+
+def traced(name: Optional[str] = None, category: str = 'function'):
+    """Decorator: a span around every call (the function itself when tracing is off)"""
+    def decorate(function):
+        if _tracer is None:
+            return function
+        label = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with _Span(label, category, {}, None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
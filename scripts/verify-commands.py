@@ -2,64 +2,58 @@
 """
 AWS Command Verification Script
 Verifies command accuracy and identifies duplicates by comparing with actual AWS CLI
+
+Service models are read offline from the local botocore data directory through
+one shared loader (no session or client per service), and services are checked
+on a worker pool.
+
+The report only lists problems: services without duplicates, invalid or missing
+commands are left out, and nothing is truncated. The previous report is kept as
+reports/command-verification.previous.json; --diff also writes the commands that
+appeared or went away since then to reports/command-verification-diff.json.
+
+Usage:
+    python3 scripts/verify-commands.py
+    python3 scripts/verify-commands.py --jobs 16
+    python3 scripts/verify-commands.py --diff
 """
 
 import json
-import subprocess
-import re
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Set
-from collections import defaultdict
+from aws_data import DATA_FILE, load_services
+from botocore_models import botocore_service_name, get_loader, list_services, load_service_model, cli_command_names
+from tracing import span
 
-def run_aws_command(cmd: List[str]) -> str:
-    """Run AWS CLI command and return output"""
-    try:
-        env = {'AWS_PAGER': ''}
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=10,
-            env={**subprocess.os.environ, **env}
-        )
-        return result.stdout
-    except Exception as e:
-        return ""
+REPORT_FILE = 'reports/command-verification.json'
+PREVIOUS_REPORT_FILE = 'reports/command-verification.previous.json'
+DIFF_FILE = 'reports/command-verification-diff.json'
+CATEGORIES = ('duplicates', 'invalid', 'missing')
+# Categories that need the service model; duplicates are found without it
+MODEL_CATEGORIES = ('invalid', 'missing')
 
-def get_actual_commands(service: str) -> Set[str]:
-    """Get actual commands from AWS CLI for a service"""
+def get_actual_commands(loader, available: Set[str], service: str) -> Set[str]:
+    """Get actual commands for a service from its local botocore model"""
+    model_name = botocore_service_name(service)
+    if model_name not in available:
+        print(f"  ⚠️  Could not get commands for {service}: no botocore model")
+        return set()
     try:
-        # Use boto3 to get commands (more reliable)
-        from botocore.session import Session
-        from botocore import xform_name
-        
-        session = Session()
-        client = session.create_client(service, region_name='us-east-1')
-        service_model = client._service_model
-        operations = list(service_model.operation_names)
-        
-        # Convert to hyphen-case (AWS CLI format)
-        # xform_name converts CamelCase to snake_case, we need to convert to hyphen-case
-        commands = {xform_name(op).replace('_', '-') for op in operations}
-        return commands
+        with span('load model', service=service):
+            return set(cli_command_names(load_service_model(loader, model_name)))
     except Exception as e:
         print(f"  ⚠️  Could not get commands for {service}: {e}")
         return set()
 
 def load_our_data():
-    """Load our AWS commands data from TypeScript file"""
-    print("📂 Loading our data from lib/aws-commands.ts...")
-    
-    with open('lib/aws-commands.ts', 'r') as f:
-        content = f.read()
+    """Load our AWS commands data from the JSON data store"""
+    print(f"📂 Loading our data from {DATA_FILE}...")
     
-    # Extract the awsServices array
-    match = re.search(r'export const awsServices: Service\[\] = (\[[\s\S]*?\n\]);', content)
-    if not match:
-        print("❌ Could not parse aws-commands.ts")
-        return []
-    
-    # Parse the JavaScript array
-    data = eval(match.group(1))
+    data = load_services()
     
     print(f"   Loaded {len(data)} services")
     total_commands = sum(len(s['commands']) for s in data)
@@ -67,9 +61,33 @@ def load_our_data():
     
     return data
 
-def verify_commands():
+def diff_reports(previous: Dict, current: Dict) -> Dict:
+    """Per category and service, the commands that were added to or removed from the report"""
+    # Without a model in either run a service's invalid/missing lists have no
+    # meaningful delta; its duplicates are still checked
+    unverified = set(previous.get('unverified', [])) | set(current.get('unverified', []))
+    diff = {}
+    for category in CATEGORIES:
+        before, after = previous.get(category, {}), current.get(category, {})
+        excluded = unverified if category in MODEL_CATEGORIES else set()
+        changes = {}
+        for service in sorted((set(before) | set(after)) - excluded):
+            old, new = set(before.get(service, [])), set(after.get(service, []))
+            change = {}
+            if new - old:
+                change['added'] = sorted(new - old)
+            if old - new:
+                change['removed'] = sorted(old - new)
+            if change:
+                changes[service] = change
+        if changes:
+            diff[category] = changes
+    return diff
+
+def verify_commands(jobs: int = 1, diff: bool = False):
     """Main verification function"""
     print("🔍 AWS Command Verification\n")
+    started = time.perf_counter()
     
     # Load current data
     current_data = load_our_data()
@@ -82,15 +100,19 @@ def verify_commands():
     print(f"   Commands: {total_commands}\n")
     
     # Verification results
-    issues = {
-        'duplicates': defaultdict(list),
-        'invalid': defaultdict(list),
-        'missing': defaultdict(list)
-    }
+    # Only services with problems get an entry
+    issues = {category: {} for category in CATEGORIES}
+    unverified = []
     
     verified_services = 0
     
-    for service_data in current_data:
+    # Load every service model up front on the pool; results come back in data order
+    loader = get_loader()
+    available = set(list_services(loader))
+    with span('load models', jobs=jobs), ThreadPoolExecutor(max_workers=jobs) as pool:
+        actual_by_service = list(pool.map(lambda s: get_actual_commands(loader, available, s['name']), current_data))
+    
+    for service_data, actual_commands in zip(current_data, actual_by_service):
         service_name = service_data['name']
         our_commands = [cmd['name'] for cmd in service_data['commands']]
         
@@ -98,36 +120,37 @@ def verify_commands():
         
         # Check for duplicates in our data
         seen = set()
+        duplicates = []
         for cmd in our_commands:
             if cmd in seen:
-                issues['duplicates'][service_name].append(cmd)
+                duplicates.append(cmd)
             seen.add(cmd)
-        
-        # Get actual commands from AWS CLI
-        actual_commands = get_actual_commands(service_name)
+        if duplicates:
+            issues['duplicates'][service_name] = sorted(duplicates)
         
         if not actual_commands:
             print(f"   ⚠️  Could not verify (skipping)")
+            unverified.append(service_name)
             continue
         
         # Find invalid commands (in our data but not in AWS CLI)
         our_set = set(our_commands)
         invalid = our_set - actual_commands
         if invalid:
-            issues['invalid'][service_name] = list(invalid)
+            issues['invalid'][service_name] = sorted(invalid)
         
         # Find missing commands (in AWS CLI but not in our data)
         missing = actual_commands - our_set
-        if missing and len(missing) < 20:  # Only report if not too many
-            issues['missing'][service_name] = list(missing)
+        if missing:
+            issues['missing'][service_name] = sorted(missing)
         
         # Report
         status = "✓"
-        if issues['duplicates'][service_name]:
+        if service_name in issues['duplicates']:
             status = "⚠️  DUPLICATES"
-        elif issues['invalid'][service_name]:
+        elif service_name in issues['invalid']:
             status = "❌ INVALID"
-        elif issues['missing'][service_name]:
+        elif service_name in issues['missing']:
             status = "⚠️  MISSING"
         
         print(f"   {status} {len(our_commands)} commands (AWS has {len(actual_commands)})")
@@ -141,50 +164,67 @@ def verify_commands():
     print(f"✓ Verified {verified_services}/{len(current_data)} services\n")
     
     # Duplicates
-    if any(issues['duplicates'].values()):
+    if issues['duplicates']:
         print("⚠️  DUPLICATE COMMANDS FOUND:")
         for service, dups in issues['duplicates'].items():
-            if dups:
-                print(f"   {service}: {', '.join(dups)}")
+            print(f"   {service}: {', '.join(dups)}")
         print()
     else:
         print("✓ No duplicate commands found\n")
     
     # Invalid commands
-    if any(issues['invalid'].values()):
+    if issues['invalid']:
         print("❌ INVALID COMMANDS (not in AWS CLI):")
         for service, invalid in issues['invalid'].items():
-            if invalid:
-                print(f"   {service}: {', '.join(invalid[:5])}")
-                if len(invalid) > 5:
-                    print(f"      ... and {len(invalid)-5} more")
+            print(f"   {service}: {', '.join(invalid[:5])}")
+            if len(invalid) > 5:
+                print(f"      ... and {len(invalid)-5} more")
         print()
     else:
         print("✓ No invalid commands found\n")
     
     # Missing commands
-    if any(issues['missing'].values()):
+    if issues['missing']:
         print("ℹ️  MISSING COMMANDS (in AWS CLI but not in our data):")
         for service, missing in issues['missing'].items():
-            if missing:
-                print(f"   {service}: {len(missing)} commands")
+            print(f"   {service}: {len(missing)} commands")
         print()
     
-    # Save detailed report
-    report_file = 'reports/command-verification.json'
-    import os
+    # Save detailed report, keeping the previous one for diffing
+    report = {
+        'verified_services': verified_services,
+        'total_services': len(current_data),
+        'unverified': unverified,
+        **issues
+    }
     os.makedirs('reports', exist_ok=True)
     
-    with open(report_file, 'w') as f:
-        json.dump({
-            'verified_services': verified_services,
-            'total_services': len(current_data),
-            'duplicates': dict(issues['duplicates']),
-            'invalid': dict(issues['invalid']),
-            'missing': dict(issues['missing'])
-        }, f, indent=2)
-    
-    print(f"💾 Detailed report saved to: {report_file}")
+    previous = None
+    if os.path.exists(REPORT_FILE):
+        with open(REPORT_FILE, 'r') as f:
+            previous = json.load(f)
+        shutil.copy(REPORT_FILE, PREVIOUS_REPORT_FILE)
+    
+    with open(REPORT_FILE, 'w') as f:
+        json.dump(report, f, indent=2)
+    
+    print(f"💾 Detailed report saved to: {REPORT_FILE}")
+    
+    if diff:
+        if previous is None:
+            print(f"ℹ️  No previous report to diff against")
+        else:
+            changes = diff_reports(previous, report)
+            with open(DIFF_FILE, 'w') as f:
+                json.dump(changes, f, indent=2)
+            print(f"\n🔀 Changes since previous report:")
+            if not changes:
+                print("   (none)")
+            for category, services in changes.items():
+                added = sum(len(c.get('added', [])) for c in services.values())
+                removed = sum(len(c.get('removed', [])) for c in services.values())
+                print(f"   {category}: +{added} -{removed} across {len(services)} services")
+            print(f"💾 Diff saved to: {DIFF_FILE}")
     
     # Summary
     dup_count = sum(len(v) for v in issues['duplicates'].values())
@@ -193,7 +233,17 @@ def verify_commands():
     print(f"\n📊 Summary:")
     print(f"   Duplicate commands: {dup_count}")
     print(f"   Invalid commands: {inv_count}")
-    print(f"   Services with issues: {len([s for s in issues['duplicates'] if issues['duplicates'][s]]) + len([s for s in issues['invalid'] if issues['invalid'][s]])}")
+    print(f"   Services with issues: {len(issues['duplicates']) + len(issues['invalid'])}")
+    print(f"   Elapsed: {time.perf_counter() - started:.1f}s ({jobs} workers)")
+
+def parse_jobs(argv: List[str]) -> int:
+    """Read --jobs N / --jobs=N / -j N from the command line (default: CPU count)"""
+    for i, arg in enumerate(argv):
+        if arg in ('--jobs', '-j') and i + 1 < len(argv):
+            return max(1, int(argv[i + 1]))
+        if arg.startswith('--jobs='):
+            return max(1, int(arg.split('=', 1)[1]))
+    return os.cpu_count() or 4
 
 if __name__ == '__main__':
-    verify_commands()
+    verify_commands(jobs=parse_jobs(sys.argv[1:]), diff='--diff' in sys.argv)